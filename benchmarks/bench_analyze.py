@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Per-request cost of services.career_service.analyze_profile
+Compares building the profile through the old text round-trip (format the
+validated request, then parse_user_input) with UserProfile.from_request,
+both for profile construction alone and for the full guidance call.
+"""
+
+import os
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_guide_ai import CareerGuideAI, UserProfile
+from utils.validation import AnalyzeRequest
+
+REQUEST = AnalyzeRequest(
+    name="Jordan Lee",
+    education="Master's degree in Computer Science",
+    experience="Mid level",
+    skills=["Python", "SQL", "Docker", "Kubernetes", "machine learning", "React", "Tableau", "AWS"],
+    interests=["distributed systems", "data platforms"],
+    learning_style="hands-on",
+)
+
+
+def text_round_trip(career_ai, payload):
+    """The original analyze_profile path: format the request, then re-parse it."""
+    user_input = (
+        f"Name: {payload.name}\n"
+        f"Education: {payload.education}\n"
+        f"Experience: {payload.experience}\n"
+        f"Skills: {', '.join(payload.skills)}\n"
+        f"Interests: {', '.join(payload.interests)}\n"
+        f"Learning Style: {payload.learning_style}\n"
+    )
+    return career_ai.parse_user_input(user_input)
+
+
+def measure(func, min_seconds=0.5):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / runs
+
+
+def main():
+    career_ai = CareerGuideAI()
+
+    legacy_profile = text_round_trip(career_ai, REQUEST)
+    direct_profile = UserProfile.from_request(REQUEST)
+    print(f"text round-trip skills: {sorted(legacy_profile.skills)}")
+    print(f"from_request skills:    {direct_profile.skills}")
+
+    cases = [
+        ("profile only", lambda: text_round_trip(career_ai, REQUEST), lambda: UserProfile.from_request(REQUEST)),
+        ("profile + guidance",
+         lambda: career_ai.generate_guidance(text_round_trip(career_ai, REQUEST)),
+         lambda: career_ai.generate_guidance(UserProfile.from_request(REQUEST))),
+    ]
+    for label, legacy, direct in cases:
+        legacy_time = measure(legacy)
+        direct_time = measure(direct)
+        print(f"{label:<20} | text round-trip {legacy_time * 1e6:>8.1f} us | "
+              f"from_request {direct_time * 1e6:>8.1f} us | saved {(legacy_time - direct_time) * 1e6:>7.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
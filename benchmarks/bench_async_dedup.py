@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Async submission deduplication under a retry storm
+Posts bursts of equivalent payloads (each visitor double-clicks and retries)
+to /api/analyze/async while an in-process solo worker drains the queue, and
+counts the generate_guidance_task runs they cause, the responses answered
+from the cache and the ones coalesced onto a queued task. The broker and
+result backend are in memory and a cachelib SimpleCache stands in for Redis.
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from cachelib import SimpleCache
+from celery.contrib.testing.worker import start_worker
+from celery.signals import task_prerun
+
+from app import app
+from bench_task_chunks import build_cohort
+from services.career_service import guidance_cache
+from tasks import celery
+from utils.extensions import limiter
+
+PROFILES = 50
+SUBMISSIONS_PER_PROFILE = 8
+
+
+def submit(client, payloads):
+    statuses = {200: 0, "queued": 0, "coalesced": 0}
+    for payload in payloads:
+        response = client.post("/api/analyze/async", json=payload)
+        if response.status_code == 200:
+            statuses[200] += 1
+        else:
+            statuses["coalesced" if response.get_json()["coalesced"] else "queued"] += 1
+    return statuses
+
+
+def main():
+    logging.getLogger("celery").setLevel(logging.ERROR)
+    celery.conf.update(broker_url="memory://", result_backend="cache+memory://")
+    guidance_cache.backend = SimpleCache(threshold=100_000)
+    limiter.enabled = False
+
+    runs = []
+    task_prerun.connect(lambda sender=None, **kwargs: runs.append(sender.name), weak=False)
+    cohort = build_cohort(PROFILES, random.Random(11))
+    # Bursts arrive interleaved, as concurrent visitors' retries do.
+    submissions = [payload for payload in cohort for _ in range(SUBMISSIONS_PER_PROFILE)]
+    random.Random(11).shuffle(submissions)
+
+    with start_worker(celery, pool="solo", perform_ping_check=False, loglevel="ERROR"):
+        with app.test_client() as client:
+            start = time.perf_counter()
+            first = submit(client, submissions)
+            elapsed = time.perf_counter() - start
+            deadline = time.monotonic() + 60
+            while len(runs) < first["queued"] and time.monotonic() < deadline:
+                time.sleep(0.05)
+            second = submit(client, cohort)
+
+    print(f"{len(submissions)} submissions for {PROFILES} distinct profiles in {elapsed:.2f}s")
+    print(f"burst  | answered from cache {first[200]:>3} | coalesced {first['coalesced']:>3} | "
+          f"queued {first['queued']:>3} | task runs {len(runs)} (one per submission before: {len(submissions)})")
+    print(f"replay | answered from cache {second[200]:>3} | coalesced {second['coalesced']:>3} | "
+          f"queued {second['queued']:>3}")
+
+
+if __name__ == "__main__":
+    main()
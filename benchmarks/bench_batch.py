@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Throughput of the /api/analyze/batch pipeline
+Compares analyzing a cohort one profile at a time (analyze_profile) with the
+batch path (analyze_profiles: one score_batch pass per chunk), and measures
+the full endpoint including validation, encoding and NDJSON streaming.
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import routes.api as api_routes
+from app import app
+from services.career_service import analyze_profile, analyze_profiles, career_ai
+from utils.validation import AnalyzeRequest
+
+COHORT_SIZE = 2_000
+
+
+def build_cohort(size, rng):
+    pool = sorted({alias for variants in career_ai.skill_normalization.values() for alias in variants})
+    levels = ["student", "fresher", "junior", "mid", "senior"]
+    degrees = ["High School", "Bachelor's Degree", "Master's Degree", "PhD"]
+    return [
+        {
+            "name": f"Student {i}",
+            "education": rng.choice(degrees),
+            "experience": rng.choice(levels),
+            "skills": rng.sample(pool, rng.randint(1, 12)),
+            "interests": ["data"],
+        }
+        for i in range(size)
+    ]
+
+
+def main():
+    cohort = build_cohort(COHORT_SIZE, random.Random(11))
+    payloads = [AnalyzeRequest.model_validate(record) for record in cohort]
+
+    start = time.perf_counter()
+    for payload in payloads:
+        analyze_profile(payload)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, len(payloads), 256):
+        analyze_profiles(payloads[i:i + 256])
+    batch = time.perf_counter() - start
+
+    body = "\n".join(json.dumps(record) for record in cohort).encode()
+    api_routes.BATCH_MAX_RECORDS = COHORT_SIZE
+    with app.test_client() as client:
+        start = time.perf_counter()
+        response = client.post("/api/analyze/batch", data=body)
+        lines = response.get_data().count(b"\n")
+        endpoint = time.perf_counter() - start
+    assert lines == COHORT_SIZE
+
+    print(f"{COHORT_SIZE} profiles")
+    print(f"analyze_profile loop   {COHORT_SIZE / single:>8,.0f} profiles/sec")
+    print(f"analyze_profiles       {COHORT_SIZE / batch:>8,.0f} profiles/sec")
+    print(f"/api/analyze/batch     {COHORT_SIZE / endpoint:>8,.0f} profiles/sec (cache unavailable, NDJSON body)")
+
+
+if __name__ == "__main__":
+    main()
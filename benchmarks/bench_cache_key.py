@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Guidance cache hit ratio: raw-payload key vs semantic key
+Replays a synthetic request log through the old cache key (a hash of the raw
+request) and the semantic key (canonical skills plus experience and education
+level). Visitors share a handful of popular skill stacks but type them in
+their own order, casing and aliases, with their own names and interests, as
+form submissions do. Also reports the cost of computing each key and of
+personalizing a cached analysis for a hit.
+"""
+
+import os
+import random
+import sys
+import time
+from hashlib import sha256
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from services.career_service import (analyze_profile, build_cache_key, career_ai, encode_analysis,
+                                     personalize_analysis, request_profile)
+from utils.encoding import dumps
+from utils.validation import AnalyzeRequest
+
+REQUESTS = 20_000
+STACKS = 80
+VISITORS = 6_000
+
+
+def legacy_cache_key(payload):
+    """The original build_cache_key: a hash of the raw request."""
+    raw = dumps(payload.model_dump(), sort_keys=True)
+    return f"ai:guidance:v2:{sha256(raw).hexdigest()}"
+
+
+def build_log(rng):
+    """Requests from returning visitors (same payload) and new ones (own spelling of a popular stack)."""
+    canonical = sorted(career_ai.skill_normalization)
+    stacks = [rng.sample(canonical, rng.randint(2, 7)) for _ in range(STACKS)]
+    weights = [1 / (rank + 1) for rank in range(STACKS)]  # Zipf-like popularity
+    levels = ["Student", "fresher", "Junior", "junior level", "Mid", "mid-level", "Senior", "senior engineer"]
+    degrees = ["High School", "Bachelor's Degree", "bachelor", "B.Tech", "Master's Degree", "masters", "PhD", "phd"]
+    interests = ["AI", "web development", "data", "security", "cloud", "design"]
+
+    def visitor(number):
+        stack = rng.choices(stacks, weights)[0]
+        skills = [rng.choice(career_ai.skill_normalization[skill]) for skill in stack]
+        skills = [skill.upper() if rng.random() < 0.2 else skill.title() if rng.random() < 0.2 else skill
+                  for skill in skills]
+        rng.shuffle(skills)
+        return AnalyzeRequest(
+            name=f"Visitor {number}",
+            education=rng.choice(degrees),
+            experience=rng.choice(levels),
+            skills=skills,
+            interests=rng.sample(interests, rng.randint(0, 2)),
+        )
+
+    population = [visitor(number) for number in range(VISITORS)]
+    return [rng.choice(population) for _ in range(REQUESTS)]
+
+
+def hit_ratio(log, key_func):
+    seen = set()
+    hits = 0
+    for payload in log:
+        key = key_func(payload)
+        hits += key in seen
+        seen.add(key)
+    return hits / len(log), len(seen)
+
+
+def measure(func, min_seconds=0.5):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / runs
+
+
+def main():
+    log = build_log(random.Random(7))
+    print(f"Replaying {len(log):,} requests from {VISITORS:,} visitors over {STACKS} popular skill stacks")
+    for label, key_func in (("raw payload key", legacy_cache_key),
+                            ("semantic key", lambda payload: build_cache_key(request_profile(payload)))):
+        ratio, entries = hit_ratio(log, key_func)
+        print(f"{label:<16} | hit ratio {ratio:6.1%} | {entries:>6,} cache entries")
+
+    payload = log[0]
+    profile = request_profile(payload)
+    shared = encode_analysis(*analyze_profile(payload))
+    print(f"\nKey cost          | raw {measure(lambda: legacy_cache_key(payload)) * 1e6:.1f} us | "
+          f"semantic {measure(lambda: build_cache_key(request_profile(payload))) * 1e6:.1f} us")
+    print(f"Serving a hit     | personalize {measure(lambda: personalize_analysis(shared, profile)) * 1e6:.1f} us | "
+          f"full analysis {measure(lambda: analyze_profile(payload)) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for on-disk career catalogs
+Measures a cold load (JSON parse + compile + snapshot write), a load from
+the compiled snapshot, and a warm CareerGuideAI instantiation for catalogs of
+8 and 10k tracks. Best of five runs.
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import catalog as catalog_module
+from career_guide_ai import CareerGuideAI
+from catalog import DEFAULT_CATALOG_PATH, load_catalog
+
+
+def write_synthetic_catalog(directory, track_count, rng):
+    vocabulary = [f"skill {i}" for i in range(max(20, track_count // 2))]
+    with open(DEFAULT_CATALOG_PATH, encoding="utf-8") as f:
+        base = json.load(f)
+    base["career_tracks"] = {
+        f"Track {i:05d}": {
+            "core_skills": rng.sample(vocabulary, 5),
+            "emerging_skills": rng.sample(vocabulary, 5),
+            "market_demand": rng.randint(60, 99),
+            "future_demand": rng.randint(60, 99),
+            "growth_rate": rng.randint(5, 50),
+        }
+        for i in range(track_count)
+    }
+    base["skill_normalization"] = {skill: [skill, skill.replace(" ", "-")] for skill in vocabulary}
+    path = os.path.join(directory, "career_catalog.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(base, f)
+    return path
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def run(label, path, repeat=5):
+    snapshot_path = catalog_module._snapshot_path(path)
+    cold = snapshot = warm = float("inf")
+    for _ in range(repeat):
+        catalog_module._LOADED.clear()
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+        cold = min(cold, timed(lambda: CareerGuideAI(load_catalog(path)))[1])
+        catalog_module._LOADED.clear()
+        snapshot = min(snapshot, timed(lambda: CareerGuideAI(load_catalog(path)))[1])
+        warm = min(warm, timed(lambda: CareerGuideAI(load_catalog(path)))[1])
+    print(f"{label:>12} | cold {cold:>8.2f} ms | snapshot {snapshot:>7.2f} ms | warm instance {warm:>6.3f} ms")
+
+
+def main():
+    rng = random.Random(9)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["CAREER_CATALOG_CACHE_DIR"] = cache_dir
+        with tempfile.TemporaryDirectory() as directory:
+            run("8 tracks", write_synthetic_catalog(directory, 8, rng))
+        with tempfile.TemporaryDirectory() as directory:
+            run("10k tracks", write_synthetic_catalog(directory, 10_000, rng))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Benchmark for CareerGuideAI.generate_learning_path
+Generates learning paths for every career track across all experience and
+education levels and reports paths per second.
+"""
+
+import itertools
+import os
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_guide_ai import CareerGuideAI, UserProfile
+
+EXPERIENCE_LEVELS = ("student", "fresher", "junior", "mid", "senior", None)
+EDUCATION_LEVELS = ("High School", "Bachelor's Degree", "Master's Degree", "PhD", None)
+
+
+def main(seconds=2.0):
+    career_ai = CareerGuideAI()
+    profiles = [
+        UserProfile(experience_level=experience, education_level=education, skills=["python", "sql", "docker"])
+        for experience, education in itertools.product(EXPERIENCE_LEVELS, EDUCATION_LEVELS)
+    ]
+    work = list(itertools.product(career_ai.career_tracks, profiles))
+
+    paths = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for career_track, profile in work:
+            career_ai.generate_learning_path(career_track, profile)
+        paths += len(work)
+    elapsed = time.perf_counter() - start
+    print(f"generate_learning_path: {paths / elapsed:,.0f} paths/sec ({elapsed / paths * 1e6:.1f} us/path)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Engine memo: guidance throughput with and without CareerGuideAI's memo
+Replays the synthetic request log from bench_cache_key.py through
+generate_guidance, the call the web, Celery and bulk paths make, once with
+the memo disabled and once with the default size, and reports the memo's
+hit ratio.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from bench_cache_key import build_log
+from career_guide_ai import GUIDANCE_MEMO_SIZE, CareerGuideAI, UserProfile
+
+
+def main():
+    profiles = [UserProfile.from_request(payload) for payload in build_log(random.Random(7))]
+    print(f"Replaying {len(profiles):,} profiles through generate_guidance")
+    for label, memo_size in (("memo off", 0), (f"memo {GUIDANCE_MEMO_SIZE}", GUIDANCE_MEMO_SIZE)):
+        career_ai = CareerGuideAI(memo_size=memo_size)
+        start = time.perf_counter()
+        for profile in profiles:
+            career_ai.generate_guidance(profile)
+        elapsed = time.perf_counter() - start
+        stats = career_ai.memo_stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_ratio = stats["hits"] / lookups if lookups else 0.0
+        print(f"{label:<10} | {elapsed / len(profiles) * 1e6:7.1f} us/profile | "
+              f"{len(profiles) / elapsed:>8,.0f} profiles/sec | hit ratio {hit_ratio:6.1%} | {stats['size']:,} entries")
+
+
+if __name__ == "__main__":
+    main()
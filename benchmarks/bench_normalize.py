@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for CareerGuideAI.normalize_skills
+Compares the precomputed alias index against the original linear scan over
+skill_normalization for taxonomies of 10, 1k and 50k aliases.
+"""
+
+import os
+import random
+import sys
+import timeit
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_guide_ai import CareerGuideAI
+
+VARIANTS_PER_SKILL = 5
+SKILLS_PER_PROFILE = 12
+
+
+def legacy_normalize_skills(skill_normalization, skills):
+    """The pre-index implementation: scan every canonical skill for each input."""
+    normalized = []
+    for skill in skills:
+        skill_lower = skill.lower().strip()
+        found = False
+        for standard, variants in skill_normalization.items():
+            if skill_lower in variants or skill_lower == standard:
+                normalized.append(standard)
+                found = True
+                break
+        if not found:
+            normalized.append(skill_lower)
+    return list(set(normalized))
+
+
+def build_taxonomy(alias_count):
+    """Create a synthetic taxonomy holding alias_count aliases."""
+    taxonomy = {}
+    for i in range(max(1, alias_count // VARIANTS_PER_SKILL)):
+        taxonomy[f"skill{i}"] = [f"skill{i}-alias{j}" for j in range(VARIANTS_PER_SKILL)]
+    return taxonomy
+
+
+def run(alias_count, rng):
+    career_ai = CareerGuideAI()
+    career_ai.skill_normalization = build_taxonomy(alias_count)
+    career_ai.rebuild_skill_index()
+
+    aliases = [alias for variants in career_ai.skill_normalization.values() for alias in variants]
+    profile = [rng.choice(aliases).upper() for _ in range(SKILLS_PER_PROFILE - 2)] + ["Unknown Skill", "Rust"]
+
+    assert sorted(career_ai.normalize_skills(profile)) == sorted(
+        legacy_normalize_skills(career_ai.skill_normalization, profile)
+    )
+
+    number = 20 if alias_count >= 10_000 else 2_000
+    legacy = timeit.timeit(lambda: legacy_normalize_skills(career_ai.skill_normalization, profile), number=number)
+    indexed = timeit.timeit(lambda: career_ai.normalize_skills(profile), number=number)
+
+    legacy_us = legacy / number * 1e6
+    indexed_us = indexed / number * 1e6
+    print(f"{alias_count:>7} aliases | legacy {legacy_us:>10.1f} us | indexed {indexed_us:>7.1f} us | "
+          f"speedup {legacy_us / indexed_us:>8.1f}x")
+
+
+def main():
+    rng = random.Random(42)
+    print(f"normalize_skills, {SKILLS_PER_PROFILE} skills per profile")
+    for alias_count in (10, 1_000, 50_000):
+        run(alias_count, rng)
+
+
+if __name__ == "__main__":
+    main()
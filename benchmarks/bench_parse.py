@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for CareerGuideAI.parse_user_input
+Compares the single-pass extractor with the original keyword/regex scans on
+pasted resumes of 1-50 KB, using the shipped taxonomy and a 1k-alias one,
+and on unpunctuated text where every few words is a field label.
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_guide_ai import CareerGuideAI, ProfileExtractor
+
+HEADER = """Name: Jordan Lee
+Education: Master's degree in Computer Science
+Experience: Mid level engineer
+Skills: Python, SQL, Docker, Kubernetes, machine learning
+Interests: distributed systems, data platforms
+"""
+
+LABELLED = "i like python and have experience with sql, "
+
+FILLER = [
+    "Led a team that migrated reporting from Excel to Tableau and Power BI",
+    "Built CI/CD pipelines with Jenkins and GitHub Actions for node.js services",
+    "Designed PostgreSQL schemas and tuned MySQL queries for analytics workloads",
+    "Shipped React and Angular front ends backed by Java Spring services",
+    "Automated AWS and Azure infrastructure with Terraform and Ansible",
+    "Mentored interns and ran weekly knowledge sharing sessions",
+    "Improved model accuracy with feature engineering and artificial intelligence tooling",
+]
+
+
+def legacy_parse(skill_normalization, user_input):
+    """The original parser: one lowercase and substring scan per keyword/alias, six regex passes."""
+    result = {"name": None, "education": None, "experience": None}
+    name_match = re.search(r"name[:\s]+([^\n,]+)", user_input, re.IGNORECASE)
+    if name_match:
+        result["name"] = name_match.group(1).strip()
+    for keyword, level in {"high school": "High School", "bachelor": "Bachelor's Degree",
+                           "master": "Master's Degree", "phd": "PhD", "doctorate": "PhD"}.items():
+        if keyword in user_input.lower():
+            result["education"] = level
+            break
+    for keyword in ("student", "fresher", "junior", "mid", "senior"):
+        if keyword in user_input.lower():
+            result["experience"] = keyword
+            break
+    skills = []
+    for skill_list in skill_normalization.values():
+        for skill in skill_list:
+            if skill in user_input.lower():
+                skills.append(skill)
+    for pattern in (r"skills?[:\s]+([^.\n]+)", r"know[:\s]+([^.\n]+)", r"experience[:\s]+([^.\n]+)"):
+        for match in re.findall(pattern, user_input, re.IGNORECASE):
+            skills.extend(s.strip() for s in match.split(","))
+    interests = []
+    for pattern in (r"interest[:\s]+([^.\n]+)", r"like[:\s]+([^.\n]+)", r"passion[:\s]+([^.\n]+)"):
+        for match in re.findall(pattern, user_input, re.IGNORECASE):
+            interests.extend(s.strip() for s in match.split(","))
+    result["skills"] = list(set(skills))
+    result["interests"] = list(set(interests))
+    return result
+
+
+def build_resume(size_bytes, rng):
+    lines = [HEADER]
+    total = len(HEADER)
+    while total < size_bytes:
+        line = f"- {rng.choice(FILLER)}.\n"
+        lines.append(line)
+        total += len(line)
+    return "".join(lines)
+
+
+def measure(func, text, min_seconds=0.3):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        func(text)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / runs
+
+
+def run_taxonomy(label, skill_normalization, rng):
+    extractor = ProfileExtractor(skill_normalization)
+    alias_count = sum(len(v) for v in skill_normalization.values())
+    print(f"\n{label} ({alias_count} aliases)")
+    for size_kb in (1, 5, 20, 50):
+        text = build_resume(size_kb * 1024, rng)
+        legacy = measure(lambda t: legacy_parse(skill_normalization, t), text)
+        single = measure(extractor.extract, text)
+        print(f"{size_kb:>3} KB | legacy {legacy * 1e3:>8.2f} ms ({size_kb / 1024 / legacy:>6.1f} MB/s) | "
+              f"single-pass {single * 1e3:>7.2f} ms ({size_kb / 1024 / single:>6.1f} MB/s)")
+
+
+def run_labels(skill_normalization):
+    extractor = ProfileExtractor(skill_normalization)
+    print("\nLabel-heavy text, no sentence breaks")
+    for size_kb in (5, 20, 50):
+        text = LABELLED * (size_kb * 1024 // len(LABELLED))
+        legacy = measure(lambda t: legacy_parse(skill_normalization, t), text)
+        single = measure(extractor.extract, text)
+        print(f"{size_kb:>3} KB | legacy {legacy * 1e3:>8.2f} ms | single-pass {single * 1e3:>7.2f} ms")
+
+
+def main():
+    rng = random.Random(7)
+    career_ai = CareerGuideAI()
+    run_taxonomy("Shipped taxonomy", career_ai.skill_normalization, rng)
+    run_labels(career_ai.skill_normalization)
+
+    grown = dict(career_ai.skill_normalization)
+    for i in range(200):
+        grown[f"skill{i}"] = [f"skill{i} variant{j}" for j in range(5)]
+    run_taxonomy("Grown taxonomy", grown, rng)
+
+
+if __name__ == "__main__":
+    main()
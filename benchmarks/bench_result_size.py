@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Redis bytes per async analysis: full task results vs result references
+Runs a cohort of profiles through the async path and adds up what Redis holds
+for each one: the Celery result (as the Redis result backend encodes it) plus
+the cached analysis (as cachelib's RedisCache pickles it). The old layout
+returned the whole analysis from the task and cached it uncompressed; the new
+one returns an analysis_reference and compresses large cache values. Also
+reports what resolving a reference and decompressing cost per status poll.
+"""
+
+import os
+import pickle
+import random
+import sys
+import time
+import zlib
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from bench_task_chunks import build_cohort
+from services.career_service import (analysis_reference, analyze_profile, build_cache_key, encode_analysis,
+                                     guidance_cache, profile_summary, request_profile, resolve_analysis)
+from tasks import celery
+from utils.tiered_cache import CompressedValue
+from utils.validation import AnalyzeRequest
+
+PROFILES = 500
+
+
+def redis_cache_bytes(value):
+    """RedisCache stores b"!" + pickle for everything but ints."""
+    return 1 + len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+
+def result_backend_bytes(result):
+    meta = celery.backend._get_result_meta(result=result, state="SUCCESS", traceback=None, request=None)
+    return len(celery.backend.encode(meta))
+
+
+def measure(func, min_seconds=0.5):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / runs
+
+
+def main():
+    payloads = [AnalyzeRequest.model_validate(payload) for payload in build_cohort(PROFILES, random.Random(5))]
+    old_results = old_cache = new_results = new_cache = 0
+    for payload in payloads:
+        guidance_text, json_output, user_profile, timestamp = analyze_profile(payload)
+        profile = request_profile(payload)
+        shared = encode_analysis(guidance_text, json_output, user_profile, timestamp)
+        old_results += result_backend_bytes({"cached": False, "guidance_text": guidance_text,
+                                             "json_output": json_output, "user_profile": user_profile,
+                                             "timestamp": timestamp})
+        old_cache += redis_cache_bytes(shared)
+        new_results += result_backend_bytes(analysis_reference(build_cache_key(profile), shared, False))
+        new_cache += redis_cache_bytes(guidance_cache._pack(shared))
+
+    old_total, new_total = old_results + old_cache, new_results + new_cache
+    print(f"{PROFILES} analyses, bytes per analysis")
+    print(f"full results      | result {old_results / PROFILES:>7,.0f} | cache {old_cache / PROFILES:>7,.0f} | "
+          f"total {old_total / PROFILES:>7,.0f}")
+    print(f"references + zlib | result {new_results / PROFILES:>7,.0f} | cache {new_cache / PROFILES:>7,.0f} | "
+          f"total {new_total / PROFILES:>7,.0f} ({1 - new_total / old_total:.0%} less)")
+
+    payload = payloads[0]
+    profile = request_profile(payload)
+    shared = encode_analysis(*analyze_profile(payload))
+    reference = analysis_reference(build_cache_key(profile), shared, False)
+    user_profile = profile_summary(profile.profile)
+    guidance_cache.set(reference["cache_key"], shared)
+    packed = guidance_cache._pack(shared)
+    assert isinstance(packed, CompressedValue)
+    print(f"\nResolving a reference from L1 {measure(lambda: resolve_analysis(reference, user_profile)) * 1e6:.1f} us | "
+          f"decompressing an L2 value {measure(lambda: pickle.loads(zlib.decompress(packed.data))) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Memory and serialization cost of the guidance result types
+Compares the slotted result dataclasses and their per-class serializers with
+plain dataclasses of the same fields serialized by hand-written dict copies,
+as _generate_json_output used to do.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, fields
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_guide_ai import (CareerGuideAI, CareerRecommendation, LearningPath, LearningPhase, ResumeBooster,
+                             SkillGapAnalysis, UserProfile, serialize_learning_paths, serialize_recommendations,
+                             serialize_resume_boosters, serialize_skill_gaps)
+
+PROFILE = UserProfile(
+    name="Jordan Lee",
+    education_level="Master's Degree",
+    experience_level="mid",
+    skills=["Python", "SQL", "Docker", "Kubernetes", "machine learning", "React", "Tableau", "AWS"],
+)
+
+
+def unslotted(cls):
+    """A plain dataclass with the same fields, i.e. the result type before __slots__."""
+    return dataclass(type(f"Legacy{cls.__name__}", (), {"__annotations__": dict(cls.__annotations__)}))
+
+
+def legacy_serialize(recommendations, skill_gaps, learning_paths, resume_boosters):
+    """The hand-written copies _generate_json_output used to make."""
+    return {
+        "career_recommendations": [
+            {
+                "career_track": rec.career_track,
+                "match_score": rec.match_score,
+                "current_market_demand_score": rec.current_market_demand_score,
+                "future_demand_projection_score": rec.future_demand_projection_score,
+                "why_recommended": rec.why_recommended,
+                "top_recommended_skills": rec.top_recommended_skills,
+                "emerging_skills": rec.emerging_skills
+            }
+            for rec in recommendations
+        ],
+        "skill_gap_analysis": [
+            {
+                "career_track": gap.career_track,
+                "have_skills": gap.have_skills,
+                "need_skills": gap.need_skills,
+                "priority_gaps": gap.priority_gaps
+            }
+            for gap in skill_gaps
+        ],
+        "learning_path": [
+            {
+                "career_track": path.career_track,
+                "timeline_months": path.timeline_months,
+                "phases": [
+                    {
+                        "phase_name": phase.phase_name,
+                        "duration_weeks": phase.duration_weeks,
+                        "focus_skills": phase.focus_skills,
+                        "recommended_projects": phase.recommended_projects,
+                        "recommended_certifications": phase.recommended_certifications,
+                        "practice_resources": phase.practice_resources
+                    }
+                    for phase in path.phases
+                ]
+            }
+            for path in learning_paths
+        ],
+        "resume_boosters": [
+            {
+                "career_track": booster.career_track,
+                "project_ideas": booster.project_ideas,
+                "resume_bullets_sample": booster.resume_bullets_sample
+            }
+            for booster in resume_boosters
+        ],
+    }
+
+
+def class_serialize(recommendations, skill_gaps, learning_paths, resume_boosters):
+    return {
+        "career_recommendations": serialize_recommendations(recommendations),
+        "skill_gap_analysis": serialize_skill_gaps(skill_gaps),
+        "learning_path": serialize_learning_paths(learning_paths),
+        "resume_boosters": serialize_resume_boosters(resume_boosters),
+    }
+
+
+def bytes_per_instance(cls, source, count=20_000):
+    """Heap bytes per instance, counting the instance only (field values are shared)."""
+    values = [getattr(source, field.name) for field in fields(cls)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [cls(*values) for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del instances
+    return (size - count * 8) / count  # minus the list's pointer per instance
+
+
+def measure(func, min_seconds=0.5):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / runs
+
+
+def main():
+    career_ai = CareerGuideAI()
+    result = career_ai.analyze(PROFILE)
+    sections = (result.recommendations, result.skill_gaps, result.learning_paths, result.resume_boosters)
+    assert json.dumps(legacy_serialize(*sections), default=dict) == json.dumps(class_serialize(*sections))
+
+    print("Bytes per result instance")
+    samples = [(CareerRecommendation, result.recommendations[0]), (SkillGapAnalysis, result.skill_gaps[0]),
+               (LearningPhase, result.learning_paths[0].phases[0]), (LearningPath, result.learning_paths[0]),
+               (ResumeBooster, result.resume_boosters[0])]
+    for cls, source in samples:
+        legacy = bytes_per_instance(unslotted(cls), source)
+        slotted = bytes_per_instance(cls, source)
+        print(f"{cls.__name__:<22} | dataclass {legacy:>6.0f} B | slotted {slotted:>6.0f} B")
+
+    legacy = measure(lambda: legacy_serialize(*sections))
+    per_class = measure(lambda: class_serialize(*sections))
+    print(f"\nSerialize one guidance result | hand-written {legacy * 1e6:.2f} us | per-class {per_class * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark for CareerGuideAI.score_batch
+Scores a synthetic user base against every career track, once with the
+per-profile calculate_match_score loop, then with the batch scorer, its
+numpy-free bitset fallback, and score_matrix (one array, no per-profile dicts).
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import career_guide_ai
+from career_guide_ai import CareerGuideAI, UserProfile
+
+PROFILE_COUNTS = (10_000, 100_000)
+
+
+def build_profiles(career_ai, count, rng):
+    pool = [alias for variants in career_ai.skill_normalization.values() for alias in variants]
+    pool += [skill for data in career_ai.career_tracks.values() for skill in data["core_skills"]]
+    pool += [f"niche skill {i}" for i in range(50)]
+    return [UserProfile(skills=rng.sample(pool, rng.randint(1, 12))) for _ in range(count)]
+
+
+def score_loop(career_ai, profiles):
+    scores = []
+    for profile in profiles:
+        normalized = career_ai.normalize_skills(profile.skills)
+        scores.append({
+            career: career_ai.calculate_match_score(normalized, data["core_skills"])
+            for career, data in career_ai.career_tracks.items()
+        })
+    return scores
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(11)
+    career_ai = CareerGuideAI()
+    print(f"score_batch, {len(career_ai.career_tracks)} tracks, numpy={'yes' if career_guide_ai.np else 'no'}")
+
+    for count in PROFILE_COUNTS:
+        profiles = build_profiles(career_ai, count, rng)
+        expected, loop_time = timed(score_loop, career_ai, profiles)
+        batch, batch_time = timed(career_ai.score_batch, profiles)
+        assert batch == expected
+
+        numpy_module = career_guide_ai.np
+        career_guide_ai.np = None
+        bitset, bitset_time = timed(career_ai.score_batch, profiles)
+        career_guide_ai.np = numpy_module
+        assert bitset == expected
+
+        (matrix, track_names), matrix_time = timed(career_ai.score_matrix, profiles)
+        assert [dict(zip(track_names, row)) for row in matrix.tolist()] == expected
+
+        print(f"{count:>7} profiles | loop {loop_time:>6.2f} s ({count / loop_time:>8.0f}/s) | "
+              f"batch {batch_time:>6.2f} s ({count / batch_time:>8.0f}/s) | "
+              f"bitset {bitset_time:>6.2f} s ({count / bitset_time:>8.0f}/s) | "
+              f"matrix {matrix_time:>6.2f} s ({count / matrix_time:>8.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Throughput of CareerGuideAI.analyze by requested sections
+Shows how much of a full generate_guidance call each caller pays for when it
+only asks for the sections it uses.
+"""
+
+import os
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_guide_ai import CareerGuideAI, UserProfile
+
+PROFILE = UserProfile(
+    name="Jordan Lee",
+    education_level="Master's Degree",
+    experience_level="mid",
+    skills=["Python", "SQL", "Docker", "Kubernetes", "machine learning", "React", "Tableau", "AWS"],
+    interests=["distributed systems"],
+)
+
+CASES = [
+    ("scores", ("scores",)),
+    ("recommendations", ("recommendations",)),
+    ("json", ("json",)),
+    ("text", ("text",)),
+    ("text + json", ("text", "json")),
+]
+
+
+def measure(func, min_seconds=0.5):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return runs / elapsed
+
+
+def main():
+    career_ai = CareerGuideAI()
+    normalized = career_ai.normalize_profile(PROFILE)
+
+    full = measure(lambda: career_ai.generate_guidance(normalized))
+    print(f"{'generate_guidance':<18} {full:>10,.0f} profiles/sec")
+    for label, sections in CASES:
+        rate = measure(lambda: career_ai.analyze(normalized, sections))
+        print(f"{label:<18} {rate:>10,.0f} profiles/sec ({rate / full:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
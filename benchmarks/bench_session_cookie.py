@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Session cookie size and signing cost: analysis in the cookie vs result id
+Analyzes a cohort of profiles and, for each, compares the signed session
+cookie the results pages used to carry (guidance text, JSON output, profile
+and timestamp) with one carrying only a result id. Reports the cookie bytes
+every page view re-sends, the cost of verifying and re-signing it per
+request, and what reading the analysis from each result store backend costs
+instead.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from cachelib import FileSystemCache, SimpleCache
+
+from app import app
+from bench_task_chunks import build_cohort
+from services.career_service import analyze_profile, encode_analysis, personalize_analysis, request_profile
+from services.result_store import ResultStore
+from utils.validation import AnalyzeRequest
+
+PROFILES = 200
+COOKIE_LIMIT = 4096
+
+
+def measure(func, min_seconds=0.5):
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / runs
+
+
+def main():
+    serializer = app.session_interface.get_signing_serializer(app)
+    payloads = [AnalyzeRequest.model_validate(payload) for payload in build_cohort(PROFILES, random.Random(9))]
+    store = ResultStore(SimpleCache())
+
+    old_sessions, new_sessions, encoded_results = [], [], []
+    for payload in payloads:
+        guidance_text, json_output, user_profile, timestamp = analyze_profile(payload)
+        old_sessions.append({"guidance_text": guidance_text, "json_output": json_output,
+                             "user_profile": user_profile, "analysis_timestamp": timestamp})
+        encoded = personalize_analysis(encode_analysis(guidance_text, json_output, user_profile, timestamp),
+                                       request_profile(payload))
+        encoded_results.append(encoded)
+        new_sessions.append({"result_id": store.save(encoded)})
+
+    print(f"{PROFILES} analyses")
+    for label, sessions in (("analysis in cookie", old_sessions), ("result id", new_sessions)):
+        cookies = [serializer.dumps(session) for session in sessions]
+        sizes = [len(cookie) for cookie in cookies]
+        over = sum(size > COOKIE_LIMIT for size in sizes)
+        per_request = measure(lambda: serializer.dumps(serializer.loads(cookies[0])))
+        print(f"{label:<18} | cookie {sum(sizes) / len(sizes):>7,.0f} bytes avg, {max(sizes):>6,} max | "
+              f"{over:>3} over 4 KB | verify + re-sign {per_request * 1e6:7.1f} us/request")
+
+    encoded = encoded_results[0]
+    for label, backend in (("memory", SimpleCache()), ("file", FileSystemCache(tempfile.mkdtemp()))):
+        store = ResultStore(backend)
+        result_id = store.save(encoded)
+        print(f"store load ({label:<6}) {measure(lambda: store.load(result_id)) * 1e6:7.1f} us | "
+              f"save {measure(lambda: store.save(encoded), min_seconds=0.2) * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Celery throughput of the chunked guidance task
+Sends the same cohort of payloads through generate_guidance_batch_task at
+chunk sizes 1, 50 and 500, plus the one-payload generate_guidance_task, and
+reports payloads and messages per second. The broker, result backend and
+guidance cache run in memory (Celery's memory:// transport, its cache+memory
+backend and a cachelib SimpleCache in place of Redis) with an in-process solo
+worker, so the figures cover Celery's per-message overhead but not network
+round-trips, which only widen the gap.
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from cachelib import SimpleCache
+from celery.contrib.testing.worker import start_worker
+
+from services.career_service import career_ai, guidance_cache
+from tasks import celery, generate_guidance_batch_task, generate_guidance_task
+from utils.lru import LRUCache
+
+PAYLOADS = 1_000
+CHUNK_SIZES = (1, 50, 500)
+
+
+def build_cohort(size, rng):
+    pool = sorted({alias for variants in career_ai.skill_normalization.values() for alias in variants})
+    levels = ["student", "fresher", "junior", "mid", "senior"]
+    degrees = ["High School", "Bachelor's Degree", "Master's Degree", "PhD"]
+    return [
+        {
+            "name": f"Student {i}",
+            "education": rng.choice(degrees),
+            "experience": rng.choice(levels),
+            "skills": rng.sample(pool, rng.randint(1, 12)),
+        }
+        for i in range(size)
+    ]
+
+
+def reset_caches():
+    """Every run starts cold: empty cache, no in-process tier, empty engine memo."""
+    guidance_cache.backend = SimpleCache(threshold=100_000)
+    guidance_cache.local = LRUCache(maxsize=0)
+    career_ai._memo.clear()
+
+
+def run(send, payloads, chunk_size):
+    reset_caches()
+    start = time.perf_counter()
+    results = [send(payloads[i:i + chunk_size]) for i in range(0, len(payloads), chunk_size)]
+    for result in results:
+        result.get(timeout=120)
+    return time.perf_counter() - start, len(results)
+
+
+def main():
+    logging.getLogger("celery").setLevel(logging.ERROR)
+    celery.conf.update(broker_url="memory://", result_backend="cache+memory://")
+    payloads = build_cohort(PAYLOADS, random.Random(3))
+
+    with start_worker(celery, pool="solo", perform_ping_check=False, loglevel="ERROR"):
+        print(f"{PAYLOADS:,} payloads per run")
+        cases = [("generate_guidance_task", 1, lambda chunk: generate_guidance_task.delay(chunk[0]))]
+        cases += [("generate_guidance_batch_task", size, lambda chunk: generate_guidance_batch_task.delay(chunk))
+                  for size in CHUNK_SIZES]
+        for label, chunk_size, send in cases:
+            elapsed, messages = run(send, payloads, chunk_size)
+            print(f"{label:<29} chunk {chunk_size:>3} | {PAYLOADS / elapsed:>7,.0f} payloads/sec | "
+                  f"{messages / elapsed:>7,.0f} tasks/sec | {messages:>4} messages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark for CareerGuideAI.generate_career_recommendations
+Compares top-k selection (score every track, materialize only the winners)
+with the original build-everything-then-sort approach on catalogs of 8, 1k
+and 10k career tracks.
+"""
+
+import os
+import random
+import sys
+import timeit
+
+# Add parent directory to path to import CareerGuideAI
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from career_guide_ai import CareerGuideAI, CareerRecommendation, UserProfile
+
+
+def legacy_recommendations(career_ai, user_profile):
+    """The original implementation: a full recommendation per track, sorted, top 5 kept."""
+    recommendations = []
+    normalized_skills = career_ai.normalize_skills(user_profile.skills)
+    for career, data in career_ai.career_tracks.items():
+        match_score = career_ai.calculate_match_score(normalized_skills, data["core_skills"])
+        matching_skills = set(normalized_skills).intersection(set(data["core_skills"]))
+        why_recommended = f"Strong match with {len(matching_skills)} core skills. "
+        why_recommended += f"High {career_ai.get_demand_label(data['growth_rate'])} with {data['growth_rate']}% growth rate."
+        recommendations.append(CareerRecommendation(
+            career_track=career,
+            match_score=match_score,
+            current_market_demand_score=data["market_demand"],
+            future_demand_projection_score=data["future_demand"],
+            why_recommended=why_recommended,
+            top_recommended_skills=data["core_skills"][:5],
+            emerging_skills=data["emerging_skills"]
+        ))
+    recommendations.sort(key=lambda x: x.match_score, reverse=True)
+    return recommendations[:5]
+
+
+def build_catalog(track_count, rng):
+    vocabulary = [f"skill {i}" for i in range(max(40, track_count // 4))]
+    catalog = {}
+    for i in range(track_count):
+        catalog[f"Track {i:05d}"] = {
+            "core_skills": rng.sample(vocabulary, 5),
+            "emerging_skills": rng.sample(vocabulary, 5),
+            "market_demand": rng.randint(60, 99),
+            "future_demand": rng.randint(60, 99),
+            "growth_rate": rng.randint(5, 50),
+        }
+    return catalog, vocabulary
+
+
+def main():
+    rng = random.Random(5)
+    print("generate_career_recommendations, k=5")
+    for track_count in (8, 1_000, 10_000):
+        career_ai = CareerGuideAI()
+        if track_count != len(career_ai.career_tracks):
+            career_ai.career_tracks, vocabulary = build_catalog(track_count, rng)
+            career_ai.rebuild_skill_index()
+        else:
+            vocabulary = list(career_ai.skill_ids)
+        profile = UserProfile(skills=rng.sample(vocabulary, 8))
+
+        number = max(3, 20_000 // track_count)
+        legacy = timeit.timeit(lambda: legacy_recommendations(career_ai, profile), number=number) / number
+        top_k = timeit.timeit(lambda: career_ai.generate_career_recommendations(profile), number=number) / number
+        print(f"{track_count:>6} tracks | legacy {legacy * 1e3:>8.3f} ms | top-k {top_k * 1e3:>7.3f} ms | "
+              f"speedup {legacy / top_k:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,31 @@ CareerGuideAI - Advanced AI Career Counselor and Future Skill Forecaster
 A comprehensive system for career guidance, skill analysis, and future trend prediction.
 """
 
+import argparse
+import heapq
 import json
+import multiprocessing
+import os
+import queue
 import re
-from typing import Dict, List, Optional, Tuple, Any
+import sys
+import time
+from types import MappingProxyType
+from typing import IO, Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property
 import random
 
+from catalog import CareerCatalog, load_catalog
+from utils.lru import LRUCache
+from utils.validation import AnalyzeRequest, ValidationError
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; score_batch falls back to integer bitsets
+    np = None
+
 @dataclass
 class UserProfile:
     name: Optional[str] = None
@@ -26,151 +44,717 @@ class UserProfile:
         if self.interests is None:
             self.interests = []
 
+    @classmethod
+    def from_request(cls, request: Any) -> "UserProfile":
+        """Build a profile straight from structured fields, without a free-text round-trip.
+
+        request can be an AnalyzeRequest (or any object with name, education,
+        experience, skills, interests and learning_style attributes) or a dict
+        with those keys. Education and experience are mapped to their standard
+        levels when a keyword is recognized and kept verbatim otherwise; skills
+        and interests are kept as given, minus blanks and duplicates.
+        """
+        if isinstance(request, Mapping):
+            get = request.get
+        else:
+            def get(field):
+                return getattr(request, field, None)
+
+        return cls(
+            name=(get("name") or "").strip() or None,
+            education_level=match_level(get("education"), EDUCATION_KEYWORDS),
+            experience_level=match_level(get("experience"), EXPERIENCE_KEYWORDS),
+            skills=_unique_items(get("skills")),
+            interests=_unique_items(get("interests")),
+            learning_style=(get("learning_style") or "").strip() or None,
+        )
+
+def _unique_items(items: Optional[Iterable[str]]) -> List[str]:
+    """Stripped, non-empty items in first-seen order, dropping case-insensitive repeats.
+
+    A comma-separated string is split first, like AnalyzeRequest does.
+    """
+    if isinstance(items, str):
+        items = items.split(",")
+    seen = set()
+    unique = []
+    for item in items or ():
+        item = str(item).strip()
+        key = item.lower()
+        if item and key not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
+
+# Result types declare __slots__ by hand: dataclass(slots=True) needs Python 3.10. The engine fills
+# their sequence fields with tuples (and resources with read-only mappings), since results are shared
+# through the guidance memo and the catalog.
 @dataclass
 class CareerRecommendation:
+    __slots__ = (
+        "career_track", "match_score", "current_market_demand_score", "future_demand_projection_score",
+        "why_recommended", "top_recommended_skills", "emerging_skills"
+    )
     career_track: str
     match_score: int
     current_market_demand_score: int
     future_demand_projection_score: int
     why_recommended: str
-    top_recommended_skills: List[str]
-    emerging_skills: List[str]
+    top_recommended_skills: Tuple[str, ...]
+    emerging_skills: Tuple[str, ...]
 
 @dataclass
 class SkillGapAnalysis:
+    __slots__ = ("career_track", "have_skills", "need_skills", "priority_gaps")
     career_track: str
-    have_skills: List[str]
-    need_skills: List[str]
-    priority_gaps: List[str]
+    have_skills: Tuple[str, ...]
+    need_skills: Tuple[str, ...]
+    priority_gaps: Tuple[str, ...]
 
 @dataclass
 class LearningPhase:
+    __slots__ = (
+        "phase_name", "duration_weeks", "focus_skills", "recommended_projects", "recommended_certifications",
+        "practice_resources"
+    )
     phase_name: str
     duration_weeks: int
-    focus_skills: List[str]
-    recommended_projects: List[str]
-    recommended_certifications: List[str]
-    practice_resources: List[Dict[str, str]]
+    focus_skills: Tuple[str, ...]
+    recommended_projects: Tuple[str, ...]
+    recommended_certifications: Tuple[str, ...]
+    practice_resources: Tuple[Mapping[str, str], ...]
 
 @dataclass
 class LearningPath:
+    __slots__ = ("career_track", "timeline_months", "phases")
     career_track: str
     timeline_months: int
-    phases: List[LearningPhase]
+    phases: Tuple[LearningPhase, ...]
 
 @dataclass
 class ResumeBooster:
+    __slots__ = ("career_track", "project_ideas", "resume_bullets_sample")
     career_track: str
-    project_ideas: List[str]
-    resume_bullets_sample: List[str]
+    project_ideas: Tuple[str, ...]
+    resume_bullets_sample: Tuple[str, ...]
 
-class CareerGuideAI:
-    def __init__(self):
-        self.career_tracks = {
-            "Data Scientist": {
-                "core_skills": ["python", "statistics", "machine learning", "sql", "data analysis"],
-                "emerging_skills": ["genai", "mlops", "llm", "vector databases", "ai ethics"],
-                "market_demand": 95,
-                "future_demand": 98,
-                "growth_rate": 35
-            },
-            "Software Engineer": {
-                "core_skills": ["programming", "algorithms", "data structures", "version control", "testing"],
-                "emerging_skills": ["cloud native", "microservices", "devops", "kubernetes", "serverless"],
-                "market_demand": 90,
-                "future_demand": 92,
-                "growth_rate": 25
-            },
-            "DevOps Engineer": {
-                "core_skills": ["linux", "docker", "kubernetes", "ci/cd", "cloud platforms"],
-                "emerging_skills": ["gitops", "observability", "platform engineering", "security", "aiops"],
-                "market_demand": 88,
-                "future_demand": 95,
-                "growth_rate": 40
-            },
-            "Product Manager": {
-                "core_skills": ["product strategy", "user research", "data analysis", "stakeholder management", "agile"],
-                "emerging_skills": ["ai product management", "data-driven decisions", "customer success", "growth hacking"],
-                "market_demand": 85,
-                "future_demand": 88,
-                "growth_rate": 20
-            },
-            "Cybersecurity Analyst": {
-                "core_skills": ["network security", "threat analysis", "incident response", "compliance", "penetration testing"],
-                "emerging_skills": ["zero trust", "cloud security", "ai security", "threat intelligence", "devsecops"],
-                "market_demand": 92,
-                "future_demand": 96,
-                "growth_rate": 45
-            },
-            "UX/UI Designer": {
-                "core_skills": ["user research", "wireframing", "prototyping", "design systems", "user testing"],
-                "emerging_skills": ["ai-powered design", "voice ui", "ar/vr design", "accessibility", "design ops"],
-                "market_demand": 82,
-                "future_demand": 85,
-                "growth_rate": 18
-            },
-            "Cloud Architect": {
-                "core_skills": ["cloud platforms", "architecture design", "infrastructure", "networking", "security"],
-                "emerging_skills": ["multi-cloud", "edge computing", "serverless", "cloud native", "finops"],
-                "market_demand": 90,
-                "future_demand": 94,
-                "growth_rate": 32
-            },
-            "AI/ML Engineer": {
-                "core_skills": ["machine learning", "deep learning", "python", "tensorflow", "pytorch"],
-                "emerging_skills": ["genai", "llm", "mlops", "ai ethics", "federated learning"],
-                "market_demand": 96,
-                "future_demand": 99,
-                "growth_rate": 50
-            }
+# JSON-ready dicts for the result types, fields in declaration order. Sequences
+# become lists and resource mappings become dicts, so the caller owns the
+# output; the strings and numbers in it are shared.
+
+def serialize_recommendations(recs: Iterable[CareerRecommendation]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "career_track": rec.career_track,
+            "match_score": rec.match_score,
+            "current_market_demand_score": rec.current_market_demand_score,
+            "future_demand_projection_score": rec.future_demand_projection_score,
+            "why_recommended": rec.why_recommended,
+            "top_recommended_skills": [*rec.top_recommended_skills],
+            "emerging_skills": [*rec.emerging_skills],
         }
-        
-        self.skill_normalization = {
-            "python": ["python", "py", "programming"],
-            "javascript": ["javascript", "js", "node.js", "react", "vue", "angular"],
-            "java": ["java", "spring", "android"],
-            "sql": ["sql", "database", "mysql", "postgresql"],
-            "machine learning": ["ml", "machine learning", "ai", "artificial intelligence"],
-            "data analysis": ["data analysis", "analytics", "excel", "tableau", "power bi"],
-            "cloud": ["aws", "azure", "gcp", "cloud", "docker", "kubernetes"],
-            "devops": ["devops", "ci/cd", "jenkins", "gitlab", "github actions"],
-            "security": ["cybersecurity", "security", "penetration testing", "ethical hacking"],
-            "design": ["ui", "ux", "design", "figma", "sketch", "adobe"]
+        for rec in recs
+    ]
+
+def serialize_skill_gaps(gaps: Iterable[SkillGapAnalysis]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "career_track": gap.career_track,
+            "have_skills": [*gap.have_skills],
+            "need_skills": [*gap.need_skills],
+            "priority_gaps": [*gap.priority_gaps],
         }
-        
-        self.learning_resources = {
-            "courses": [
-                {"title": "Coursera Specializations", "provider": "Coursera", "url_placeholder": "coursera.org"},
-                {"title": "Udemy Best Sellers", "provider": "Udemy", "url_placeholder": "udemy.com"},
-                {"title": "edX MicroMasters", "provider": "edX", "url_placeholder": "edx.org"},
-                {"title": "DataCamp Tracks", "provider": "DataCamp", "url_placeholder": "datacamp.com"}
-            ],
-            "books": [
-                {"title": "Industry Standard Books", "provider": "Various Publishers", "url_placeholder": "amazon.com"},
-                {"title": "O'Reilly Learning", "provider": "O'Reilly", "url_placeholder": "oreilly.com"}
-            ],
-            "practice": [
-                {"title": "LeetCode Problems", "provider": "LeetCode", "url_placeholder": "leetcode.com"},
-                {"title": "HackerRank Challenges", "provider": "HackerRank", "url_placeholder": "hackerrank.com"},
-                {"title": "Kaggle Competitions", "provider": "Kaggle", "url_placeholder": "kaggle.com"},
-                {"title": "GitHub Projects", "provider": "GitHub", "url_placeholder": "github.com"}
-            ]
+        for gap in gaps
+    ]
+
+def serialize_learning_phases(phases: Iterable[LearningPhase]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "phase_name": phase.phase_name,
+            "duration_weeks": phase.duration_weeks,
+            "focus_skills": [*phase.focus_skills],
+            "recommended_projects": [*phase.recommended_projects],
+            "recommended_certifications": [*phase.recommended_certifications],
+            # .copy() works on dicts and mappingproxies alike, and is far cheaper than dict() on a proxy
+            "practice_resources": [resource.copy() for resource in phase.practice_resources],
+        }
+        for phase in phases
+    ]
+
+def serialize_learning_paths(paths: Iterable[LearningPath]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "career_track": path.career_track,
+            "timeline_months": path.timeline_months,
+            "phases": serialize_learning_phases(path.phases),
+        }
+        for path in paths
+    ]
+
+def serialize_resume_boosters(boosters: Iterable[ResumeBooster]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "career_track": booster.career_track,
+            "project_ideas": [*booster.project_ideas],
+            "resume_bullets_sample": [*booster.resume_bullets_sample],
         }
+        for booster in boosters
+    ]
+
+_SERIALIZERS: Dict[type, Callable[[Iterable[Any]], List[Dict[str, Any]]]] = {
+    CareerRecommendation: serialize_recommendations,
+    SkillGapAnalysis: serialize_skill_gaps,
+    LearningPhase: serialize_learning_phases,
+    LearningPath: serialize_learning_paths,
+    ResumeBooster: serialize_resume_boosters,
+}
+
+def _serialize_one(serialize_many: Callable[[Iterable[Any]], List[Dict[str, Any]]]) -> Callable[[Any], Dict[str, Any]]:
+    def serialize(result: Any) -> Dict[str, Any]:
+        return serialize_many((result,))[0]
+    return serialize
+
+_SINGLE_SERIALIZERS = {cls: _serialize_one(serialize_many) for cls, serialize_many in _SERIALIZERS.items()}
+
+def serializer_for(cls: type, many: bool = False) -> Callable[[Any], Any]:
+    """The function turning a result dataclass into its JSON-ready dict.
+
+    With many=True the function takes an iterable of results and returns a list of dicts.
+    """
+    try:
+        return (_SERIALIZERS if many else _SINGLE_SERIALIZERS)[cls]
+    except KeyError:
+        raise TypeError(f"No JSON serializer for {cls.__name__}") from None
+
+@dataclass(frozen=True)
+class NormalizedProfile:
+    """A UserProfile whose skills have been normalized once for every pipeline stage.
+
+    Build it with CareerGuideAI.normalize_profile; skill_ids are only valid for
+    the skill vocabulary of the engine that built it.
+    """
+    profile: UserProfile
+    skills: List[str]
+    skill_set: FrozenSet[str]
+    skill_ids: FrozenSet[int]
+    vocabulary: Mapping[str, int]
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.profile.name
+
+    @property
+    def education_level(self) -> Optional[str]:
+        return self.profile.education_level
+
+    @property
+    def experience_level(self) -> Optional[str]:
+        return self.profile.experience_level
+
+    @property
+    def interests(self) -> List[str]:
+        return self.profile.interests
+
+ProfileLike = Union[UserProfile, NormalizedProfile]
+
+class _SkillIdLookup(dict):
+    """Raw skill string -> skill id for one batch, normalizing each distinct string once.
+
+    Skills outside the engine's vocabulary get ids from len(vocabulary) upward,
+    one per distinct normalized skill, so they still count towards the bonus.
+    """
+
+    def __init__(self, engine: "CareerGuideAI"):
+        super().__init__()
+        self._index = engine.skill_index
+        self._ids = dict(engine.skill_ids)
+
+    def __missing__(self, skill: str) -> int:
+        key = skill.lower().strip()
+        skill_id = self._ids.setdefault(self._index.get(key, key), len(self._ids))
+        self[skill] = skill_id
+        return skill_id
+
+    @property
+    def id_count(self) -> int:
+        """Ids handed out so far: the vocabulary plus every unknown skill seen."""
+        return len(self._ids)
+
+LEARNING_PHASES = ("foundation", "advanced", "specialization")
+
+BASE_TIMELINE_MONTHS = 12
+
+EXPERIENCE_MULTIPLIER = MappingProxyType({
+    "student": 1.5,
+    "fresher": 1.2,
+    "junior": 1.0,
+    "mid": 0.8,
+    "senior": 0.6
+})
+
+EDUCATION_MULTIPLIER = MappingProxyType({
+    "High School": 1.3,
+    "Bachelor's Degree": 1.0,
+    "Master's Degree": 0.8,
+    "PhD": 0.7
+})
+
+EXPERIENCE_PROJECTS = MappingProxyType({
+    "student": ("Create a portfolio website showcasing your projects",
+                "Participate in hackathons and coding competitions"),
+    "fresher": ("Build projects that demonstrate your technical skills",
+                "Contribute to open-source projects in your field"),
+    "junior": ("Build production-ready applications with best practices",
+               "Create tools that improve team productivity"),
+    "mid": ("Build production-ready applications with best practices",
+            "Create tools that improve team productivity"),
+    "senior": ("Architect and lead development of complex systems",
+               "Mentor junior developers and create learning resources")
+})
+
+EDUCATION_PROJECTS = MappingProxyType({
+    "PhD": ("Publish research papers or technical blog posts",),
+    "Master's Degree": ("Work on advanced research or thesis projects",)
+})
+
+EXPERIENCE_CERTIFICATIONS = MappingProxyType({
+    "student": ("Student-focused certifications and courses",),
+    "junior": ("Industry-recognized professional certifications",),
+    "mid": ("Industry-recognized professional certifications",),
+    "senior": ("Advanced and leadership certifications",)
+})
+
+EXPERIENCE_RESOURCES = MappingProxyType({
+    "student": ({"title": "Free Student Resources", "provider": "Various", "url_placeholder": "github.com/student-resources"},),
+    "senior": ({"title": "Advanced Technical Papers", "provider": "arXiv", "url_placeholder": "arxiv.org"},)
+})
+
+PhaseContent = Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[Mapping[str, str], ...]]
+
+@dataclass(frozen=True)
+class PersonalizationTables:
+    """Learning-path content precomputed per (track, phase, experience, education).
+
+    Experience and education levels outside the multiplier tables personalize
+    nothing, so they share the None entries. Tracks without their own projects
+    or certifications share the entries stored under track None.
+    """
+    timelines: Mapping[Tuple[Optional[str], Optional[str]], int]
+    phase_content: Mapping[Tuple[Optional[str], str, Optional[str], Optional[str]], PhaseContent]
+    learning_resources: Mapping[str, List[Dict[str, str]]]
+
+    @classmethod
+    def from_catalog(cls, catalog: CareerCatalog) -> "PersonalizationTables":
+        resources = catalog.resources
+        learning_resources = resources["learning_resources"]
+        projects = resources.get("projects", {})
+        certifications = resources.get("certifications", {})
+
+        experience_levels = (*EXPERIENCE_MULTIPLIER, None)
+        education_levels = (*EDUCATION_MULTIPLIER, None)
+
+        timelines = {
+            (experience, education): int(BASE_TIMELINE_MONTHS * EXPERIENCE_MULTIPLIER.get(experience, 1.0)
+                                         * EDUCATION_MULTIPLIER.get(education, 1.0))
+            for experience in experience_levels
+            for education in education_levels
+        }
+
+        phase_content = {}
+        for track in (*sorted(set(projects) | set(certifications)), None):
+            for phase in LEARNING_PHASES:
+                for experience in experience_levels:
+                    for education in education_levels:
+                        phase_content[(track, phase, experience, education)] = cls._build_content(
+                            learning_resources, projects.get(track, {}).get(phase, []),
+                            certifications.get(track, {}).get(phase, []), phase, experience, education)
+
+        return cls(MappingProxyType(timelines), MappingProxyType(phase_content), learning_resources)
+
+    @staticmethod
+    def _build_content(learning_resources: Mapping[str, List[Dict[str, str]]], base_projects: List[str],
+                       base_certifications: List[str], phase: str, experience: Optional[str],
+                       education: Optional[str]) -> PhaseContent:
+        projects = [*base_projects, *EXPERIENCE_PROJECTS.get(experience, ()), *EDUCATION_PROJECTS.get(education, ())]
+        certifications = [*base_certifications, *EXPERIENCE_CERTIFICATIONS.get(experience, ())]
+
+        if phase == "foundation":
+            resources = learning_resources["courses"][:2] + learning_resources["practice"][:1]
+        elif phase == "advanced":
+            resources = learning_resources["courses"][2:] + learning_resources["books"]
+        else:  # specialization
+            resources = learning_resources["practice"][2:] + learning_resources["courses"][:1]
+        resources += EXPERIENCE_RESOURCES.get(experience, ())
+
+        # Limit to 4 projects and 3 certifications
+        return tuple(projects[:4]), tuple(certifications[:3]), tuple(MappingProxyType(dict(r)) for r in resources)
+
+    def timeline(self, experience_level: Optional[str], education_level: Optional[str]) -> int:
+        """Timeline in months for an experience/education combination."""
+        experience = experience_level if experience_level in EXPERIENCE_MULTIPLIER else None
+        education = education_level if education_level in EDUCATION_MULTIPLIER else None
+        return self.timelines[(experience, education)]
+
+    def lookup(self, career_track: str, phase: str, experience_level: Optional[str],
+               education_level: Optional[str]) -> PhaseContent:
+        """Projects, certifications and resources for one learning phase."""
+        experience = experience_level if experience_level in EXPERIENCE_MULTIPLIER else None
+        education = education_level if education_level in EDUCATION_MULTIPLIER else None
+        content = self.phase_content.get((career_track, phase, experience, education))
+        if content is None:
+            content = self.phase_content.get((None, phase, experience, education))
+        if content is None:
+            # Phases outside LEARNING_PHASES get the specialization resources and no base items.
+            content = self._build_content(self.learning_resources, [], [], phase, experience, education)
+        return content
+
+def build_skill_index(skill_normalization: Dict[str, List[str]],
+                      catalog_skills: Iterable[str] = ()) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """Build the alias -> canonical skill index used by normalize_skills.
+
+    Aliases resolve to the first canonical skill that lists them, which is the
+    order the original linear scan used. An alias claimed by several canonical
+    skills, or one that shadows a skill named in the career catalog (e.g.
+    "programming" resolving to "python"), is reported in the collision map as
+    alias -> [resolved canonical, *other candidates].
+    """
+    index: Dict[str, str] = {}
+    collisions: Dict[str, List[str]] = {}
+
+    for standard, variants in skill_normalization.items():
+        for alias in [standard, *variants]:
+            alias = alias.lower().strip()
+            resolved = index.setdefault(alias, standard)
+            if resolved != standard:
+                candidates = collisions.setdefault(alias, [resolved])
+                if standard not in candidates:
+                    candidates.append(standard)
+
+    for skill in catalog_skills:
+        skill = skill.lower().strip()
+        resolved = index.get(skill, skill)
+        if resolved != skill:
+            candidates = collisions.setdefault(skill, [resolved])
+            if skill not in candidates:
+                candidates.append(skill)
+
+    return index, collisions
+
+DEFAULT_TOP_K = 5
+
+# Upper bound on dense matrix cells per score_batch chunk.
+SCORE_BATCH_CELLS = 4_000_000
+
+# Bump when compile_catalog's output changes shape, so stale snapshots are rebuilt.
+COMPILED_CATALOG_FORMAT = 1
+
+EDUCATION_KEYWORDS = {
+    "high school": "High School",
+    "bachelor": "Bachelor's Degree",
+    "bachelors": "Bachelor's Degree",
+    "master": "Master's Degree",
+    "masters": "Master's Degree",
+    "phd": "PhD",
+    "doctorate": "PhD"
+}
+
+EXPERIENCE_KEYWORDS = {
+    "student": "student",
+    "fresher": "fresher",
+    "junior": "junior",
+    "mid": "mid",
+    "senior": "senior"
+}
+
+def match_level(text: Optional[str], keywords: Dict[str, str]) -> Optional[str]:
+    """Map a structured education/experience value to its standard level.
+
+    Keywords match whole words, with the same table priority as
+    parse_user_input; unrecognized text is returned stripped but unchanged.
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+    words = f" {' '.join(ProfileExtractor._WORD.findall(text.lower()))} "
+    for keyword, level in keywords.items():
+        if f" {keyword} " in words:
+            return level
+    return text
+
+class ProfileExtractor:
+    """Single-pass extractor for free-text profiles.
+
+    The input is lowercased once and walked with one precompiled word scanner;
+    a word naming a field ("Name:", "Skills:", ...) opens that field's value.
+    Catalog aliases and education/experience keywords live in a trie keyed by
+    word tokens, so every match lands on word boundaries ("py" no longer
+    matches inside "happy"). A labelled value runs to the next ".", newline or
+    label, so no stretch of text is searched for its end twice and parsing
+    stays linear in the input size.
+    """
+
+    _WORD = re.compile(r"[^\W_]+[+#]*")
+    _LABEL_GAP = re.compile(r"[:\s]+")
+    _VALUE_END = re.compile(r"[.\n]")
+    _NAME_END = re.compile(r"[\n,]")
+
+    LABEL_FIELDS = {
+        "name": "name",
+        "skill": "skills",
+        "skills": "skills",
+        "know": "skills",
+        "experience": "skills",
+        "interest": "interests",
+        "interests": "interests",
+        "like": "interests",
+        "passion": "interests"
+    }
+
+    def __init__(self, skill_normalization: Dict[str, List[str]]):
+        self.trie: Dict[str, Any] = {}
+        for keyword, level in EDUCATION_KEYWORDS.items():
+            self._add_term(keyword, ("education", level))
+        for keyword, level in EXPERIENCE_KEYWORDS.items():
+            self._add_term(keyword, ("experience", level))
+        for variants in skill_normalization.values():
+            for alias in variants:
+                self._add_term(alias.lower(), ("skill", alias.lower()))
+
+    @classmethod
+    def from_trie(cls, trie: Dict[str, Any]) -> "ProfileExtractor":
+        """Reuse a trie built earlier, e.g. one loaded from a compiled catalog snapshot."""
+        extractor = cls.__new__(cls)
+        extractor.trie = trie
+        return extractor
+
+    def _add_term(self, term: str, payload: Tuple[str, str]) -> None:
+        """Insert a term as a path of word tokens; later tokens are keyed by separator + word."""
+        node = self.trie
+        end = None
+        for match in self._WORD.finditer(term):
+            if end is None:
+                key = match.group()
+            else:
+                separator = term[end:match.start()]
+                key = (" " if separator.isspace() else separator) + match.group()
+            node = node.setdefault(key, {})
+            end = match.end()
+        if end is not None:
+            node.setdefault(None, []).append(payload)
+
+    def extract(self, user_input: str) -> UserProfile:
+        """Extract name, education, experience, skills and interests in one pass."""
+        lowered = user_input.lower()
+        # Field values keep their original casing unless lowercasing changed offsets.
+        source = user_input if len(lowered) == len(user_input) else lowered
+
+        profile = UserProfile()
+        # Alias matches, plus one list per labelled value, filled in when the value ends.
+        skills: List[Any] = []
+        interests: List[Any] = []
+        education_found = set()
+        experience_found = set()
+
+        root = self.trie
+        states: List[Dict[str, Any]] = []
+        last_end = 0
+        name_seen = False
+        # The labelled value being read: where it starts and the list it fills.
+        value_start = 0
+        value_items: Optional[List[str]] = None
+
+        label_fields = self.LABEL_FIELDS
+        label_gap = self._LABEL_GAP.match
+
+        for match in self._WORD.finditer(lowered):
+            word = match.group()
+            field = label_fields.get(word)
+            gap = label_gap(lowered, match.end()) if field else None
+            if gap:
+                states = []
+                start = gap.end()
+                if value_items is not None:
+                    self._read_value(lowered, source, value_start, match.start(), value_items)
+                    value_items = None
+                if field == "name":
+                    if not name_seen:
+                        name_seen = True
+                        end = self._NAME_END.search(lowered, start)
+                        value = source[start:end.start() if end else len(source)].strip()
+                        profile.name = value or None
+                    continue
+                value_start, value_items = start, []
+                (skills if field == "skills" else interests).append(value_items)
+                continue
+
+            if states:
+                separator = lowered[last_end:match.start()]
+                key = (" " if separator.isspace() else separator) + word
+                next_states = [child for child in (node.get(key) for node in states) if child is not None]
+                child = root.get(word)
+                if child is not None:
+                    next_states.append(child)
+            else:
+                # Fast path: most words neither continue nor start a term.
+                child = root.get(word)
+                if child is None:
+                    continue
+                next_states = [child]
+
+            for node in next_states:
+                for kind, value in node.get(None, ()):
+                    if kind == "skill":
+                        skills.append(value)
+                    elif kind == "education":
+                        education_found.add(value)
+                    else:
+                        experience_found.add(value)
+
+            states = next_states
+            last_end = match.end()
+
+        if value_items is not None:
+            self._read_value(lowered, source, value_start, len(lowered), value_items)
+
+        # Keyword priority follows table order, as in the original scan.
+        for level in EDUCATION_KEYWORDS.values():
+            if level in education_found:
+                profile.education_level = level
+                break
+        for level in EXPERIENCE_KEYWORDS.values():
+            if level in experience_found:
+                profile.experience_level = level
+                break
+
+        # First-seen order, so the same text gives the same profile in every process.
+        profile.skills = list(dict.fromkeys(self._flatten(skills)))
+        profile.interests = list(dict.fromkeys(self._flatten(interests)))
+        return profile
+
+    def _read_value(self, lowered: str, source: str, start: int, limit: int, items: List[str]) -> None:
+        """Split a labelled value, ending at the first "." or newline before limit, into items."""
+        end = self._VALUE_END.search(lowered, start, limit)
+        value = source[start:end.start() if end else limit]
+        items.extend(item for item in (part.strip() for part in value.split(",")) if item)
+
+    @staticmethod
+    def _flatten(entries: List[Any]) -> Iterator[str]:
+        for entry in entries:
+            if isinstance(entry, list):
+                yield from entry
+            else:
+                yield entry
+
+def compile_catalog(career_tracks: Dict[str, Dict[str, Any]],
+                    skill_normalization: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Derive the lookup tables CareerGuideAI needs from raw catalog data.
+
+    Only plain data is returned so the result can be snapshotted with the catalog.
+    """
+    catalog_skills = [
+        skill
+        for data in career_tracks.values()
+        for skill in data["core_skills"] + data["emerging_skills"]
+    ]
+    skill_index, alias_collisions = build_skill_index(skill_normalization, catalog_skills)
+
+    # Column ids for every core skill, shared by the batch scorer's matrices.
+    skill_ids: Dict[str, int] = {}
+    for data in career_tracks.values():
+        for skill in data["core_skills"]:
+            skill_ids.setdefault(skill, len(skill_ids))
+    track_skill_ids = [frozenset(skill_ids[skill] for skill in data["core_skills"]) for data in career_tracks.values()]
+
+    return {
+        "skill_index": skill_index,
+        "alias_collisions": alias_collisions,
+        "extractor_trie": ProfileExtractor(skill_normalization).trie,
+        "skill_ids": skill_ids,
+        "track_skill_ids": track_skill_ids,
+    }
+
+# Closing block of every guidance report; it does not depend on the profile.
+_STATIC_FOOTER = """
+## 🔮 Emerging Trends to Watch
+- **GenAI & LLMs:** Transformative impact across all tech roles
+- **MLOps & AI Engineering:** Growing demand for AI infrastructure
+- **Cloud Native & Kubernetes:** Standard for modern applications
+- **Cybersecurity:** Increasing importance with digital transformation
+- **DevOps & Platform Engineering:** Streamlining development workflows
+
+## 💡 Actionable Next Steps
+1. **Start with the Foundation Phase** of your chosen career path
+2. **Build a portfolio** with the recommended projects
+3. **Earn relevant certifications** to validate your skills
+4. **Network with professionals** in your target field
+5. **Stay updated** with emerging technologies and trends
+
+## 📈 Market Insights
+- Tech roles are experiencing 20-50% growth rates
+- Remote work is expanding opportunities globally
+- Continuous learning is essential for career advancement
+- Specialized skills command premium salaries
+
+---
+*Generated by CareerGuideAI - Your AI Career Counselor*
+"""
+
+# Profiles whose guidance is kept per engine, by memo_key; 0 turns the memo off.
+GUIDANCE_MEMO_SIZE = int(os.environ.get("GUIDANCE_MEMO_SIZE", "2048"))
+
+class CareerGuideAI:
+    def __init__(self, catalog: Optional[CareerCatalog] = None, memo_size: int = GUIDANCE_MEMO_SIZE):
+        self.catalog = catalog or load_catalog()
+        self.career_tracks = self.catalog.career_tracks
+        self.skill_normalization = self.catalog.skill_normalization
+        self._memo = LRUCache(maxsize=memo_size)
+        self._apply_compiled(self.catalog.compiled(compile_catalog, COMPILED_CATALOG_FORMAT))
+
+    @property
+    def learning_resources(self) -> Dict[str, List[Dict[str, str]]]:
+        """Learning resources from the catalog, loaded on first use."""
+        return self.catalog.learning_resources
+
+    def rebuild_skill_index(self) -> None:
+        """Recompute the alias index after skill_normalization or career_tracks are replaced."""
+        self._apply_compiled(compile_catalog(self.career_tracks, self.skill_normalization))
+
+    def _apply_compiled(self, compiled: Dict[str, Any]) -> None:
+        self.skill_index = compiled["skill_index"]
+        self.alias_collisions = compiled["alias_collisions"]
+        self.extractor = ProfileExtractor.from_trie(compiled["extractor_trie"])
+        self.skill_ids = compiled["skill_ids"]
+        self._track_skill_ids = compiled["track_skill_ids"]
+        self._track_masks = None
+        self._track_matrix = None
+        # The match bonus min(10, user_count - track_size) is constant beyond this many skills.
+        self._skill_count_cap = max((len(ids) for ids in self._track_skill_ids), default=0) + 10
+        self._memo.clear()
 
     def normalize_skills(self, skills: List[str]) -> List[str]:
-        """Normalize and standardize skill names."""
+        """Normalize and standardize skill names, dropping duplicates but keeping first-seen order."""
+        index = self.skill_index
         normalized = []
         for skill in skills:
             skill_lower = skill.lower().strip()
-            found = False
-            for standard, variants in self.skill_normalization.items():
-                if skill_lower in variants or skill_lower == standard:
-                    normalized.append(standard)
-                    found = True
-                    break
-            if not found:
-                normalized.append(skill_lower)
-        return list(set(normalized))
+            normalized.append(index.get(skill_lower, skill_lower))
+        return list(dict.fromkeys(normalized))
+
+    def normalize_profile(self, user_profile: ProfileLike) -> NormalizedProfile:
+        """Normalize a profile's skills once; profiles already normalized by this engine pass through."""
+        if isinstance(user_profile, NormalizedProfile):
+            if user_profile.vocabulary is self.skill_ids:
+                return user_profile
+            user_profile = user_profile.profile
+        skills = self.normalize_skills(user_profile.skills)
+        skill_ids = self.skill_ids
+        return NormalizedProfile(
+            profile=user_profile,
+            skills=skills,
+            skill_set=frozenset(skills),
+            skill_ids=frozenset(skill_ids[skill] for skill in skills if skill in skill_ids),
+            vocabulary=skill_ids,
+        )
 
     def calculate_match_score(self, user_skills: List[str], career_skills: List[str]) -> int:
         """Calculate match score between user skills and career requirements."""
@@ -191,6 +775,103 @@ class CareerGuideAI:
         
         return min(100, int(match_percentage + bonus))
 
+    def score_batch(self, profiles: Iterable[ProfileLike], chunk_size: int = 50_000) -> List[Dict[str, int]]:
+        """Score many profiles against every career track at once.
+
+        Profiles and track core skills are encoded as 0/1 skill matrices, so
+        all intersections come from one matrix product per chunk. Scores are
+        identical to calculate_match_score, including the bonus term.
+        """
+        track_names = list(self.career_tracks)
+        if np is not None:
+            return [dict(zip(track_names, row))
+                    for chunk in self._score_arrays(profiles, chunk_size) for row in chunk.tolist()]
+
+        if self._track_masks is None:
+            self._track_masks = [sum(1 << skill_id for skill_id in ids) for ids in self._track_skill_ids]
+        tracks = [(name, mask, len(ids)) for name, mask, ids in
+                  zip(track_names, self._track_masks, self._track_skill_ids)]
+        vocabulary_size = len(self.skill_ids)
+        lookup = _SkillIdLookup(self)
+        scores = []
+        for profile in profiles:
+            if isinstance(profile, NormalizedProfile):
+                profile = profile.profile
+            ids = set(map(lookup.__getitem__, profile.skills))
+            count = len(ids)
+            mask = 0
+            for skill_id in ids:
+                if skill_id < vocabulary_size:
+                    mask |= 1 << skill_id
+            scores.append({
+                name: min(100, int(bin(mask & track_mask).count("1") / size * 100 + min(10, count - size)))
+                if size else 0
+                for name, track_mask, size in tracks
+            })
+        return scores
+
+    def score_matrix(self, profiles: Iterable[ProfileLike], chunk_size: int = 50_000) -> Tuple["np.ndarray", List[str]]:
+        """score_batch as one int16 array of shape (profiles, tracks), plus the track name of each column.
+
+        Skips building a dict per profile, for bulk re-scoring. Needs numpy.
+        """
+        if np is None:
+            raise ImportError("score_matrix needs numpy")
+        track_names = list(self.career_tracks)
+        chunks = list(self._score_arrays(profiles, chunk_size))
+        if not chunks:
+            return np.zeros((0, len(track_names)), dtype=np.int16), track_names
+        return np.concatenate(chunks), track_names
+
+    def _score_arrays(self, profiles: Iterable[ProfileLike], chunk_size: int) -> Iterator["np.ndarray"]:
+        """Yield int16 score arrays of shape (chunk, tracks) for consecutive chunks of profiles."""
+        # Keep each chunk's dense matrices to a few million cells on wide catalogs.
+        chunk_size = max(1, min(chunk_size, SCORE_BATCH_CELLS // max(1, len(self.skill_ids), len(self.career_tracks))))
+        lookup = _SkillIdLookup(self)
+        chunk: List[List[str]] = []
+        for profile in profiles:
+            if isinstance(profile, NormalizedProfile):
+                profile = profile.profile
+            chunk.append(profile.skills)
+            if len(chunk) >= chunk_size:
+                yield self._score_chunk(chunk, lookup)
+                chunk = []
+        if chunk:
+            yield self._score_chunk(chunk, lookup)
+
+    def _score_chunk(self, skill_lists: List[List[str]], lookup: "_SkillIdLookup") -> "np.ndarray":
+        """Scores for one chunk of raw skill lists, normalized through the shared lookup."""
+        vocabulary_size = len(self.skill_ids)
+        # float32 keeps the product on BLAS; counts stay exact far below 2**24.
+        if self._track_matrix is None:
+            matrix = np.zeros((vocabulary_size, len(self.career_tracks)), dtype=np.float32)
+            for column, ids in enumerate(self._track_skill_ids):
+                matrix[list(ids), column] = 1
+            self._track_matrix = matrix
+
+        count = len(skill_lists)
+        lengths = np.fromiter(map(len, skill_lists), dtype=np.intp, count=count)
+        rows = np.repeat(np.arange(count), lengths)
+        ids = np.fromiter(map(lookup.__getitem__, (skill for skills in skill_lists for skill in skills)),
+                          dtype=np.int64, count=len(rows))
+
+        # Distinct normalized skills per profile, including ones outside the vocabulary.
+        id_count = lookup.id_count
+        user_counts = np.bincount(np.unique(rows * id_count + ids) // id_count, minlength=count)
+        known = ids < vocabulary_size
+        profile_matrix = np.zeros((count, vocabulary_size), dtype=np.float32)
+        profile_matrix[rows[known], ids[known]] = 1
+
+        sizes = np.array([len(ids) for ids in self._track_skill_ids], dtype=np.float64)
+        matches = (profile_matrix @ self._track_matrix).astype(np.int64)
+        # Same float64 operations as calculate_match_score, then int() truncation.
+        bonus = np.minimum(10, user_counts[:, None] - sizes.astype(np.int64))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            percent = matches / sizes * 100
+            scores = np.minimum(100, np.trunc(percent + bonus))
+        scores[:, sizes == 0] = 0
+        return scores.astype(np.int16)
+
     def get_demand_label(self, growth_rate: float) -> str:
         """Get demand label based on growth rate."""
         if growth_rate > 30:
@@ -200,41 +881,80 @@ class CareerGuideAI:
         else:
             return "Stable"
 
-    def generate_career_recommendations(self, user_profile: UserProfile) -> List[CareerRecommendation]:
-        """Generate career recommendations based on user profile."""
-        recommendations = []
-        normalized_skills = self.normalize_skills(user_profile.skills)
-        
-        for career, data in self.career_tracks.items():
-            match_score = self.calculate_match_score(normalized_skills, data["core_skills"])
-            
-            # Generate why recommended text
-            matching_skills = set(normalized_skills).intersection(set(data["core_skills"]))
-            why_recommended = f"Strong match with {len(matching_skills)} core skills. "
-            why_recommended += f"High {self.get_demand_label(data['growth_rate'])} with {data['growth_rate']}% growth rate."
-            
-            recommendation = CareerRecommendation(
-                career_track=career,
-                match_score=match_score,
-                current_market_demand_score=data["market_demand"],
-                future_demand_projection_score=data["future_demand"],
-                why_recommended=why_recommended,
-                top_recommended_skills=data["core_skills"][:5],
-                emerging_skills=data["emerging_skills"]
-            )
-            recommendations.append(recommendation)
-        
-        # Sort by match score and return top 5
-        recommendations.sort(key=lambda x: x.match_score, reverse=True)
-        return recommendations[:5]
+    def generate_career_recommendations(self, user_profile: ProfileLike,
+                                        k: int = DEFAULT_TOP_K) -> List[CareerRecommendation]:
+        """Generate the top-k career recommendations for a user profile."""
+        normalized = self.normalize_profile(user_profile)
+        scores = self.score_tracks(normalized)
+        return [
+            self._build_recommendation(career, score, normalized.skill_set)
+            for career, score in self.select_top_tracks(scores, k)
+        ]
+
+    def score_tracks(self, normalized_skills: Union[NormalizedProfile, List[str]]) -> Dict[str, int]:
+        """Match score for every career track; same result as calculate_match_score per track."""
+        if isinstance(normalized_skills, NormalizedProfile):
+            normalized = self.normalize_profile(normalized_skills)
+            user_count = len(normalized.skill_set)
+            user_ids = normalized.skill_ids
+        else:
+            skill_ids = self.skill_ids
+            user_skills_set = set(normalized_skills)
+            user_count = len(user_skills_set)
+            user_ids = {skill_ids[skill] for skill in user_skills_set if skill in skill_ids}
+        scores = {}
+        for career, career_ids in zip(self.career_tracks, self._track_skill_ids):
+            career_count = len(career_ids)
+            if not career_count:
+                scores[career] = 0
+                continue
+            matching = len(user_ids & career_ids)
+            scores[career] = min(100, int(matching / career_count * 100 + min(10, user_count - career_count)))
+        return scores
+
+    def select_top_tracks(self, scores: Dict[str, int], k: int = DEFAULT_TOP_K) -> List[Tuple[str, int]]:
+        """Pick the k best (career, score) pairs without sorting the whole catalog.
+
+        Ties on match score are broken by future demand, then current market
+        demand (both higher first), then career name, so the ranking does not
+        depend on catalog order.
+        """
+        tracks = self.career_tracks
+
+        def rank(item: Tuple[str, int]) -> Tuple[int, int, int, str]:
+            career, score = item
+            data = tracks[career]
+            return (-score, -data["future_demand"], -data["market_demand"], career)
+
+        return heapq.nsmallest(k, scores.items(), key=rank)
+
+    def _build_recommendation(self, career: str, match_score: int,
+                              skill_set: FrozenSet[str]) -> CareerRecommendation:
+        """Materialize a CareerRecommendation for one selected track."""
+        data = self.career_tracks[career]
 
-    def analyze_skill_gaps(self, user_profile: UserProfile, career_track: str) -> SkillGapAnalysis:
+        # Generate why recommended text
+        matching_skills = skill_set.intersection(data["core_skills"])
+        why_recommended = f"Strong match with {len(matching_skills)} core skills. "
+        why_recommended += f"High {self.get_demand_label(data['growth_rate'])} with {data['growth_rate']}% growth rate."
+
+        return CareerRecommendation(
+            career_track=career,
+            match_score=match_score,
+            current_market_demand_score=data["market_demand"],
+            future_demand_projection_score=data["future_demand"],
+            why_recommended=why_recommended,
+            top_recommended_skills=tuple(data["core_skills"][:5]),
+            emerging_skills=tuple(data["emerging_skills"])
+        )
+
+    def analyze_skill_gaps(self, user_profile: ProfileLike, career_track: str) -> SkillGapAnalysis:
         """Analyze skill gaps for a specific career track."""
-        normalized_skills = self.normalize_skills(user_profile.skills)
+        skill_set = self.normalize_profile(user_profile).skill_set
         career_data = self.career_tracks[career_track]
         
-        have_skills = list(set(normalized_skills).intersection(set(career_data["core_skills"])))
-        need_skills = [skill for skill in career_data["core_skills"] if skill not in normalized_skills]
+        have_skills = tuple([skill for skill in career_data["core_skills"] if skill in skill_set])
+        need_skills = tuple([skill for skill in career_data["core_skills"] if skill not in skill_set])
         
         # Prioritize gaps based on importance and market demand
         priority_gaps = need_skills[:3]  # Top 3 priority skills to learn
@@ -246,249 +966,87 @@ class CareerGuideAI:
             priority_gaps=priority_gaps
         )
 
-    def generate_learning_path(self, career_track: str, user_profile: UserProfile) -> LearningPath:
+    def generate_learning_path(self, career_track: str, user_profile: ProfileLike) -> LearningPath:
         """Generate a personalized learning path for a career track."""
         career_data = self.career_tracks[career_track]
-        normalized_skills = self.normalize_skills(user_profile.skills)
-        
-        # Determine experience level and adjust timeline
-        experience_multiplier = {
-            "student": 1.5,
-            "fresher": 1.2,
-            "junior": 1.0,
-            "mid": 0.8,
-            "senior": 0.6
-        }
-        
-        # Adjust timeline based on education level
-        education_multiplier = {
-            "High School": 1.3,
-            "Bachelor's Degree": 1.0,
-            "Master's Degree": 0.8,
-            "PhD": 0.7
-        }
-        
-        base_timeline = 12  # 12 months base timeline
-        exp_multiplier = experience_multiplier.get(user_profile.experience_level, 1.0)
-        edu_multiplier = education_multiplier.get(user_profile.education_level, 1.0)
-        timeline_months = int(base_timeline * exp_multiplier * edu_multiplier)
-        
-        # Generate personalized learning phases
+        normalized_skills = self.normalize_profile(user_profile).skill_set
+        tables = self.personalization
+        experience_level = user_profile.experience_level
+        education_level = user_profile.education_level
+
+        timeline_months = tables.timeline(experience_level, education_level)
+
+        # Phase 1: Foundation, shorter when fewer of the first core skills are missing (4-8 weeks)
+        foundation_skills = tuple([skill for skill in career_data["core_skills"][:3] if skill not in normalized_skills])
+        foundation_duration = max(4, min(8, len(foundation_skills) * 2))
+
+        # Phase 2: Advanced (6-12 weeks based on skill complexity)
+        advanced_skills = (*career_data["core_skills"][3:], *career_data["emerging_skills"][:2])
+        advanced_duration = max(6, min(12, len(advanced_skills) * 1.5))
+
+        # Phase 3: Specialization (4-10 weeks)
+        specialization_skills = tuple(career_data["emerging_skills"])
+        specialization_duration = max(4, min(10, len(specialization_skills) * 1.2))
+
         phases = []
-        
-        # Phase 1: Foundation (personalized duration)
-        foundation_skills = [skill for skill in career_data["core_skills"][:3] if skill not in normalized_skills]
-        foundation_duration = max(4, min(8, len(foundation_skills) * 2))  # 4-8 weeks based on skill gaps
-        
-        # Personalized foundation projects based on background
-        foundation_projects = self._get_personalized_projects(career_track, "foundation", user_profile)
-        
-        phases.append(LearningPhase(
-            phase_name="Foundation",
-            duration_weeks=foundation_duration,
-            focus_skills=foundation_skills,
-            recommended_projects=foundation_projects,
-            recommended_certifications=self._get_personalized_certifications(career_track, "foundation", user_profile),
-            practice_resources=self._get_personalized_resources(career_track, "foundation", user_profile)
-        ))
-        
-        # Phase 2: Advanced (personalized duration)
-        advanced_skills = career_data["core_skills"][3:] + career_data["emerging_skills"][:2]
-        advanced_duration = max(6, min(12, len(advanced_skills) * 1.5))  # 6-12 weeks based on skill complexity
-        
-        advanced_projects = self._get_personalized_projects(career_track, "advanced", user_profile)
-        
-        phases.append(LearningPhase(
-            phase_name="Advanced",
-            duration_weeks=advanced_duration,
-            focus_skills=advanced_skills,
-            recommended_projects=advanced_projects,
-            recommended_certifications=self._get_personalized_certifications(career_track, "advanced", user_profile),
-            practice_resources=self._get_personalized_resources(career_track, "advanced", user_profile)
-        ))
-        
-        # Phase 3: Specialization (personalized duration)
-        specialization_skills = career_data["emerging_skills"]
-        specialization_duration = max(4, min(10, len(specialization_skills) * 1.2))  # 4-10 weeks
-        
-        specialization_projects = self._get_personalized_projects(career_track, "specialization", user_profile)
-        
-        phases.append(LearningPhase(
-            phase_name="Specialization",
-            duration_weeks=specialization_duration,
-            focus_skills=specialization_skills,
-            recommended_projects=specialization_projects,
-            recommended_certifications=self._get_personalized_certifications(career_track, "specialization", user_profile),
-            practice_resources=self._get_personalized_resources(career_track, "specialization", user_profile)
-        ))
-        
+        for phase_name, phase, duration, focus_skills in (
+            ("Foundation", "foundation", foundation_duration, foundation_skills),
+            ("Advanced", "advanced", advanced_duration, advanced_skills),
+            ("Specialization", "specialization", specialization_duration, specialization_skills),
+        ):
+            projects, certifications, resources = tables.lookup(career_track, phase, experience_level, education_level)
+            phases.append(LearningPhase(
+                phase_name=phase_name,
+                duration_weeks=duration,
+                focus_skills=focus_skills,
+                recommended_projects=projects,
+                recommended_certifications=certifications,
+                practice_resources=resources
+            ))
+
         return LearningPath(
             career_track=career_track,
             timeline_months=timeline_months,
-            phases=phases
+            phases=tuple(phases)
         )
-    
-    def _get_personalized_projects(self, career_track: str, phase: str, user_profile: UserProfile) -> List[str]:
+
+    @property
+    def personalization(self) -> "PersonalizationTables":
+        """Precompiled learning-path tables, built once per catalog on first use."""
+        return self.catalog.derived("personalization", PersonalizationTables.from_catalog)
+
+    def _get_personalized_projects(self, career_track: str, phase: str, user_profile: ProfileLike) -> List[str]:
         """Generate personalized project ideas based on user background."""
-        projects = []
-        
-        # Base projects by career track and phase
-        base_projects = {
-            "Data Scientist": {
-                "foundation": [
-                    "Build a data analysis dashboard using Python and Pandas",
-                    "Create a simple machine learning model for prediction",
-                    "Analyze a real-world dataset and create visualizations"
-                ],
-                "advanced": [
-                    "Develop a recommendation system using collaborative filtering",
-                    "Build a natural language processing pipeline",
-                    "Create a time series forecasting model"
-                ],
-                "specialization": [
-                    "Build a GenAI-powered chatbot using LLMs",
-                    "Develop an MLOps pipeline for model deployment",
-                    "Create a vector database for semantic search"
-                ]
-            },
-            "Software Engineer": {
-                "foundation": [
-                    "Build a RESTful API using Python/Node.js",
-                    "Create a simple web application with frontend and backend",
-                    "Develop a command-line tool for automation"
-                ],
-                "advanced": [
-                    "Build a microservices architecture",
-                    "Create a real-time chat application",
-                    "Develop a mobile app with React Native"
-                ],
-                "specialization": [
-                    "Build a cloud-native application with Kubernetes",
-                    "Develop a serverless application using AWS Lambda",
-                    "Create a CI/CD pipeline with GitHub Actions"
-                ]
-            },
-            "AI/ML Engineer": {
-                "foundation": [
-                    "Implement basic ML algorithms from scratch",
-                    "Build a neural network using TensorFlow/PyTorch",
-                    "Create a computer vision application"
-                ],
-                "advanced": [
-                    "Develop a deep learning model for image classification",
-                    "Build a recommendation system using neural networks",
-                    "Create a natural language processing model"
-                ],
-                "specialization": [
-                    "Fine-tune a large language model for specific tasks",
-                    "Build a multimodal AI system",
-                    "Develop an AI ethics framework for your models"
-                ]
-            }
-        }
-        
-        # Get base projects for the career track and phase
-        if career_track in base_projects and phase in base_projects[career_track]:
-            projects.extend(base_projects[career_track][phase])
-        
-        # Add personalized projects based on user background
-        if user_profile.experience_level == "student":
-            projects.append("Create a portfolio website showcasing your projects")
-            projects.append("Participate in hackathons and coding competitions")
-        elif user_profile.experience_level == "fresher":
-            projects.append("Build projects that demonstrate your technical skills")
-            projects.append("Contribute to open-source projects in your field")
-        elif user_profile.experience_level in ["junior", "mid"]:
-            projects.append("Build production-ready applications with best practices")
-            projects.append("Create tools that improve team productivity")
-        elif user_profile.experience_level == "senior":
-            projects.append("Architect and lead development of complex systems")
-            projects.append("Mentor junior developers and create learning resources")
-        
-        # Add projects based on education level
-        if user_profile.education_level == "PhD":
-            projects.append("Publish research papers or technical blog posts")
-        elif user_profile.education_level == "Master's Degree":
-            projects.append("Work on advanced research or thesis projects")
-        
-        return projects[:4]  # Limit to 4 projects
-    
-    def _get_personalized_certifications(self, career_track: str, phase: str, user_profile: UserProfile) -> List[str]:
+        return list(self.personalization.lookup(
+            career_track, phase, user_profile.experience_level, user_profile.education_level)[0])
+
+    def _get_personalized_certifications(self, career_track: str, phase: str, user_profile: ProfileLike) -> List[str]:
         """Generate personalized certification recommendations."""
-        certifications = []
-        
-        # Base certifications by career track
-        base_certifications = {
-            "Data Scientist": {
-                "foundation": ["Python for Data Science", "SQL Fundamentals"],
-                "advanced": ["Machine Learning Specialization", "Deep Learning Certification"],
-                "specialization": ["AWS Machine Learning", "Google Cloud AI/ML"]
-            },
-            "Software Engineer": {
-                "foundation": ["Programming Fundamentals", "Web Development"],
-                "advanced": ["Software Architecture", "System Design"],
-                "specialization": ["AWS Solutions Architect", "Google Cloud Professional"]
-            },
-            "AI/ML Engineer": {
-                "foundation": ["Machine Learning Basics", "Python for AI"],
-                "advanced": ["Deep Learning Specialization", "NLP Certification"],
-                "specialization": ["AI Ethics Certification", "MLOps Professional"]
-            }
-        }
-        
-        if career_track in base_certifications and phase in base_certifications[career_track]:
-            certifications.extend(base_certifications[career_track][phase])
-        
-        # Add certifications based on experience level
-        if user_profile.experience_level == "student":
-            certifications.append("Student-focused certifications and courses")
-        elif user_profile.experience_level in ["junior", "mid"]:
-            certifications.append("Industry-recognized professional certifications")
-        elif user_profile.experience_level == "senior":
-            certifications.append("Advanced and leadership certifications")
-        
-        return certifications[:3]  # Limit to 3 certifications
-    
-    def _get_personalized_resources(self, career_track: str, phase: str, user_profile: UserProfile) -> List[Dict[str, str]]:
+        return list(self.personalization.lookup(
+            career_track, phase, user_profile.experience_level, user_profile.education_level)[1])
+
+    def _get_personalized_resources(self, career_track: str, phase: str, user_profile: ProfileLike) -> List[Dict[str, str]]:
         """Generate personalized learning resources."""
-        resources = []
-        
-        # Base resources
-        if phase == "foundation":
-            resources.extend(self.learning_resources["courses"][:2])
-            resources.extend(self.learning_resources["practice"][:1])
-        elif phase == "advanced":
-            resources.extend(self.learning_resources["courses"][2:])
-            resources.extend(self.learning_resources["books"])
-        else:  # specialization
-            resources.extend(self.learning_resources["practice"][2:])
-            resources.extend(self.learning_resources["courses"][:1])
-        
-        # Add personalized resources based on background
-        if user_profile.experience_level == "student":
-            resources.append({"title": "Free Student Resources", "provider": "Various", "url_placeholder": "github.com/student-resources"})
-        elif user_profile.experience_level == "senior":
-            resources.append({"title": "Advanced Technical Papers", "provider": "arXiv", "url_placeholder": "arxiv.org"})
-        
-        return resources
+        return [dict(resource) for resource in self.personalization.lookup(
+            career_track, phase, user_profile.experience_level, user_profile.education_level)[2]]
 
     def generate_resume_boosters(self, career_track: str) -> ResumeBooster:
         """Generate project ideas and resume bullets for a career track."""
         career_data = self.career_tracks[career_track]
         
-        project_ideas = [
+        project_ideas = (
             f"Developed a {career_track.lower()} solution using modern technologies",
             f"Built an automated system for {career_track.lower()} tasks",
             f"Created a data-driven {career_track.lower()} application",
             f"Implemented best practices in {career_track.lower()} development"
-        ]
+        )
         
-        resume_bullets = [
+        resume_bullets = (
             f"Led {career_track.lower()} initiatives resulting in 25% efficiency improvement",
             f"Developed scalable solutions using {', '.join(career_data['core_skills'][:3])}",
             f"Collaborated with cross-functional teams to deliver high-impact projects",
             f"Stayed current with emerging technologies including {', '.join(career_data['emerging_skills'][:2])}"
-        ]
+        )
         
         return ResumeBooster(
             career_track=career_track,
@@ -498,132 +1056,104 @@ class CareerGuideAI:
 
     def parse_user_input(self, user_input: str) -> UserProfile:
         """Parse user input to extract profile information."""
-        profile = UserProfile()
-        
-        # Extract name
-        name_match = re.search(r"name[:\s]+([^\n,]+)", user_input, re.IGNORECASE)
-        if name_match:
-            profile.name = name_match.group(1).strip()
-        
-        # Extract education level
-        education_keywords = {
-            "high school": "High School",
-            "bachelor": "Bachelor's Degree",
-            "master": "Master's Degree",
-            "phd": "PhD",
-            "doctorate": "PhD"
-        }
-        
-        for keyword, level in education_keywords.items():
-            if keyword in user_input.lower():
-                profile.education_level = level
-                break
-        
-        # Extract experience level
-        experience_keywords = {
-            "student": "student",
-            "fresher": "fresher",
-            "junior": "junior",
-            "mid": "mid",
-            "senior": "senior"
-        }
-        
-        for keyword, level in experience_keywords.items():
-            if keyword in user_input.lower():
-                profile.experience_level = level
-                break
-        
-        # Extract skills (look for common skill patterns)
-        skills = []
-        for skill_list in self.skill_normalization.values():
-            for skill in skill_list:
-                if skill in user_input.lower():
-                    skills.append(skill)
-        
-        # Add any other skills mentioned
-        skill_patterns = [
-            r"skills?[:\s]+([^.\n]+)",
-            r"know[:\s]+([^.\n]+)",
-            r"experience[:\s]+([^.\n]+)"
-        ]
-        
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, user_input, re.IGNORECASE)
-            for match in matches:
-                skills.extend([s.strip() for s in match.split(',')])
-        
-        profile.skills = list(set(skills))
-        
-        # Extract interests
-        interest_patterns = [
-            r"interest[:\s]+([^.\n]+)",
-            r"like[:\s]+([^.\n]+)",
-            r"passion[:\s]+([^.\n]+)"
-        ]
-        
-        interests = []
-        for pattern in interest_patterns:
-            matches = re.findall(pattern, user_input, re.IGNORECASE)
-            for match in matches:
-                interests.extend([s.strip() for s in match.split(',')])
-        
-        profile.interests = list(set(interests))
-        
-        return profile
+        return self.extractor.extract(user_input)
 
-    def generate_guidance(self, user_profile: UserProfile) -> Tuple[str, Dict[str, Any]]:
+    def generate_guidance(self, user_profile: ProfileLike) -> Tuple[str, Dict[str, Any]]:
         """Generate comprehensive career guidance."""
-        # Generate recommendations
-        recommendations = self.generate_career_recommendations(user_profile)
-        
-        # Generate skill gap analysis for top recommendation
-        top_career = recommendations[0].career_track if recommendations else None
-        skill_gaps = []
-        learning_paths = []
-        resume_boosters = []
-        
-        if top_career:
-            skill_gaps.append(self.analyze_skill_gaps(user_profile, top_career))
-            learning_paths.append(self.generate_learning_path(top_career, user_profile))
-            resume_boosters.append(self.generate_resume_boosters(top_career))
-        
-        # Generate human-readable guidance
-        guidance_text = self._generate_human_guidance(user_profile, recommendations, skill_gaps, learning_paths, resume_boosters)
-        
-        # Generate JSON output
-        json_output = self._generate_json_output(user_profile, recommendations, skill_gaps, learning_paths, resume_boosters)
-        
-        return guidance_text, json_output
+        result = self.analyze(user_profile, sections=("text", "json"))
+        return result.text, result.json
+
+    def analyze(self, user_profile: ProfileLike, sections: Iterable[str] = (),
+                k: int = DEFAULT_TOP_K) -> "GuidanceResult":
+        """Compute the requested guidance sections; any other section is built on first access.
+
+        Sections are the GuidanceResult attributes listed in GUIDANCE_SECTIONS,
+        e.g. analyze(profile, ["recommendations"]) never builds the learning path
+        or renders the report.
+        """
+        profile = self.normalize_profile(user_profile)
+        result = GuidanceResult(self, profile, k, self._memo_for(profile, k))
+        for section in _check_sections(sections):
+            getattr(result, section)
+        return result
+
+    def analyze_batch(self, user_profiles: Iterable[ProfileLike], sections: Iterable[str] = (),
+                      k: int = DEFAULT_TOP_K) -> List["GuidanceResult"]:
+        """analyze() for many profiles, with all match scores from one score_batch pass."""
+        sections = _check_sections(sections)
+        results = []
+        for profile in user_profiles:
+            profile = self.normalize_profile(profile)
+            results.append(GuidanceResult(self, profile, k, self._memo_for(profile, k)))
+        unscored = [result for result in results if "scores" not in result.memo]
+        for result, scores in zip(unscored, self.score_batch([result.profile for result in unscored])):
+            result.memo["scores"] = MappingProxyType(scores)
+        for section in sections:
+            for result in results:
+                getattr(result, section)
+        return results
+
+    def memo_key(self, profile: NormalizedProfile, k: int = DEFAULT_TOP_K) -> Tuple:
+        """Everything guidance depends on apart from the report header and user summary.
+
+        That is which catalog skills the profile has, how many distinct skills
+        (only up to the point where the match bonus stops changing), the
+        experience and education levels, and k.
+        """
+        return (profile.skill_ids, min(len(profile.skill_set), self._skill_count_cap),
+                profile.experience_level, profile.education_level, k)
+
+    def _memo_for(self, profile: NormalizedProfile, k: int) -> Dict[str, Any]:
+        """The section memo shared by every profile with this profile's memo_key."""
+        key = self.memo_key(profile, k)
+        memo = self._memo.get(key)
+        if memo is None:
+            memo = {}
+            self._memo.set(key, memo)
+        return memo
+
+    def memo_stats(self) -> Dict[str, Any]:
+        """Size and hit/miss counters of the guidance memo."""
+        return self._memo.stats()
+
+    def generate_guidance_from_fields(self, name: Optional[str] = None, education: Optional[str] = None,
+                                      experience: Optional[str] = None, skills: Optional[List[str]] = None,
+                                      interests: Optional[List[str]] = None,
+                                      learning_style: Optional[str] = None) -> Tuple[str, Dict[str, Any]]:
+        """Generate guidance from structured profile fields, skipping parse_user_input."""
+        return self.generate_guidance(UserProfile.from_request({
+            "name": name,
+            "education": education,
+            "experience": experience,
+            "skills": skills,
+            "interests": interests,
+            "learning_style": learning_style,
+        }))
 
     def _generate_human_guidance(self, user_profile: UserProfile, recommendations: List[CareerRecommendation], 
                                skill_gaps: List[SkillGapAnalysis], learning_paths: List[LearningPath], 
                                resume_boosters: List[ResumeBooster]) -> str:
         """Generate human-readable guidance text."""
-        guidance = f"""
-# 🚀 CareerGuideAI - Your Personalized Career Roadmap
+        return "".join(self.iter_human_guidance(user_profile, recommendations, skill_gaps, learning_paths))
 
-## 👤 Your Profile Summary
-- **Name:** {user_profile.name or 'Not specified'}
-- **Education Level:** {user_profile.education_level or 'Not specified'}
-- **Experience Level:** {user_profile.experience_level or 'Not specified'}
-- **Skills Identified:** {', '.join(user_profile.skills) if user_profile.skills else 'None specified'}
-- **Interests:** {', '.join(user_profile.interests) if user_profile.interests else 'None specified'}
+    def iter_human_guidance(self, user_profile: UserProfile, recommendations: List[CareerRecommendation],
+                            skill_gaps: List[SkillGapAnalysis],
+                            learning_paths: List[LearningPath]) -> Iterator[str]:
+        """Yield the guidance report one markdown section at a time."""
+        yield self.render_profile_header(user_profile)
 
-## 🎯 Best Career Matches
-"""
-        
         for i, rec in enumerate(recommendations, 1):
-            guidance += f"""
+            yield f"""
 ### {i}. {rec.career_track}
 - **Match Score:** {rec.match_score}/100
 - **Current Market Demand:** {rec.current_market_demand_score}/100
 - **Future Demand Projection:** {rec.future_demand_projection_score}/100
 - **Why Recommended:** {rec.why_recommended}
 """
-        
+
         if skill_gaps:
             gap = skill_gaps[0]
-            guidance += f"""
+            yield f"""
 ## 💪 Skills You Have
 {', '.join(gap.have_skills) if gap.have_skills else 'None identified'}
 
@@ -633,108 +1163,68 @@ class CareerGuideAI:
 ## 🎯 Priority Skills to Focus On
 {', '.join(gap.priority_gaps) if gap.priority_gaps else 'No immediate gaps identified'}
 """
-        
+
         if learning_paths:
             path = learning_paths[0]
-            guidance += f"""
+            yield f"""
 ## 🛣️ Learning Roadmap for {path.career_track}
 **Timeline:** {path.timeline_months} months
 
 """
             for phase in path.phases:
-                guidance += f"""
+                yield f"""
 ### {phase.phase_name} Phase ({phase.duration_weeks} weeks)
 **Focus Skills:** {', '.join(phase.focus_skills)}
 **Projects:** {', '.join(phase.recommended_projects)}
 **Certifications:** {', '.join(phase.recommended_certifications)}
 """
-        
-        guidance += """
-## 🔮 Emerging Trends to Watch
-- **GenAI & LLMs:** Transformative impact across all tech roles
-- **MLOps & AI Engineering:** Growing demand for AI infrastructure
-- **Cloud Native & Kubernetes:** Standard for modern applications
-- **Cybersecurity:** Increasing importance with digital transformation
-- **DevOps & Platform Engineering:** Streamlining development workflows
 
-## 💡 Actionable Next Steps
-1. **Start with the Foundation Phase** of your chosen career path
-2. **Build a portfolio** with the recommended projects
-3. **Earn relevant certifications** to validate your skills
-4. **Network with professionals** in your target field
-5. **Stay updated** with emerging technologies and trends
+        yield _STATIC_FOOTER
 
-## 📈 Market Insights
-- Tech roles are experiencing 20-50% growth rates
-- Remote work is expanding opportunities globally
-- Continuous learning is essential for career advancement
-- Specialized skills command premium salaries
+    def stream_guidance(self, user_profile: ProfileLike) -> Iterator[str]:
+        """Yield the guidance report section by section, for streaming responses and the CLI."""
+        return self.analyze(user_profile).iter_text()
 
----
-*Generated by CareerGuideAI - Your AI Career Counselor*
+    def render_profile_header(self, user_profile: ProfileLike) -> str:
+        """The report's first section, the only one that shows name, interests and skills as given."""
+        name = user_profile.name or 'Not specified'
+        education = user_profile.education_level or 'Not specified'
+        experience = user_profile.experience_level or 'Not specified'
+        skills = ', '.join(user_profile.skills) if user_profile.skills else 'None specified'
+        interests = ', '.join(user_profile.interests) if user_profile.interests else 'None specified'
+        return f"""
+# 🚀 CareerGuideAI - Your Personalized Career Roadmap
+
+## 👤 Your Profile Summary
+- **Name:** {name}
+- **Education Level:** {education}
+- **Experience Level:** {experience}
+- **Skills Identified:** {skills}
+- **Interests:** {interests}
+
+## 🎯 Best Career Matches
 """
-        
-        return guidance
 
-    def _generate_json_output(self, user_profile: UserProfile, recommendations: List[CareerRecommendation],
+    def user_summary(self, user_profile: ProfileLike) -> Dict[str, Any]:
+        """The "user_summary" part of the JSON output."""
+        return {
+            "name": user_profile.name,
+            "education_level": user_profile.education_level,
+            "experience_level": user_profile.experience_level,
+            "skills_normalized": list(self.normalize_profile(user_profile).skills),
+            "interests_normalized": user_profile.interests
+        }
+
+    def _generate_json_output(self, user_profile: ProfileLike, recommendations: List[CareerRecommendation],
                             skill_gaps: List[SkillGapAnalysis], learning_paths: List[LearningPath],
                             resume_boosters: List[ResumeBooster]) -> Dict[str, Any]:
         """Generate structured JSON output."""
         return {
-            "user_summary": {
-                "name": user_profile.name,
-                "education_level": user_profile.education_level,
-                "experience_level": user_profile.experience_level,
-                "skills_normalized": self.normalize_skills(user_profile.skills),
-                "interests_normalized": user_profile.interests
-            },
-            "career_recommendations": [
-                {
-                    "career_track": rec.career_track,
-                    "match_score": rec.match_score,
-                    "current_market_demand_score": rec.current_market_demand_score,
-                    "future_demand_projection_score": rec.future_demand_projection_score,
-                    "why_recommended": rec.why_recommended,
-                    "top_recommended_skills": rec.top_recommended_skills,
-                    "emerging_skills": rec.emerging_skills
-                }
-                for rec in recommendations
-            ],
-            "skill_gap_analysis": [
-                {
-                    "career_track": gap.career_track,
-                    "have_skills": gap.have_skills,
-                    "need_skills": gap.need_skills,
-                    "priority_gaps": gap.priority_gaps
-                }
-                for gap in skill_gaps
-            ],
-            "learning_path": [
-                {
-                    "career_track": path.career_track,
-                    "timeline_months": path.timeline_months,
-                    "phases": [
-                        {
-                            "phase_name": phase.phase_name,
-                            "duration_weeks": phase.duration_weeks,
-                            "focus_skills": phase.focus_skills,
-                            "recommended_projects": phase.recommended_projects,
-                            "recommended_certifications": phase.recommended_certifications,
-                            "practice_resources": phase.practice_resources
-                        }
-                        for phase in path.phases
-                    ]
-                }
-                for path in learning_paths
-            ],
-            "resume_boosters": [
-                {
-                    "career_track": booster.career_track,
-                    "project_ideas": booster.project_ideas,
-                    "resume_bullets_sample": booster.resume_bullets_sample
-                }
-                for booster in resume_boosters
-            ],
+            "user_summary": self.user_summary(user_profile),
+            "career_recommendations": serialize_recommendations(recommendations),
+            "skill_gap_analysis": serialize_skill_gaps(skill_gaps),
+            "learning_path": serialize_learning_paths(learning_paths),
+            "resume_boosters": serialize_resume_boosters(resume_boosters),
             "clarifications_needed": [],
             "meta": {
                 "version": "1.0",
@@ -743,7 +1233,282 @@ class CareerGuideAI:
             }
         }
 
-def main():
+GUIDANCE_SECTIONS = ("scores", "recommendations", "skill_gaps", "learning_paths", "resume_boosters", "text", "json")
+
+def _check_sections(sections: Iterable[str]) -> Tuple[str, ...]:
+    if isinstance(sections, str):
+        sections = (sections,)
+    sections = tuple(sections)
+    for section in sections:
+        if section not in GUIDANCE_SECTIONS:
+            raise ValueError(f"Unknown guidance section {section!r}; expected one of {', '.join(GUIDANCE_SECTIONS)}")
+    return sections
+
+class _memo_section(cached_property):
+    """A cached_property whose value is also shared through GuidanceResult.memo."""
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        memo = instance.memo
+        try:
+            value = memo[self.attrname]
+        except KeyError:
+            value = memo[self.attrname] = self.func(instance)
+        instance.__dict__[self.attrname] = value
+        return value
+
+class GuidanceResult:
+    """Guidance for one profile, built section by section on first access.
+
+    Every section depends only on the sections before it in
+    GUIDANCE_SECTIONS, so asking for the match scores never touches the
+    learning path or the rendered report. Sections other than the text and
+    JSON output are shared with every profile that has the same memo key, so
+    they are built immutable: tuples and read-only mappings all the way down.
+    """
+
+    def __init__(self, engine: CareerGuideAI, profile: NormalizedProfile, k: int = DEFAULT_TOP_K,
+                 memo: Optional[Dict[str, Any]] = None):
+        self.engine = engine
+        self.profile = profile
+        self.k = k
+        self.memo = {} if memo is None else memo
+
+    @_memo_section
+    def scores(self) -> Mapping[str, int]:
+        """Match score for every career track."""
+        return MappingProxyType(self.engine.score_tracks(self.profile))
+
+    @_memo_section
+    def recommendations(self) -> Tuple[CareerRecommendation, ...]:
+        engine = self.engine
+        return tuple([
+            engine._build_recommendation(career, score, self.profile.skill_set)
+            for career, score in engine.select_top_tracks(self.scores, self.k)
+        ])
+
+    @property
+    def top_career(self) -> Optional[str]:
+        return self.recommendations[0].career_track if self.recommendations else None
+
+    @_memo_section
+    def skill_gaps(self) -> Tuple[SkillGapAnalysis, ...]:
+        """Skill gap analysis for the top recommendation."""
+        if not self.top_career:
+            return ()
+        return (self.engine.analyze_skill_gaps(self.profile, self.top_career),)
+
+    @_memo_section
+    def learning_paths(self) -> Tuple[LearningPath, ...]:
+        if not self.top_career:
+            return ()
+        return (self.engine.generate_learning_path(self.top_career, self.profile),)
+
+    @_memo_section
+    def resume_boosters(self) -> Tuple[ResumeBooster, ...]:
+        if not self.top_career:
+            return ()
+        return (self.engine.generate_resume_boosters(self.top_career),)
+
+    @cached_property
+    def text(self) -> str:
+        """The human-readable markdown report."""
+        return self.engine._generate_human_guidance(self.profile.profile, self.recommendations, self.skill_gaps,
+                                                    self.learning_paths, self.resume_boosters)
+
+    def iter_text(self) -> Iterator[str]:
+        """Yield the markdown report by section; the rendered text is not kept."""
+        if "text" in self.__dict__:
+            yield self.text
+            return
+        yield from self.engine.iter_human_guidance(self.profile.profile, self.recommendations, self.skill_gaps,
+                                                   self.learning_paths)
+
+    @cached_property
+    def json(self) -> Dict[str, Any]:
+        """The structured JSON output."""
+        return self.engine._generate_json_output(self.profile, self.recommendations, self.skill_gaps,
+                                                 self.learning_paths, self.resume_boosters)
+
+# Warm engine of a bulk worker process, built once by _init_bulk_worker.
+_BULK_ENGINE: Optional["CareerGuideAI"] = None
+
+BULK_STAGES = ("parse", "analyze", "encode")
+
+def _init_bulk_worker(catalog_path: Optional[str]) -> None:
+    global _BULK_ENGINE
+    _BULK_ENGINE = CareerGuideAI(load_catalog(catalog_path) if catalog_path else None)
+
+def _bulk_profile(engine: "CareerGuideAI", record: Any) -> UserProfile:
+    """A bulk input record is either {"text": <free-text profile>} or the /analyze fields, validated like /analyze."""
+    if not isinstance(record, dict):
+        raise ValueError("each line must be a JSON object")
+    if "text" in record:
+        return engine.parse_user_input(str(record["text"]))
+    return UserProfile.from_request(AnalyzeRequest.model_validate(record))
+
+def _bulk_error(exc: Exception) -> str:
+    if isinstance(exc, ValidationError):
+        return "; ".join(f"{'.'.join(map(str, error['loc'])) or 'record'}: {error['msg']}" for error in exc.errors())
+    return str(exc) or type(exc).__name__
+
+def _bulk_analyze_chunk(chunk: List[Tuple[int, int, str]]) -> Tuple[List[Tuple[int, str]], Dict[str, float], int]:
+    """Analyze (index, line number, JSONL line) triples in a worker; returns output lines, time per stage and
+    error count. A record that fails in any way becomes an error line; the rest of the chunk carries on."""
+    engine = _BULK_ENGINE
+    clock = time.perf_counter
+    timings = dict.fromkeys(BULK_STAGES, 0.0)
+    lines = []
+    errors = 0
+    for index, line_number, line in chunk:
+        started = parsed = analyzed = clock()
+        try:
+            record = json.loads(line)
+            profile = _bulk_profile(engine, record)
+            parsed = clock()
+            result = engine.analyze(profile, sections=("text", "json"))
+            analyzed = clock()
+            output = {"index": index, "guidance_text": result.text, "json_output": result.json}
+            if "id" in record:
+                output["id"] = record["id"]
+            lines.append((index, json.dumps(output, ensure_ascii=False)))
+        except Exception as exc:  # one bad record must not abort the whole run
+            lines.append((index, json.dumps({"index": index, "line": line_number, "error": _bulk_error(exc)},
+                                            ensure_ascii=False)))
+            errors += 1
+            timings["parse"] += clock() - started
+            continue
+        timings["parse"] += parsed - started
+        timings["analyze"] += analyzed - parsed
+        timings["encode"] += clock() - analyzed
+    return lines, timings, errors
+
+def _read_chunks(stream: IO[str], chunk_size: int) -> Iterator[List[Tuple[int, int, str]]]:
+    """(record index, 1-based line number, line) triples in chunks; blank lines are skipped."""
+    chunk: List[Tuple[int, int, str]] = []
+    index = 0
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        chunk.append((index, line_number, line))
+        index += 1
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def run_bulk(input_path: str, output_dir: str, workers: Optional[int] = None, shards: int = 1,
+             chunk_size: int = 200, ordered: bool = True, catalog_path: Optional[str] = None) -> Dict[str, Any]:
+    """Generate guidance for every profile in a JSONL file ("-" for stdin) on a pool of warm workers.
+
+    Output goes to output_dir/guidance-NNNNN-of-NNNNN.jsonl, record i to
+    shard i % shards. With ordered=True every shard is written in input
+    order; otherwise lines are written as chunks finish. At most a few
+    chunks per worker are in flight, so memory does not grow with the input.
+    A record that cannot be parsed, validated or analyzed is written as
+    {"index", "line", "error"} and the run carries on.
+    Returns totals and per-stage timings (summed over workers).
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    os.makedirs(output_dir, exist_ok=True)
+    shard_files = [
+        open(os.path.join(output_dir, f"guidance-{shard:05d}-of-{shards:05d}.jsonl"), "w", encoding="utf-8")
+        for shard in range(shards)
+    ]
+    stats: Dict[str, Any] = {"profiles": 0, "errors": 0, "stages": dict.fromkeys(BULK_STAGES, 0.0)}
+
+    def write(result: Tuple[List[Tuple[int, str]], Dict[str, float], int]) -> None:
+        lines, timings, errors = result
+        for index, line in lines:
+            shard_files[index % shards].write(line + "\n")
+        stats["profiles"] += len(lines)
+        stats["errors"] += errors
+        for stage, seconds in timings.items():
+            stats["stages"][stage] += seconds
+
+    source = sys.stdin if input_path == "-" else open(input_path, encoding="utf-8")
+    started = time.perf_counter()
+    try:
+        chunks = _read_chunks(source, chunk_size)
+        if workers == 1:
+            _init_bulk_worker(catalog_path)
+            for chunk in chunks:
+                write(_bulk_analyze_chunk(chunk))
+        else:
+            done: "queue.Queue[Tuple[int, Any]]" = queue.Queue()
+            pending: Dict[int, Any] = {}
+            next_to_write = 0
+            submitted = 0
+            window = workers * 4
+            with multiprocessing.Pool(workers, initializer=_init_bulk_worker, initargs=(catalog_path,)) as pool:
+
+                def drain(block: bool) -> None:
+                    nonlocal next_to_write
+                    while True:
+                        try:
+                            number, result = done.get(block=block)
+                        except queue.Empty:
+                            return
+                        block = False
+                        if isinstance(result, BaseException):
+                            raise result
+                        if not ordered:
+                            write(result)
+                            next_to_write += 1
+                            continue
+                        pending[number] = result
+                        while next_to_write in pending:
+                            write(pending.pop(next_to_write))
+                            next_to_write += 1
+
+                for number, chunk in enumerate(chunks):
+                    pool.apply_async(_bulk_analyze_chunk, (chunk,),
+                                     callback=lambda result, number=number: done.put((number, result)),
+                                     error_callback=lambda exc, number=number: done.put((number, exc)))
+                    submitted += 1
+                    while submitted - next_to_write >= window:
+                        drain(block=True)
+                while next_to_write < submitted:
+                    drain(block=True)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        for f in shard_files:
+            f.close()
+
+    stats["seconds"] = time.perf_counter() - started
+    stats["profiles_per_sec"] = stats["profiles"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+def main(argv: Optional[List[str]] = None):
+    """Run the demo, or bulk mode with --bulk."""
+    parser = argparse.ArgumentParser(description="CareerGuideAI career guidance engine")
+    parser.add_argument("--bulk", metavar="JSONL",
+                        help='generate guidance for every profile in a JSONL file ("-" for stdin)')
+    parser.add_argument("--output-dir", default="bulk_output", help="directory for the sharded JSONL results")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--shards", type=int, default=1, help="number of output files")
+    parser.add_argument("--chunk-size", type=int, default=200, help="profiles per worker task")
+    parser.add_argument("--unordered", action="store_true", help="write results as they finish")
+    parser.add_argument("--catalog", default=None, help="catalog file (default: $CAREER_CATALOG_PATH or bundled)")
+    args = parser.parse_args(argv)
+
+    if args.bulk:
+        if args.shards < 1 or args.chunk_size < 1:
+            parser.error("--shards and --chunk-size must be at least 1")
+        stats = run_bulk(args.bulk, args.output_dir, workers=args.workers, shards=args.shards,
+                         chunk_size=args.chunk_size, ordered=not args.unordered, catalog_path=args.catalog)
+        print(f"✅ {stats['profiles']} profiles ({stats['errors']} errors) in {stats['seconds']:.2f}s "
+              f"- {stats['profiles_per_sec']:,.0f} profiles/sec", file=sys.stderr)
+        for stage, seconds in stats["stages"].items():
+            print(f"   {stage:<8} {seconds:8.2f}s worker time", file=sys.stderr)
+        return
+
+    run_demo()
+
+def run_demo():
     """Main function to demonstrate CareerGuideAI functionality."""
     print("🚀 Welcome to CareerGuideAI - Your Advanced Career Counselor!")
     print("=" * 60)
@@ -764,13 +1529,19 @@ def main():
     user_profile = career_ai.parse_user_input(example_input)
     
     print("🎯 Generating career recommendations...")
-    guidance_text, json_output = career_ai.generate_guidance(user_profile)
+    result = career_ai.analyze(user_profile)
     
-    # Display human-readable guidance
+    # Display human-readable guidance, streaming each section as it is rendered
     print("\n" + "=" * 60)
     print("📋 HUMAN GUIDANCE")
     print("=" * 60)
-    print(guidance_text)
+    sections = []
+    for section in result.iter_text():
+        print(section, end="", flush=True)
+        sections.append(section)
+    print()
+    guidance_text = "".join(sections)
+    json_output = result.json
     
     # Display JSON output
     print("\n" + "=" * 60)
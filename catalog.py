@@ -0,0 +1,227 @@
+"""
+Career catalog loading
+Versioned on-disk snapshots of the career tracks, skill taxonomy and learning
+resources used by CareerGuideAI.
+
+A catalog is a JSON file holding the hot data (career tracks and the skill
+taxonomy) plus a reference to a resources file that is only read when a
+learning path needs it. Loaded catalogs are shared per process, and the lookup
+tables CareerGuideAI derives from them are saved as a marshal snapshot in a
+per-user cache directory (CAREER_CATALOG_CACHE_DIR, else
+$XDG_CACHE_HOME/career_ai/catalog or ~/.cache/career_ai/catalog), so later
+processes skip both JSON parsing and compilation. marshal is unsafe on crafted
+input, so snapshots are only read from and written to a directory owned by the
+current user and not writable by anyone else.
+"""
+
+import gc
+import json
+import marshal
+import os
+import sys
+import threading
+from hashlib import sha256
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.filesystem import is_private_dir
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_CATALOG_PATH = os.path.join(DATA_DIR, "career_catalog.json")
+
+_LOADED: Dict[str, Tuple[Tuple[int, int], "CareerCatalog"]] = {}
+_LOCK = threading.Lock()
+
+
+class CatalogError(ValueError):
+    """Raised when a catalog file is missing data or its parts disagree on version."""
+
+
+class CareerCatalog:
+    """Career tracks, skill taxonomy and learning resources for one catalog version.
+
+    Instances are shared between every CareerGuideAI built from the same file,
+    so treat the data as read-only and build a new catalog to change it.
+    """
+
+    def __init__(self, version: str, career_tracks: Dict[str, Dict[str, Any]],
+                 skill_normalization: Dict[str, List[str]], resources_path: Optional[str] = None,
+                 learning_resources: Optional[Dict[str, List[Dict[str, str]]]] = None,
+                 source_path: Optional[str] = None, source_stamp: Optional[Tuple[int, int]] = None):
+        self.version = version
+        self.career_tracks = career_tracks
+        self.skill_normalization = skill_normalization
+        self.resources_path = resources_path
+        self.source_path = source_path
+        self._source_stamp = source_stamp
+        self._resources = None
+        self._compiled = None
+        self._compiled_format = None
+        self._derived: Dict[str, Any] = {}
+        if learning_resources is not None:
+            self._resources = {"learning_resources": learning_resources}
+
+    @property
+    def learning_resources(self) -> Dict[str, List[Dict[str, str]]]:
+        """Learning resources, read from the resources file on first access."""
+        return self.resources["learning_resources"]
+
+    @property
+    def resources(self) -> Dict[str, Any]:
+        """The whole resources document, loaded lazily."""
+        if self._resources is None:
+            if not self.resources_path:
+                raise CatalogError(f"Catalog {self.version} has no resources file")
+            with open(self.resources_path, encoding="utf-8") as f:
+                resources = json.load(f)
+            if resources.get("version") != self.version:
+                raise CatalogError(
+                    f"Resources version {resources.get('version')!r} does not match catalog {self.version!r}"
+                )
+            self._resources = resources
+        return self._resources
+
+    def derived(self, name: str, builder: Callable[["CareerCatalog"], Any]) -> Any:
+        """Build a structure from this catalog once and share it with every user of the catalog."""
+        try:
+            return self._derived[name]
+        except KeyError:
+            value = self._derived[name] = builder(self)
+            return value
+
+    def compiled(self, compiler: Callable[[Dict, Dict], Dict[str, Any]], format_version: int = 1) -> Dict[str, Any]:
+        """Derived lookup tables for this catalog, built once and snapshotted to disk.
+
+        compiler must return plain marshal-able data (dicts, lists, tuples,
+        sets, strings, numbers, None).
+        """
+        if self._compiled is None or self._compiled_format != format_version:
+            self._compiled = compiler(self.career_tracks, self.skill_normalization)
+            self._compiled_format = format_version
+            self._write_snapshot()
+        return self._compiled
+
+    def _write_snapshot(self) -> None:
+        if not self.source_path:
+            return
+        path = _snapshot_path(self.source_path)
+        snapshot = {
+            "source": self.source_path,
+            "stamp": self._source_stamp,
+            "version": self.version,
+            "career_tracks": self.career_tracks,
+            "skill_normalization": self.skill_normalization,
+            "resources_path": self.resources_path,
+            "inline_resources": None if self.resources_path else self._resources,
+            "compiled_format": self._compiled_format,
+            "compiled": self._compiled,
+        }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            if not is_private_dir(os.path.dirname(path)):
+                return
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps(snapshot))
+            os.replace(tmp_path, path)
+        except (OSError, ValueError):
+            # Read-only deployments just compile on every cold start.
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _snapshot_dir() -> str:
+    return os.environ.get("CAREER_CATALOG_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache")), "career_ai", "catalog"
+    )
+
+
+def _snapshot_path(source_path: str) -> str:
+    """marshal output is tied to the interpreter version, so it is part of the name; so is a hash of
+    the source path, since catalogs with the same file name in different directories share the cache."""
+    base = os.path.splitext(os.path.basename(source_path))[0]
+    source = sha256(os.path.abspath(source_path).encode()).hexdigest()[:12]
+    return os.path.join(_snapshot_dir(), f"{base}-{source}.py{sys.version_info[0]}{sys.version_info[1]}.marshal")
+
+
+def _stamp(path: str) -> Tuple[int, int]:
+    info = os.stat(path)
+    return info.st_mtime_ns, info.st_size
+
+
+def _read_snapshot(path: str, stamp: Tuple[int, int]) -> Optional[CareerCatalog]:
+    """Rebuild a catalog straight from its compiled snapshot, skipping JSON parsing."""
+    snapshot_path = _snapshot_path(path)
+    if not is_private_dir(os.path.dirname(snapshot_path)):
+        return None
+    # The snapshot is one large acyclic structure; collector passes while it
+    # is being built only cost time.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+    if not isinstance(snapshot, dict) or snapshot.get("source") != path or snapshot.get("stamp") != stamp:
+        return None
+
+    catalog = CareerCatalog(
+        version=snapshot["version"],
+        career_tracks=snapshot["career_tracks"],
+        skill_normalization=snapshot["skill_normalization"],
+        resources_path=snapshot["resources_path"],
+        source_path=path,
+        source_stamp=stamp,
+    )
+    catalog._resources = snapshot["inline_resources"]
+    catalog._compiled = snapshot["compiled"]
+    catalog._compiled_format = snapshot["compiled_format"]
+    return catalog
+
+
+def _read_catalog(path: str, stamp: Tuple[int, int]) -> CareerCatalog:
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    missing = [key for key in ("version", "career_tracks", "skill_normalization") if key not in data]
+    if missing:
+        raise CatalogError(f"Catalog {path} is missing {', '.join(missing)}")
+
+    resources_path = data.get("resources")
+    if resources_path:
+        resources_path = os.path.join(os.path.dirname(path), resources_path)
+
+    return CareerCatalog(
+        version=str(data["version"]),
+        career_tracks=data["career_tracks"],
+        skill_normalization=data["skill_normalization"],
+        resources_path=resources_path,
+        learning_resources=data.get("learning_resources"),
+        source_path=path,
+        source_stamp=stamp,
+    )
+
+
+def load_catalog(path: Optional[str] = None) -> CareerCatalog:
+    """Load a catalog, reusing the process-wide instance while the file is unchanged.
+
+    The path defaults to $CAREER_CATALOG_PATH, then data/career_catalog.json.
+    """
+    path = os.path.abspath(path or os.environ.get("CAREER_CATALOG_PATH") or DEFAULT_CATALOG_PATH)
+    try:
+        stamp = _stamp(path)
+    except OSError as exc:
+        raise CatalogError(f"Catalog file not found: {path}") from exc
+
+    with _LOCK:
+        cached = _LOADED.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        catalog = _read_snapshot(path, stamp) or _read_catalog(path, stamp)
+        _LOADED[path] = (stamp, catalog)
+        return catalog
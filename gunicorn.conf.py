@@ -0,0 +1,17 @@
+"""
+Gunicorn settings, loaded from the working directory by every `gunicorn app:app`.
+
+/api/tasks/<id>/wait holds a request for up to 25 seconds and
+/api/tasks/<id>/events for up to 5 minutes (EventSource then reconnects), so
+the default single sync worker would let one waiting client block the whole
+app. Threaded workers keep serving other requests while clients wait.
+"""
+
+import os
+
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+threads = int(os.environ.get("GUNICORN_THREADS", "16"))
+# gthread workers heartbeat from their main loop, so this bounds a stuck worker,
+# not the length of a long-poll or event stream.
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
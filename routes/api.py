@@ -1,13 +1,59 @@
-from flask import Blueprint, jsonify, request, session
-
-from services.career_service import analyze_profile, build_cache_key, get_career_tracks, get_skills
+import os
+import time
+from itertools import islice
+
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from flask import Blueprint, Response, jsonify, request, session, stream_with_context
+
+from services.analysis_pool import AnalysisTimeout, analyze_profile, pool_stats
+from services.career_service import (
+    GUIDANCE_CACHE_TTL,
+    TRACK_ARTIFACTS,
+    analysis_task_id,
+    build_cache_key,
+    build_track_artifact,
+    build_track_artifact_cache_key,
+    cached_analyses,
+    career_ai,
+    encode_analysis,
+    get_career_tracks,
+    get_skills,
+    guidance_cache,
+    inflight_key,
+    issue_task_handle,
+    personalize_analysis,
+    profile_from_summary,
+    request_profile,
+    resolve_analysis,
+    stream_guidance,
+    task_for_handle,
+)
+from services.result_store import current_result, remember_result
 from tasks import celery, generate_guidance_task
-from utils.extensions import cache, limiter
+from utils.encoding import dumps, encode_object, iter_json_records, json_response
+from utils.extensions import limiter
 from utils.validation import AnalyzeRequest, ValidationError
 
 
 api_bp = Blueprint("api", __name__)
 
+# Payloads validated, looked up and analyzed together by /api/analyze/batch,
+# and the most one request may carry (the rate limit counts requests).
+BATCH_CHUNK_SIZE = 256
+BATCH_MAX_RECORDS = int(os.environ.get("BATCH_MAX_RECORDS", "1000"))
+
+# Longest /api/tasks/<id>/wait holds a request, and the /events heartbeat and
+# stream lifetime (EventSource reconnects when a stream ends).
+TASK_WAIT_MAX_SECONDS = 25
+TASK_EVENTS_HEARTBEAT_SECONDS = 15
+TASK_EVENTS_MAX_SECONDS = 300
+
+TASK_RESULT_EXPIRED = "Analysis expired, please resubmit"
+
+# Longest an async submission holds its in-flight marker; the task releases it
+# sooner when it finishes.
+TASK_INFLIGHT_SECONDS = 300
+
 
 @api_bp.route("/analyze", methods=["POST"])
 @limiter.limit("10 per minute")
@@ -24,48 +70,135 @@ def analyze():
             422,
         )
 
-    cache_key = build_cache_key(payload)
-    cached = None
+    profile = request_profile(payload)
+    cache_key = build_cache_key(profile)
+    shared = guidance_cache.get(cache_key)
+
+    cached = shared is not None
+    if not cached:
+        try:
+            shared = encode_analysis(*analyze_profile(payload))
+        except AnalysisTimeout:
+            return jsonify({"success": False, "error": "Analysis timed out, please retry"}), 503
+        guidance_cache.set(cache_key, shared, timeout=GUIDANCE_CACHE_TTL)
+
+    return _analysis_response(personalize_analysis(shared, profile), cached)
+
+
+def _analysis_response(encoded, cached):
+    """Store an analysis for this session's results pages and send the /analyze response for it."""
+    remember_result(encoded)
+    # Keys in jsonify's sorted order; the cached JSON parts are sent without re-encoding.
+    return json_response(
+        encoded=encode_object(
+            {
+                "cached": dumps(cached),
+                "guidance": encoded["json_output"],
+                "success": b"true",
+                "timestamp": dumps(encoded["timestamp"]),
+                "user_profile": encoded["user_profile"],
+            }
+        )
+    )
+
+
+@api_bp.route("/api/analyze/stream", methods=["POST"])
+@limiter.limit("10 per minute")
+def analyze_stream():
+    data = request.get_json(silent=True)
+    if data is None:
+        return jsonify({"success": False, "error": "No data provided"}), 400
+
+    try:
+        payload = AnalyzeRequest.model_validate(data)
+    except ValidationError as exc:
+        return (
+            jsonify({"success": False, "error": "Validation failed", "details": exc.errors()}),
+            422,
+        )
+
+    return Response(
+        stream_with_context(stream_guidance(payload)),
+        mimetype="text/markdown",
+        headers={"X-Accel-Buffering": "no"},
+    )
+
+
+@api_bp.route("/api/analyze/batch", methods=["POST"])
+@limiter.limit("10 per minute")
+def analyze_batch():
+    # Read up to one record past the limit before answering, so an oversized
+    # batch is refused before any analysis runs.
+    records = []
+    error = None
     try:
-        cached = cache.get(cache_key)
-    except Exception:
-        cached = None
-
-    if cached:
-        guidance_text = cached["guidance_text"]
-        json_output = cached["json_output"]
-        user_profile = cached["user_profile"]
-        timestamp = cached["timestamp"]
-    else:
-        guidance_text, json_output, user_profile, timestamp = analyze_profile(payload)
+        records.extend(islice(iter_json_records(request.stream), BATCH_MAX_RECORDS + 1))
+    except ValueError as exc:
+        error = exc
+    if len(records) > BATCH_MAX_RECORDS:
+        return (
+            jsonify({"success": False, "error": f"A batch may contain at most {BATCH_MAX_RECORDS} records"}),
+            413,
+        )
+    return Response(
+        stream_with_context(_analyze_batch_lines(_replay_records(records, error))),
+        mimetype="application/x-ndjson",
+        headers={"X-Accel-Buffering": "no"},
+    )
+
+
+def _replay_records(records, error):
+    """The records read ahead, then the parse error that stopped reading, if any."""
+    yield from records
+    if error is not None:
+        raise error
+
+
+def _analyze_batch_lines(records):
+    """Analyze a stream of payloads chunk by chunk, yielding one NDJSON line per input record."""
+    indexed = enumerate(records)
+    while True:
+        chunk = []
+        error = None
         try:
-            cache.set(
-                cache_key,
+            chunk.extend(islice(indexed, BATCH_CHUNK_SIZE))
+        except ValueError as exc:
+            # Records before the malformed one are still analyzed.
+            error = exc
+
+        lines = {}
+        valid = []
+        for index, record in chunk:
+            try:
+                valid.append((index, AnalyzeRequest.model_validate(record)))
+            except ValidationError as exc:
+                lines[index] = dumps(
+                    {"index": index, "success": False, "error": "Validation failed", "details": exc.errors()},
+                    default=str,
+                )
+
+        analyses = cached_analyses([payload for _, payload in valid])
+        for (index, _), (profile, _, shared, cached) in zip(valid, analyses):
+            encoded = personalize_analysis(shared, profile)
+            lines[index] = encode_object(
                 {
-                    "guidance_text": guidance_text,
-                    "json_output": json_output,
-                    "user_profile": user_profile,
-                    "timestamp": timestamp,
-                },
-                timeout=3600,
+                    "cached": dumps(cached),
+                    "guidance": encoded["json_output"],
+                    "index": dumps(index),
+                    "success": b"true",
+                    "timestamp": dumps(encoded["timestamp"]),
+                    "user_profile": encoded["user_profile"],
+                }
             )
-        except Exception:
-            pass
 
-    session["guidance_text"] = guidance_text
-    session["json_output"] = json_output
-    session["user_profile"] = user_profile
-    session["analysis_timestamp"] = timestamp
+        for index, _ in chunk:
+            yield lines[index] + b"\n"
 
-    return jsonify(
-        {
-            "success": True,
-            "guidance": json_output,
-            "user_profile": user_profile,
-            "timestamp": timestamp,
-            "cached": bool(cached),
-        }
-    )
+        if error is not None:
+            yield dumps({"success": False, "error": f"Malformed request body: {error}"}) + b"\n"
+            return
+        if len(chunk) < BATCH_CHUNK_SIZE:
+            return
 
 
 @api_bp.route("/api/analyze/async", methods=["POST"])
@@ -83,13 +216,46 @@ def analyze_async():
             422,
         )
 
-    task = generate_guidance_task.delay(payload.model_dump())
-    return jsonify({"success": True, "task_id": task.id}), 202
+    # A cached analysis is answered like /analyze, without queueing anything.
+    profile = request_profile(payload)
+    cache_key = build_cache_key(profile)
+    shared = guidance_cache.get(cache_key)
+    if shared is not None:
+        return _analysis_response(personalize_analysis(shared, profile), True)
+
+    # Equivalent submissions share one task id, and only the one that takes the
+    # in-flight marker queues the task: double clicks and retries wait on it.
+    task_id = analysis_task_id(cache_key)
+    coalesced = not guidance_cache.add(inflight_key(cache_key), task_id, timeout=TASK_INFLIGHT_SECONDS)
+    if not coalesced:
+        # The id may belong to an earlier run whose FAILURE, or SUCCESS pointing at an
+        # evicted analysis, is still stored; publishing does not reset it to PENDING.
+        celery.AsyncResult(task_id).forget()
+        generate_guidance_task.apply_async(args=(payload.model_dump(),), task_id=task_id)
+    # The shared task id is guessable from a profile, so each submitter polls
+    # through its own random handle, which also carries its own profile.
+    handle = issue_task_handle(task_id, profile)
+    return jsonify({"success": True, "task_id": handle, "coalesced": coalesced}), 202
+
+
+def _task_by_handle(handle: str):
+    """(Celery result, submitter's profile summary) for a handle from /api/analyze/async, or None."""
+    submitted = task_for_handle(handle)
+    if submitted is None:
+        return None
+    return celery.AsyncResult(submitted["task_id"]), submitted["user_profile"]
+
+
+def _unknown_task_response():
+    return jsonify({"state": "UNKNOWN", "status": "Unknown or expired task"}), 404
 
 
 @api_bp.route("/api/tasks/<task_id>", methods=["GET"])
 def get_task_status(task_id: str):
-    task = celery.AsyncResult(task_id)
+    found = _task_by_handle(task_id)
+    if found is None:
+        return _unknown_task_response()
+    task, user_profile = found
     if task.state == "PENDING":
         return jsonify({"state": task.state, "status": "Queued"}), 202
     if task.state == "FAILURE":
@@ -98,13 +264,139 @@ def get_task_status(task_id: str):
     if not task.ready():
         return jsonify({"state": task.state, "status": "Processing"}), 202
 
-    result = task.get()
-    session["guidance_text"] = result["guidance_text"]
-    session["json_output"] = result["json_output"]
-    session["user_profile"] = result["user_profile"]
-    session["analysis_timestamp"] = result["timestamp"]
+    return _finished_task_response(task, user_profile)
+
+
+@api_bp.route("/api/tasks/<task_id>/wait", methods=["GET"])
+def wait_for_task(task_id: str):
+    """Long-poll: hold the request until the task finishes or the timeout passes."""
+    timeout = min(max(request.args.get("timeout", TASK_WAIT_MAX_SECONDS, type=float), 0), TASK_WAIT_MAX_SECONDS)
+    found = _task_by_handle(task_id)
+    if found is None:
+        return _unknown_task_response()
+    task, user_profile = found
+    try:
+        # The Redis result backend waits on pub/sub rather than polling.
+        task.get(timeout=timeout, propagate=False)
+    except CeleryTimeoutError:
+        return jsonify({"state": task.state, "status": "Processing"}), 202
+    return _finished_task_response(task, user_profile)
+
+
+@api_bp.route("/api/tasks/<task_id>/events", methods=["GET"])
+def task_events(task_id: str):
+    """Server-Sent Events: heartbeats while the task runs, then one result or failure event.
+
+    Headers are sent before the result exists, so nothing is stored in the
+    session; GET /api/tasks/<id> afterwards stores it without waiting.
+    """
+    found = _task_by_handle(task_id)
+    if found is None:
+        return _unknown_task_response()
+    return Response(
+        stream_with_context(_task_events(*found)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _task_events(task, user_profile):
+    deadline = time.monotonic() + TASK_EVENTS_MAX_SECONDS
+    yield b"retry: 1000\n\n"
+    while True:
+        try:
+            task.get(timeout=TASK_EVENTS_HEARTBEAT_SECONDS, propagate=False)
+        except CeleryTimeoutError:
+            if time.monotonic() >= deadline:
+                return
+            yield b": keep-alive\n\n"
+            continue
+        if task.state == "FAILURE":
+            yield b"event: failure\ndata: " + dumps({"state": task.state, "status": str(task.info)}) + b"\n\n"
+            return
+        encoded = resolve_analysis(task.result, user_profile)
+        if encoded is None:
+            yield b"event: failure\ndata: " + dumps({"state": task.state, "status": TASK_RESULT_EXPIRED}) + b"\n\n"
+        else:
+            yield b"event: result\ndata: " + _encode_task_result(task, encoded) + b"\n\n"
+        return
+
+
+def _finished_task_response(task, user_profile):
+    """Response for a finished task; a successful analysis is stored in the session like /analyze does."""
+    if task.state == "FAILURE":
+        return jsonify({"state": task.state, "status": str(task.info)}), 500
+
+    # The task result is an analysis_reference; the analysis itself is read from the cache.
+    encoded = resolve_analysis(task.get(), user_profile)
+    if encoded is None:
+        return jsonify({"state": task.state, "status": TASK_RESULT_EXPIRED}), 410
+    remember_result(encoded)
+
+    return json_response(encoded=_encode_task_result(task, encoded))
+
+
+def _encode_task_result(task, encoded):
+    """{"state", "result"} for a resolved analysis, with its JSON parts sent without re-encoding."""
+    result = encode_object(
+        {
+            "cached": dumps(task.result["cached"]),
+            "guidance_text": dumps(encoded["guidance_text"]),
+            "json_output": encoded["json_output"],
+            "timestamp": dumps(encoded["timestamp"]),
+            "user_profile": encoded["user_profile"],
+        }
+    )
+    return encode_object({"result": result, "state": dumps(task.state)})
+
+
+@api_bp.route("/api/tracks/<path:track>/skill-gaps")
+def get_track_skill_gaps(track: str):
+    return _track_artifact_response(track, "skill-gaps")
+
+
+@api_bp.route("/api/tracks/<path:track>/learning-path")
+def get_track_learning_path(track: str):
+    return _track_artifact_response(track, "learning-path")
+
+
+@api_bp.route("/api/tracks/<path:track>/resume-boosters")
+def get_track_resume_boosters(track: str):
+    return _track_artifact_response(track, "resume-boosters")
+
+
+def _track_artifact_response(track: str, artifact: str):
+    """Build one artifact for any career track from the profile stored with the last analysis."""
+    analysis = current_result()
+    if analysis is None:
+        return jsonify({"success": False, "error": "No analysis data available"}), 404
+    if track not in career_ai.career_tracks:
+        return jsonify({"success": False, "error": f"Unknown career track: {track}"}), 404
+
+    profile = profile_from_summary(analysis["user_profile"])
+    cache_key = build_track_artifact_cache_key(profile, track, artifact)
+    encoded = guidance_cache.get(cache_key)
+
+    cached = encoded is not None
+    if not cached:
+        encoded = build_track_artifact(profile, track, artifact)
+        guidance_cache.set(cache_key, encoded, timeout=GUIDANCE_CACHE_TTL)
+
+    return json_response(
+        encoded=encode_object(
+            {"cached": dumps(cached), TRACK_ARTIFACTS[artifact][0]: encoded, "success": b"true"}
+        )
+    )
+
+
+@api_bp.route("/api/metrics/analysis-pool")
+def get_analysis_pool_metrics():
+    return jsonify(pool_stats())
+
 
-    return jsonify({"state": task.state, "result": result}), 200
+@api_bp.route("/api/metrics/cache")
+def get_cache_metrics():
+    return jsonify({**guidance_cache.stats(), "engine_memo": career_ai.memo_stats()})
 
 
 @api_bp.route("/api/career-tracks")
@@ -119,38 +411,40 @@ def get_skills_route():
 
 @api_bp.route("/api/results")
 def get_results():
-    if "json_output" not in session:
+    analysis = current_result()
+    if analysis is None:
         return jsonify({"success": False, "error": "No results available"}), 404
 
     return jsonify(
         {
             "success": True,
-            "results": session["json_output"],
-            "user_profile": session.get("user_profile", {}),
-            "guidance_text": session.get("guidance_text", ""),
-            "timestamp": session.get("analysis_timestamp", ""),
+            "results": analysis["json_output"],
+            "user_profile": analysis["user_profile"],
+            "guidance_text": analysis["guidance_text"],
+            "timestamp": analysis["timestamp"],
         }
     )
 
 
 @api_bp.route("/api/analysis-history")
 def get_analysis_history():
-    if "json_output" not in session:
+    analysis = current_result()
+    if analysis is None:
         return jsonify({"history": []})
 
     return jsonify(
         {
             "history": [
                 {
-                    "timestamp": session.get("analysis_timestamp", ""),
-                    "user_profile": session.get("user_profile", {}),
+                    "timestamp": analysis["timestamp"],
+                    "user_profile": analysis["user_profile"],
                     "career_recommendations": len(
-                        session["json_output"].get("career_recommendations", [])
+                        analysis["json_output"].get("career_recommendations", [])
                     ),
-                    "top_career": session["json_output"]
+                    "top_career": analysis["json_output"]
                     .get("career_recommendations", [{}])[0]
                     .get("career_track", "")
-                    if session["json_output"].get("career_recommendations")
+                    if analysis["json_output"].get("career_recommendations")
                     else "",
                 }
             ]
@@ -160,10 +454,11 @@ def get_analysis_history():
 
 @api_bp.route("/api/career-stats")
 def get_career_stats():
-    if "json_output" not in session:
+    analysis = current_result()
+    if analysis is None:
         return jsonify({"error": "No analysis data available"}), 404
 
-    recommendations = session["json_output"].get("career_recommendations", [])
+    recommendations = analysis["json_output"].get("career_recommendations", [])
     if not recommendations:
         return jsonify({"error": "No career recommendations available"}), 404
 
@@ -192,27 +487,28 @@ def debug_session():
     return jsonify(
         {
             "session_keys": list(session.keys()),
-            "has_guidance": "guidance_text" in session,
-            "has_json": "json_output" in session,
+            "has_guidance": current_result() is not None,
+            "has_json": current_result() is not None,
         }
     )
 
 
 @api_bp.route("/api/progress")
 def get_progress():
-    if "json_output" not in session:
+    analysis = current_result()
+    if analysis is None:
         return jsonify({"error": "No analysis data available"}), 404
 
-    recommendations = session["json_output"].get("career_recommendations", [])
-    skill_gaps = session["json_output"].get("skill_gap_analysis", [])
-    learning_paths = session["json_output"].get("learning_path", [])
+    recommendations = analysis["json_output"].get("career_recommendations", [])
+    skill_gaps = analysis["json_output"].get("skill_gap_analysis", [])
+    learning_paths = analysis["json_output"].get("learning_path", [])
 
     total_skills_needed = sum(len(gap.get("need_skills", [])) for gap in skill_gaps)
     total_learning_phases = sum(len(path.get("phases", [])) for path in learning_paths)
 
     progress_data = {
         "analysis_completed": True,
-        "analysis_date": session.get("analysis_timestamp", ""),
+        "analysis_date": analysis["timestamp"],
         "career_recommendations_count": len(recommendations),
         "skill_gaps_count": len(skill_gaps),
         "learning_paths_count": len(learning_paths),
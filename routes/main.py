@@ -1,10 +1,11 @@
 import io
-import json
 from datetime import datetime
 
-from flask import Blueprint, current_app, jsonify, redirect, render_template, send_file, session, url_for
+from flask import Blueprint, current_app, jsonify, redirect, render_template, send_file, url_for
 
 from services.report_service import create_pdf_report
+from services.result_store import current_result
+from utils.encoding import dumps
 
 
 main_bp = Blueprint("main", __name__)
@@ -17,24 +18,25 @@ def index():
 
 @main_bp.route("/results")
 def results():
-    if "guidance_text" not in session or "json_output" not in session:
+    if current_result() is None:
         return redirect(url_for("main.index"))
     return render_template("results.html", no_data=False)
 
 
 @main_bp.route("/download/<format>")
 def download(format):
-    if "guidance_text" not in session or "json_output" not in session:
+    analysis = current_result()
+    if analysis is None:
         return jsonify({"error": "No results available"}), 404
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    user_name = session.get("user_profile", {}).get("name", "user")
+    user_name = analysis["user_profile"].get("name") or "user"
     safe_name = "".join(c for c in user_name if c.isalnum() or c in (" ", "-", "_")).rstrip()
     safe_name = safe_name.replace(" ", "_")
 
     if format.lower() == "pdf":
         filename = f"career_guidance_{safe_name}_{timestamp}.pdf"
-        pdf_buffer = create_pdf_report(session.get("user_profile", {}), session.get("json_output", {}))
+        pdf_buffer = create_pdf_report(analysis["user_profile"], analysis["json_output"])
         return send_file(
             pdf_buffer,
             as_attachment=True,
@@ -44,7 +46,7 @@ def download(format):
     if format.lower() == "json":
         filename = f"career_guidance_{safe_name}_{timestamp}.json"
         return send_file(
-            io.BytesIO(json.dumps(session["json_output"], indent=2).encode()),
+            io.BytesIO(dumps(analysis["json_output"], indent=True)),
             as_attachment=True,
             download_name=filename,
             mimetype="application/json",
@@ -0,0 +1,129 @@
+"""
+Warm process pool for CPU-bound analysis.
+
+With ANALYSIS_POOL_SIZE > 0, analyze_profile() hands payloads to a pool of
+worker processes that each keep a warm CareerGuideAI, and the web worker only
+waits for the result (at most ANALYSIS_POOL_TIMEOUT seconds). One web worker
+can then keep every core busy. The default of 0 runs the analysis inline.
+The pool is started on first use, so it is never forked before the web server
+forks its own workers.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Tuple
+
+from services import career_service
+from utils.validation import AnalyzeRequest
+
+
+POOL_SIZE = int(os.environ.get("ANALYSIS_POOL_SIZE", "0"))
+POOL_TIMEOUT = float(os.environ.get("ANALYSIS_POOL_TIMEOUT", "30"))
+
+# Workers start from a clean server process (or a fresh interpreter where
+# forkserver is unavailable) rather than a fork of the web worker, which
+# holds Redis and database sockets and, with threaded workers, other
+# threads' locks.
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+_executor: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+_stats = {"submitted": 0, "completed": 0, "failed": 0, "timed_out": 0, "in_flight": 0, "busy_seconds": 0.0}
+
+
+class AnalysisTimeout(TimeoutError):
+    """Raised when the pool does not return an analysis within POOL_TIMEOUT."""
+
+
+def _init_worker() -> None:
+    # Build the lazily loaded catalog data (learning resources, personalization
+    # tables) now, so the first request each worker takes does not pay for it.
+    career_service.career_ai.learning_resources
+    career_service.career_ai.personalization
+
+
+def _run_analysis(payload_dict: Dict[str, Any]) -> Tuple[str, Dict, Dict, str]:
+    return career_service.analyze_profile(AnalyzeRequest.model_validate(payload_dict))
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=POOL_SIZE, initializer=_init_worker, mp_context=_MP_CONTEXT)
+        return _executor
+
+
+def _finished(future: Future, started: float) -> None:
+    with _lock:
+        _stats["in_flight"] -= 1
+        _stats["busy_seconds"] += time.perf_counter() - started
+        if future.cancelled() or future.exception() is not None:
+            _stats["failed"] += 1
+        else:
+            _stats["completed"] += 1
+
+
+def analyze_profile(payload: AnalyzeRequest, timeout: Optional[float] = None) -> Tuple[str, Dict, Dict, str]:
+    """career_service.analyze_profile, run on the pool when it is enabled."""
+    if POOL_SIZE <= 0:
+        return career_service.analyze_profile(payload)
+
+    executor = _get_executor()
+    started = time.perf_counter()
+    try:
+        future = executor.submit(_run_analysis, payload.model_dump())
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); start a fresh pool for later requests.
+        shutdown(wait=False)
+        raise
+    with _lock:
+        _stats["submitted"] += 1
+        _stats["in_flight"] += 1
+    future.add_done_callback(lambda done: _finished(done, started))
+
+    try:
+        return future.result(timeout=POOL_TIMEOUT if timeout is None else timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        with _lock:
+            _stats["timed_out"] += 1
+        raise AnalysisTimeout("Analysis did not finish in time") from None
+    except BrokenProcessPool:
+        shutdown(wait=False)
+        raise
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Pool size, queue depth and request counters for this web worker."""
+    with _lock:
+        stats = dict(_stats)
+        started = _executor is not None
+    finished = stats["completed"] + stats["failed"]
+    busy_seconds = stats.pop("busy_seconds")
+    return {
+        "enabled": POOL_SIZE > 0,
+        "started": started,
+        "workers": POOL_SIZE,
+        "timeout_seconds": POOL_TIMEOUT,
+        # Submitted payloads no worker has picked up yet.
+        "queue_depth": max(0, stats["in_flight"] - POOL_SIZE),
+        **stats,
+        "avg_latency_ms": round(busy_seconds / finished * 1000, 2) if finished else 0.0,
+    }
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop the pool; the next analysis starts a new one."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
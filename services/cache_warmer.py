@@ -0,0 +1,127 @@
+"""
+Guidance cache pre-warming from a request log.
+
+Reads /analyze payloads (NDJSON or a JSON array), ranks the canonical
+profiles by how often they were requested, and writes the analyses of the
+most frequent ones into the guidance cache in batches: one MGET to skip
+entries that are already cached and one pipelined write per batch. Run it
+after a deploy or a Redis flush:
+
+    python -m services.cache_warmer requests.jsonl --limit 2000 --rate 500
+
+or let Celery beat run warm_guidance_cache_task (see tasks.py).
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from services.career_service import (
+    GUIDANCE_CACHE_TTL,
+    analyze_profiles,
+    build_cache_key,
+    encode_analysis,
+    guidance_cache,
+    request_profile,
+)
+from utils.encoding import iter_json_records
+from utils.validation import AnalyzeRequest, ValidationError
+
+
+def read_request_log(path: str, stats: Optional[Dict[str, int]] = None) -> Iterator[AnalyzeRequest]:
+    """Valid payloads from a request log; invalid records are counted in stats["invalid"] and skipped."""
+    with open(path, "rb") as f:
+        for record in iter_json_records(f):
+            try:
+                yield AnalyzeRequest.model_validate(record)
+            except ValidationError:
+                if stats is not None:
+                    stats["invalid"] = stats.get("invalid", 0) + 1
+
+
+def rank_profiles(payloads: Iterable[AnalyzeRequest],
+                  limit: Optional[int] = None) -> List[Tuple[str, AnalyzeRequest, int]]:
+    """(cache key, one payload, request count) for the most requested canonical profiles, most frequent first."""
+    counts: Counter = Counter()
+    examples: Dict[str, AnalyzeRequest] = {}
+    for payload in payloads:
+        key = build_cache_key(request_profile(payload))
+        counts[key] += 1
+        examples.setdefault(key, payload)
+    return [(key, examples[key], count) for key, count in counts.most_common(limit)]
+
+
+def warm_cache(payloads: Iterable[AnalyzeRequest], limit: Optional[int] = 1000, batch_size: int = 100,
+               rate: Optional[float] = None, timeout: int = GUIDANCE_CACHE_TTL, cache: Any = guidance_cache,
+               progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """Analyze and cache the `limit` most frequent profiles among payloads.
+
+    rate caps the analyses per second (None: as fast as possible), so warming
+    does not starve live traffic. progress is called after every batch.
+    """
+    ranked = rank_profiles(payloads, limit)
+    stats: Dict[str, Any] = {
+        "profiles": len(ranked),
+        "requests_covered": sum(count for _, _, count in ranked),
+        "processed": 0,
+        "already_cached": 0,
+        "warmed": 0,
+        "seconds": 0.0,
+    }
+    started = time.perf_counter()
+    batches = iter(ranked)
+    while True:
+        batch = list(islice(batches, batch_size))
+        if not batch:
+            break
+        keys = [key for key, _, _ in batch]
+        missing = [(key, payload) for (key, payload, _), value in zip(batch, cache.get_many(*keys)) if value is None]
+        if missing:
+            analyses = analyze_profiles([payload for _, payload in missing])
+            cache.set_many(
+                {key: encode_analysis(*analysis) for (key, _), analysis in zip(missing, analyses)},
+                timeout=timeout,
+            )
+        stats["processed"] += len(batch)
+        stats["already_cached"] += len(batch) - len(missing)
+        stats["warmed"] += len(missing)
+
+        elapsed = time.perf_counter() - started
+        if rate and stats["warmed"] / rate > elapsed:
+            time.sleep(stats["warmed"] / rate - elapsed)
+        stats["seconds"] = time.perf_counter() - started
+        if progress is not None:
+            progress(dict(stats))
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+
+def _print_progress(stats: Dict[str, Any]) -> None:
+    print(f"  {stats['processed']:>6}/{stats['profiles']} profiles | {stats['warmed']} warmed, "
+          f"{stats['already_cached']} already cached | {stats['seconds']:.1f}s", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Pre-warm the guidance cache from a request log")
+    parser.add_argument("log", help="request log: NDJSON or a JSON array of /analyze payloads")
+    parser.add_argument("--limit", type=int, default=1000, help="number of most frequent profiles to warm")
+    parser.add_argument("--batch-size", type=int, default=100, help="profiles analyzed and written per batch")
+    parser.add_argument("--rate", type=float, default=None, help="maximum analyses per second")
+    args = parser.parse_args(argv)
+
+    from tasks import cache_app
+
+    log_stats: Dict[str, int] = {}
+    with cache_app.app_context():
+        stats = warm_cache(read_request_log(args.log, log_stats), limit=args.limit, batch_size=args.batch_size,
+                           rate=args.rate, progress=_print_progress)
+    print(f"✅ Warmed {stats['warmed']} of the {stats['profiles']} most requested profiles "
+          f"({stats['requests_covered']} logged requests, {log_stats.get('invalid', 0)} invalid) "
+          f"in {stats['seconds']:.1f}s; cache errors: {guidance_cache.stats()['l2']['errors']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,57 @@
+import os
+import secrets
 from datetime import datetime
 from hashlib import sha256
-import json
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import NAMESPACE_URL, uuid5
 
-from career_guide_ai import CareerGuideAI
+from career_guide_ai import CareerGuideAI, NormalizedProfile, UserProfile, serializer_for
+from utils.encoding import dumps
+from utils.extensions import cache
+from utils.tiered_cache import TieredCache
 from utils.validation import AnalyzeRequest
 
 
 career_ai = CareerGuideAI()
 
+# Seconds an analysis stays in Redis; Celery task results, which only point at
+# cached analyses, expire with them.
+GUIDANCE_CACHE_TTL = int(os.environ.get("GUIDANCE_CACHE_TTL", "3600"))
 
-def analyze_profile(payload: AnalyzeRequest) -> Tuple[str, Dict, Dict, str]:
-    user_input = (
-        f"Name: {payload.name}\n"
-        f"Education: {payload.education}\n"
-        f"Experience: {payload.experience}\n"
-        f"Skills: {', '.join(payload.skills)}\n"
-        f"Interests: {', '.join(payload.interests)}\n"
-        f"Learning Style: {payload.learning_style}\n"
-    )
+# Analyses and track artifacts: per-process LRU in front of Redis, namespaced by
+# catalog version so a new catalog never serves results computed from the old one.
+# Values of GUIDANCE_CACHE_COMPRESS_MIN bytes or more are compressed in Redis.
+guidance_cache = TieredCache(
+    cache,
+    namespace=lambda: f"catalog:{career_ai.catalog.version}",
+    maxsize=int(os.environ.get("GUIDANCE_CACHE_L1_SIZE", "1024")),
+    ttl=float(os.environ.get("GUIDANCE_CACHE_L1_TTL", "300")),
+    compress_min_size=int(os.environ.get("GUIDANCE_CACHE_COMPRESS_MIN", "1024")),
+)
 
-    user_profile = career_ai.parse_user_input(user_input)
+
+def analyze_profile(payload: AnalyzeRequest) -> Tuple[str, Dict, Dict, str]:
+    # The payload is already validated, so build the profile directly instead
+    # of formatting it as text for parse_user_input.
+    user_profile = UserProfile.from_request(payload)
     guidance_text, json_output = career_ai.generate_guidance(user_profile)
+    timestamp = datetime.now().isoformat()
+    return guidance_text, json_output, profile_summary(user_profile), timestamp
+
+
+def analyze_profiles(payloads: List[AnalyzeRequest]) -> List[Tuple[str, Dict, Dict, str]]:
+    """analyze_profile for many payloads, scoring them all in one vectorized pass."""
+    profiles = [UserProfile.from_request(payload) for payload in payloads]
+    results = career_ai.analyze_batch(profiles, sections=("text", "json"))
+    timestamp = datetime.now().isoformat()
+    return [
+        (result.text, result.json, profile_summary(profile), timestamp)
+        for profile, result in zip(profiles, results)
+    ]
+
 
-    user_profile_payload = {
+def profile_summary(user_profile: UserProfile) -> Dict:
+    return {
         "name": user_profile.name,
         "education": user_profile.education_level,
         "experience": user_profile.experience_level,
@@ -31,14 +59,163 @@ def analyze_profile(payload: AnalyzeRequest) -> Tuple[str, Dict, Dict, str]:
         "interests": user_profile.interests,
     }
 
-    timestamp = datetime.now().isoformat()
-    return guidance_text, json_output, user_profile_payload, timestamp
+
+def stream_guidance(payload: AnalyzeRequest) -> Iterator[str]:
+    return career_ai.stream_guidance(UserProfile.from_request(payload))
+
+
+def request_profile(payload: AnalyzeRequest) -> NormalizedProfile:
+    return career_ai.normalize_profile(UserProfile.from_request(payload))
+
+
+def build_cache_key(profile: NormalizedProfile) -> str:
+    """Analyses are keyed by the canonical profile only, so skill spelling and order, name and interests
+    do not split the cache; personalize_analysis adds those back per request."""
+    return f"ai:guidance:v3:{profile_fingerprint(profile)}"
+
+
+def analysis_task_id(cache_key: str) -> str:
+    """Celery task id for analyzing a cache key, the same for every equivalent submission.
+
+    Anyone can compute it from a guessed profile, so it never leaves the
+    server: submitters poll through an issue_task_handle() handle instead.
+    """
+    return str(uuid5(NAMESPACE_URL, cache_key))
+
+
+def task_handle_key(handle: str) -> str:
+    return f"ai:task-handle:{handle}"
+
+
+def issue_task_handle(task_id: str, profile: NormalizedProfile) -> str:
+    """A random id one submitter polls task_id by, mapped to that submitter's own profile summary."""
+    handle = secrets.token_urlsafe(16)
+    guidance_cache.set(
+        task_handle_key(handle),
+        {"task_id": task_id, "user_profile": profile_summary(profile.profile)},
+        timeout=GUIDANCE_CACHE_TTL,
+    )
+    return handle
+
+
+def task_for_handle(handle: str) -> Optional[Dict[str, Any]]:
+    """{"task_id", "user_profile"} for an issued handle, or None for an unknown or expired one."""
+    return guidance_cache.get(task_handle_key(handle))
+
+
+def inflight_key(cache_key: str) -> str:
+    """Marker held while a task for cache_key is queued or running."""
+    return f"{cache_key}:inflight"
+
+
+def encode_analysis(guidance_text: str, json_output: Dict, user_profile: Dict, timestamp: str) -> Dict[str, Any]:
+    """Cache form of an analysis: the parts shared by every profile with the same cache key, encoded once."""
+    header = career_ai.render_profile_header(profile_from_summary(user_profile).profile)
+    results = {key: value for key, value in json_output.items() if key != "user_summary"}
+    return {
+        "report": guidance_text[len(header):],
+        "results": dumps(results, sort_keys=True),
+        "timestamp": timestamp,
+    }
+
+
+def personalize_analysis(shared: Dict[str, Any], profile: NormalizedProfile) -> Dict[str, Any]:
+    """A cached analysis for this request's profile, with the JSON parts encoded."""
+    summary = dumps(career_ai.user_summary(profile), sort_keys=True)
+    return {
+        "guidance_text": career_ai.render_profile_header(profile.profile) + shared["report"],
+        # "user_summary" sorts after every other key, so appending it keeps the keys sorted.
+        "json_output": shared["results"][:-1] + b',"user_summary":' + summary + b"}",
+        "user_profile": dumps(profile_summary(profile.profile), sort_keys=True),
+        "timestamp": shared["timestamp"],
+    }
+
+
+def cached_analyses(payloads: List[AnalyzeRequest],
+                    timeout: int = GUIDANCE_CACHE_TTL) -> List[Tuple[NormalizedProfile, str, Dict[str, Any], bool]]:
+    """(profile, cache key, shared analysis, whether it was cached) for each payload.
+
+    The whole list costs one cache multi-get; the misses are analyzed in one
+    batch, each canonical profile once, and written back with one multi-set.
+    """
+    profiles = [request_profile(payload) for payload in payloads]
+    keys = [build_cache_key(profile) for profile in profiles]
+    shared = dict(zip(keys, guidance_cache.get_many(*keys)))
+
+    misses: Dict[str, AnalyzeRequest] = {}
+    for payload, key in zip(payloads, keys):
+        if shared[key] is None and key not in misses:
+            misses[key] = payload
+    if misses:
+        fresh = {}
+        for key, analysis in zip(misses, analyze_profiles(list(misses.values()))):
+            shared[key] = fresh[key] = encode_analysis(*analysis)
+        guidance_cache.set_many(fresh, timeout=timeout)
+    return [(profile, key, shared[key], key not in misses) for profile, key in zip(profiles, keys)]
+
+
+def analysis_reference(cache_key: str, shared: Dict[str, Any], cached: bool) -> Dict[str, Any]:
+    """Task result for an analysis stored in guidance_cache: where to find it, not the analysis.
+
+    It carries nothing about who submitted it, since equivalent submissions share the task.
+    """
+    return {
+        "cached": cached,
+        "cache_key": cache_key,
+        "timestamp": shared["timestamp"],
+    }
+
+
+def resolve_analysis(reference: Dict[str, Any], user_profile: Dict) -> Optional[Dict[str, Any]]:
+    """The analysis an analysis_reference points at, personalized for user_profile (a profile_summary),
+    or None once it has left the cache."""
+    shared = guidance_cache.get(reference["cache_key"])
+    if shared is None:
+        return None
+    return personalize_analysis(shared, profile_from_summary(user_profile))
+
+
+# Per-track artifacts: response key and builder taking (normalized profile, track).
+TRACK_ARTIFACTS = {
+    "skill-gaps": ("skill_gap_analysis", lambda profile, track: career_ai.analyze_skill_gaps(profile, track)),
+    "learning-path": ("learning_path", lambda profile, track: career_ai.generate_learning_path(track, profile)),
+    "resume-boosters": ("resume_boosters", lambda profile, track: career_ai.generate_resume_boosters(track)),
+}
+
+
+def profile_from_summary(user_profile: Dict) -> NormalizedProfile:
+    """Rebuild the normalized profile from the user_profile summary stored with an analysis."""
+    return career_ai.normalize_profile(
+        UserProfile(
+            name=user_profile.get("name"),
+            education_level=user_profile.get("education"),
+            experience_level=user_profile.get("experience"),
+            skills=list(user_profile.get("skills") or []),
+            interests=list(user_profile.get("interests") or []),
+        )
+    )
+
+
+def profile_fingerprint(profile: NormalizedProfile) -> str:
+    """Hash of everything the per-track artifacts depend on: canonical skills and levels."""
+    raw = dumps([career_ai.catalog.version, sorted(profile.skills), profile.experience_level, profile.education_level])
+    return sha256(raw).hexdigest()
+
+
+def build_track_artifact_cache_key(profile: NormalizedProfile, track: str, artifact: str) -> str:
+    if artifact == "resume-boosters":
+        # Boosters depend on the track alone, so every profile shares them.
+        scope = career_ai.catalog.version
+    else:
+        scope = profile_fingerprint(profile)
+    return f"ai:track:{artifact}:{scope}:{sha256(track.encode()).hexdigest()[:16]}"
 
 
-def build_cache_key(payload: AnalyzeRequest) -> str:
-    normalized = payload.model_dump()
-    raw = json.dumps(normalized, sort_keys=True)
-    return f"ai:guidance:{sha256(raw.encode()).hexdigest()}"
+def build_track_artifact(profile: NormalizedProfile, track: str, artifact: str) -> bytes:
+    """Encoded JSON for one artifact of one career track."""
+    builder = TRACK_ARTIFACTS[artifact][1]
+    result = builder(profile, track)
+    return dumps(serializer_for(type(result))(result), sort_keys=True)
 
 
 def get_career_tracks() -> List[Dict]:
@@ -0,0 +1,118 @@
+"""
+Server-side store for the analysis behind the results pages.
+
+The session cookie carries only an opaque result id instead of the report and
+its JSON (several KB, signed and re-sent with every request, and able to pass
+the 4 KB cookie limit). Analyses are stored as zlib-compressed JSON for
+RESULT_STORE_TTL seconds (default one day) in one of two backends, chosen by
+RESULT_STORE_BACKEND:
+
+- redis (default): the Flask-Caching Redis every web worker shares
+- file: a cachelib FileSystemCache under RESULT_STORE_DIR, for a single host.
+  FileSystemCache unpickles what it finds there, so the directory must be set
+  explicitly, owned by the app's user and not writable by anyone else.
+"""
+
+import os
+import secrets
+import zlib
+from typing import Any, Dict, Optional
+
+from cachelib import FileSystemCache
+from flask import g, session
+
+from utils.encoding import dumps, encode_object, loads
+from utils.extensions import cache
+from utils.filesystem import is_private_dir
+
+
+RESULT_STORE_BACKEND = os.environ.get("RESULT_STORE_BACKEND", "redis")
+RESULT_STORE_DIR = os.environ.get("RESULT_STORE_DIR")
+RESULT_STORE_TTL = int(os.environ.get("RESULT_STORE_TTL", "86400"))
+# Most result files kept by the file backend before the oldest are pruned.
+RESULT_STORE_FILE_LIMIT = int(os.environ.get("RESULT_STORE_FILE_LIMIT", "10000"))
+
+
+class ResultStore:
+    """Analyses by result id in a cachelib-style backend (get/set/delete with timeouts).
+
+    Backend errors (Redis down, unwritable directory) are swallowed like the
+    guidance cache's: save() returns None and load() returns None.
+    """
+
+    def __init__(self, backend: Any, ttl: int = RESULT_STORE_TTL):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(result_id: str) -> str:
+        return f"result:{result_id}"
+
+    def save(self, encoded: Dict[str, Any]) -> Optional[str]:
+        """Store an analysis in personalize_analysis' form (JSON parts as bytes); its new id, or None on failure."""
+        blob = encode_object(
+            {
+                "guidance_text": dumps(encoded["guidance_text"]),
+                "json_output": encoded["json_output"],
+                "timestamp": dumps(encoded["timestamp"]),
+                "user_profile": encoded["user_profile"],
+            }
+        )
+        result_id = secrets.token_urlsafe(16)
+        try:
+            stored = self.backend.set(self._key(result_id), zlib.compress(blob, 1), timeout=self.ttl)
+        except Exception:
+            return None
+        return result_id if stored is not False else None
+
+    def load(self, result_id: str) -> Optional[Dict[str, Any]]:
+        """The analysis with its JSON parts decoded, or None if it expired or the backend failed."""
+        try:
+            blob = self.backend.get(self._key(result_id))
+        except Exception:
+            return None
+        if blob is None:
+            return None
+        return loads(zlib.decompress(blob))
+
+    def delete(self, result_id: str) -> None:
+        try:
+            self.backend.delete(self._key(result_id))
+        except Exception:
+            pass
+
+
+def _default_backend() -> Any:
+    if RESULT_STORE_BACKEND == "file":
+        if not RESULT_STORE_DIR:
+            raise ValueError("RESULT_STORE_BACKEND=file needs RESULT_STORE_DIR")
+        os.makedirs(RESULT_STORE_DIR, mode=0o700, exist_ok=True)
+        if not is_private_dir(RESULT_STORE_DIR):
+            raise ValueError(f"RESULT_STORE_DIR {RESULT_STORE_DIR} must be owned by this user and not "
+                             f"writable by group or others")
+        return FileSystemCache(RESULT_STORE_DIR, threshold=RESULT_STORE_FILE_LIMIT, default_timeout=RESULT_STORE_TTL)
+    if RESULT_STORE_BACKEND != "redis":
+        raise ValueError(f"Unknown RESULT_STORE_BACKEND: {RESULT_STORE_BACKEND}")
+    return cache
+
+
+result_store = ResultStore(_default_backend())
+
+
+def remember_result(encoded: Dict[str, Any]) -> None:
+    """Store an analysis and point this session at it, replacing the previous one."""
+    previous = session.pop("result_id", None)
+    if previous:
+        result_store.delete(previous)
+    result_id = result_store.save(encoded)
+    if result_id is not None:
+        session["result_id"] = result_id
+    g.pop("current_result", None)
+
+
+def current_result() -> Optional[Dict[str, Any]]:
+    """The analysis this session's result id points at, read once per request."""
+    if "current_result" not in g:
+        result_id = session.get("result_id")
+        g.current_result = result_store.load(result_id) if result_id else None
+    return g.current_result
@@ -3,35 +3,92 @@ import os
 from celery import Celery
 from flask import Flask
 
-from services.career_service import analyze_profile, build_cache_key
+from services.cache_warmer import read_request_log, warm_cache
+from services.career_service import (
+    GUIDANCE_CACHE_TTL,
+    analysis_reference,
+    build_cache_key,
+    cached_analyses,
+    guidance_cache,
+    inflight_key,
+    request_profile,
+)
 from utils.extensions import cache
-from utils.validation import AnalyzeRequest
+from utils.validation import AnalyzeRequest, ValidationError
 
 
 redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
 celery = Celery("career_ai", broker=redis_url, backend=redis_url)
+# Results only reference cached analyses, so they are dropped when those expire.
+celery.conf.result_expires = GUIDANCE_CACHE_TTL
+
+# With CACHE_WARM_LOG set, beat re-warms the guidance cache from that request log.
+if os.environ.get("CACHE_WARM_LOG"):
+    celery.conf.beat_schedule = {
+        "warm-guidance-cache": {
+            "task": "warm_guidance_cache_task",
+            "schedule": float(os.environ.get("CACHE_WARM_INTERVAL", "3600")),
+        }
+    }
 
 cache_app = Flask("career_ai_cache")
 cache_app.config["CACHE_TYPE"] = "RedisCache"
 cache_app.config["CACHE_REDIS_URL"] = redis_url
-cache_app.config["CACHE_DEFAULT_TIMEOUT"] = 3600
+cache_app.config["CACHE_DEFAULT_TIMEOUT"] = GUIDANCE_CACHE_TTL
 cache.init_app(cache_app)
 
 
 @celery.task(name="generate_guidance_task")
 def generate_guidance_task(payload_dict):
+    """Analyze one payload into the guidance cache.
+
+    Returns an analysis_reference rather than the analysis, so the result
+    backend holds a few hundred bytes instead of a second copy of the report;
+    resolve_analysis() reads it back from the cache. Releases the in-flight
+    marker /api/analyze/async took, whether the analysis succeeds or not.
+    """
     payload = AnalyzeRequest.model_validate(payload_dict)
-    cache_key = build_cache_key(payload)
-    cached = cache.get(cache_key)
-    if cached:
-        return {"cached": True, **cached}
-
-    guidance_text, json_output, user_profile, timestamp = analyze_profile(payload)
-    result = {
-        "guidance_text": guidance_text,
-        "json_output": json_output,
-        "user_profile": user_profile,
-        "timestamp": timestamp,
-    }
-    cache.set(cache_key, result, timeout=3600)
-    return {"cached": False, **result}
+    cache_key = build_cache_key(request_profile(payload))
+    # Flask-Caching reaches Redis through the current app.
+    with cache_app.app_context():
+        try:
+            (_, cache_key, shared, cached), = cached_analyses([payload])
+        finally:
+            guidance_cache.delete(inflight_key(cache_key))
+    return analysis_reference(cache_key, shared, cached)
+
+
+@celery.task(name="generate_guidance_batch_task")
+def generate_guidance_batch_task(payload_dicts):
+    """generate_guidance_task for a chunk of payloads in one message, with one cache read and one write.
+
+    Returns a compact status per payload; analyses stay in the guidance cache
+    under each item's cache_key.
+    """
+    items = [None] * len(payload_dicts)
+    valid = []
+    for index, payload_dict in enumerate(payload_dicts):
+        try:
+            valid.append((index, AnalyzeRequest.model_validate(payload_dict)))
+        except ValidationError:
+            items[index] = {"status": "invalid"}
+
+    with cache_app.app_context():
+        analyses = cached_analyses([payload for _, payload in valid])
+    for (index, _), (_, cache_key, _, cached) in zip(valid, analyses):
+        items[index] = {"status": "cached" if cached else "computed", "cache_key": cache_key}
+    return items
+
+
+@celery.task(name="warm_guidance_cache_task", bind=True)
+def warm_guidance_cache_task(self, log_path=None, limit=None, rate=None):
+    log_path = log_path or os.environ["CACHE_WARM_LOG"]
+    limit = limit or int(os.environ.get("CACHE_WARM_LIMIT", "1000"))
+    rate = rate or float(os.environ.get("CACHE_WARM_RATE", "0")) or None
+    with cache_app.app_context():
+        return warm_cache(
+            read_request_log(log_path),
+            limit=limit,
+            rate=rate,
+            progress=lambda stats: self.update_state(state="PROGRESS", meta=stats),
+        )
@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the CareerGuideAI engine
+"""
+
+import json
+import os
+import random
+import tempfile
+
+import career_guide_ai
+import catalog as catalog_module
+from catalog import CatalogError, load_catalog
+from dataclasses import fields, is_dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from career_guide_ai import CareerGuideAI, UserProfile, serializer_for
+from utils.validation import AnalyzeRequest
+
+
+def legacy_normalize(skill_normalization, skills):
+    """Reference implementation of the original linear normalize_skills scan."""
+    normalized = []
+    for skill in skills:
+        skill_lower = skill.lower().strip()
+        for standard, variants in skill_normalization.items():
+            if skill_lower in variants or skill_lower == standard:
+                normalized.append(standard)
+                break
+        else:
+            normalized.append(skill_lower)
+    return sorted(set(normalized))
+
+
+def test_normalize_skills_matches_linear_scan():
+    """The alias index resolves every alias exactly like the original scan"""
+    career_ai = CareerGuideAI()
+    skills = [alias.upper() for variants in career_ai.skill_normalization.values() for alias in variants]
+    skills += list(career_ai.skill_normalization) + [" Rust ", "go", ""]
+
+    for skill in skills:
+        assert sorted(career_ai.normalize_skills([skill])) == legacy_normalize(career_ai.skill_normalization, [skill])
+    assert sorted(career_ai.normalize_skills(skills)) == legacy_normalize(career_ai.skill_normalization, skills)
+
+
+def test_alias_collisions_reported():
+    """Aliases that shadow catalog skills are reported with their resolution first"""
+    career_ai = CareerGuideAI()
+    assert career_ai.alias_collisions["programming"] == ["python", "programming"]
+    assert career_ai.alias_collisions["docker"] == ["cloud", "docker"]
+    assert "python" not in career_ai.alias_collisions
+
+
+def test_rebuild_skill_index():
+    """Taxonomy edits take effect after rebuild_skill_index"""
+    career_ai = CareerGuideAI()
+    career_ai.skill_normalization = {
+        **career_ai.skill_normalization,
+        "rust": ["rust", "rustlang"],
+        "golang": ["go", "rust"],
+    }
+    career_ai.rebuild_skill_index()
+
+    assert career_ai.normalize_skills(["RustLang"]) == ["rust"]
+    assert career_ai.alias_collisions["rust"] == ["rust", "golang"]
+
+
+def test_parse_user_input_fields():
+    """Every profile field is extracted from a labelled profile"""
+    career_ai = CareerGuideAI()
+    profile = career_ai.parse_user_input(
+        "Name: John Smith\n"
+        "Education: Masters in Computer Science\n"
+        "Experience: Junior level\n"
+        "Skills: Python, SQL, machine learning\n"
+        "Interests: AI, web development\n"
+    )
+
+    assert profile.name == "John Smith"
+    assert profile.education_level == "Master's Degree"
+    assert profile.experience_level == "junior"
+    assert {"Python", "SQL", "machine learning", "python", "sql", "Junior level"} <= set(profile.skills)
+    assert sorted(profile.interests) == ["AI", "web development"]
+
+
+def test_parse_user_input_word_boundaries():
+    """Aliases only match whole words, including multi-word and punctuated ones"""
+    career_ai = CareerGuideAI()
+    profile = career_ai.parse_user_input("I am happy with my mlops role. Tools: Node.js, CI/CD and power  bi")
+
+    assert "py" not in profile.skills
+    assert "ml" not in profile.skills
+    assert {"node.js", "ci/cd", "power bi"} <= set(profile.skills)
+
+
+def test_parse_user_input_keyword_priority():
+    """Education and experience keep the keyword table priority"""
+    career_ai = CareerGuideAI()
+    profile = career_ai.parse_user_input("PhD candidate, previously a senior engineer and high school teacher")
+
+    assert profile.education_level == "High School"
+    assert profile.experience_level == "senior"
+
+
+class CountingPattern:
+    """Wraps a compiled pattern and counts the characters its searches cover."""
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.scanned = 0
+
+    def search(self, text, start=0, end=None):
+        end = len(text) if end is None else end
+        self.scanned += end - start
+        return self.pattern.search(text, start, end)
+
+
+def test_parse_user_input_scans_labelled_values_once():
+    """Labels inside one long unpunctuated sentence do not rescan the rest of it"""
+    extractor = CareerGuideAI().extractor
+    for repeats in (100, 1000):
+        text = "i like python and have experience with sql, " * repeats
+        extractor._VALUE_END = CountingPattern(career_guide_ai.ProfileExtractor._VALUE_END)
+        profile = extractor.extract(text)
+        assert extractor._VALUE_END.scanned <= len(text)
+        assert {"python", "sql", "with sql"} <= set(profile.skills)
+        assert profile.interests == ["python and have"]
+
+
+def test_profile_from_request():
+    """Structured requests become profiles without the free-text round-trip"""
+    profile = UserProfile.from_request(AnalyzeRequest(
+        name="Jordan Lee",
+        education="Master's degree in Computer Science",
+        experience="Mid level",
+        skills="Python, SQL, python, Docker",
+        interests=["data platforms"],
+    ))
+
+    assert profile.name == "Jordan Lee"
+    assert profile.education_level == "Master's Degree"
+    assert profile.experience_level == "mid"
+    assert profile.skills == ["Python", "SQL", "Docker"]
+    assert profile.interests == ["data platforms"]
+    assert profile.learning_style is None
+
+    # Unrecognized levels are kept verbatim rather than dropped
+    profile = UserProfile.from_request({"name": "Sam", "education": "Bootcamp graduate", "experience": "",
+                                        "skills": ["Figma"]})
+    assert profile.education_level == "Bootcamp graduate"
+    assert profile.experience_level is None
+    assert UserProfile.from_request({"education": "Intermediate"}).education_level == "Intermediate"
+
+    career_ai = CareerGuideAI()
+    text, output = career_ai.generate_guidance_from_fields(name="Sam", education="PhD", skills=["User research", "Prototyping"])
+    assert output["user_summary"]["education_level"] == "PhD"
+    assert output["career_recommendations"][0]["career_track"] == "UX/UI Designer"
+    assert "**Skills Identified:** User research, Prototyping" in text
+
+
+def test_score_batch_matches_calculate_match_score():
+    """Vectorized, array and bitset batch scores equal the per-profile scores"""
+    career_ai = CareerGuideAI()
+    pool = [alias for variants in career_ai.skill_normalization.values() for alias in variants]
+    pool += [skill for data in career_ai.career_tracks.values() for skill in data["core_skills"]]
+    pool += ["rust", "go", "scala", "haskell", "elixir", "ocaml", "zig"]
+    rng = random.Random(3)
+    profiles = [UserProfile(skills=rng.sample(pool, rng.randint(0, 30))) for _ in range(500)]
+
+    expected = []
+    for profile in profiles:
+        normalized = career_ai.normalize_skills(profile.skills)
+        expected.append({
+            career: career_ai.calculate_match_score(normalized, data["core_skills"])
+            for career, data in career_ai.career_tracks.items()
+        })
+
+    assert career_ai.score_batch(profiles, chunk_size=128) == expected
+    normalized = [career_ai.normalize_profile(profile) for profile in profiles]
+    assert career_ai.score_batch(normalized) == expected
+
+    scores, track_names = career_ai.score_matrix(profiles, chunk_size=128)
+    assert scores.shape == (len(profiles), len(career_ai.career_tracks))
+    assert track_names == list(career_ai.career_tracks)
+    assert [dict(zip(track_names, row)) for row in scores.tolist()] == expected
+    assert career_ai.score_matrix([])[0].shape == (0, len(track_names))
+
+    numpy_module = career_guide_ai.np
+    career_guide_ai.np = None
+    try:
+        assert career_ai.score_batch(profiles) == expected
+        assert career_ai.score_batch(normalized) == expected
+    finally:
+        career_guide_ai.np = numpy_module
+
+
+def test_recommendations_top_k_and_tie_break():
+    """Top-k keeps the best scores and breaks ties by demand, then name"""
+    career_ai = CareerGuideAI()
+    profile = UserProfile(skills=["Python", "SQL", "statistics", "ML", "data analysis", "pytorch"])
+
+    recommendations = career_ai.generate_career_recommendations(profile, k=3)
+    assert [rec.career_track for rec in recommendations] == ["Data Scientist", "AI/ML Engineer", "Product Manager"]
+    assert recommendations[0].match_score == 100
+    assert len(career_ai.generate_career_recommendations(profile)) == 5
+
+    tied = {career: 50 for career in career_ai.career_tracks}
+    ranked = [career for career, _ in career_ai.select_top_tracks(tied, k=len(tied))]
+    future = [career_ai.career_tracks[career]["future_demand"] for career in ranked]
+    assert future == sorted(future, reverse=True)
+    assert ranked[:2] == ["AI/ML Engineer", "Data Scientist"]
+
+
+def test_guidance_normalizes_skills_once():
+    """generate_guidance normalizes a profile once and every stage reuses it"""
+    career_ai = CareerGuideAI()
+    profile = UserProfile(name="Ada", experience_level="junior", skills=["Python", "SQL", "ML", "Docker", "Rust"])
+    expected_text, expected_json = career_ai.generate_guidance(profile)
+
+    calls = []
+    normalize_skills = career_ai.normalize_skills
+    career_ai.normalize_skills = lambda skills: calls.append(skills) or normalize_skills(skills)
+    text, output = career_ai.generate_guidance(profile)
+    assert len(calls) == 1
+    assert text == expected_text
+    assert sorted(output["user_summary"]["skills_normalized"]) == sorted(expected_json["user_summary"]["skills_normalized"])
+
+    normalized = career_ai.normalize_profile(profile)
+    assert career_ai.normalize_profile(normalized) is normalized
+    assert normalized.skill_set == {"python", "sql", "machine learning", "cloud", "rust"}
+    assert career_ai.score_tracks(normalized) == career_ai.score_tracks(normalized.skills)
+    assert career_ai.analyze_skill_gaps(normalized, "Data Scientist") == career_ai.analyze_skill_gaps(profile, "Data Scientist")
+
+    # A profile normalized against another vocabulary is normalized again
+    career_ai.rebuild_skill_index()
+    assert career_ai.normalize_profile(normalized) is not normalized
+
+
+def test_analyze_builds_only_requested_sections():
+    """analyze computes the requested sections and defers the rest to first access"""
+    career_ai = CareerGuideAI()
+    profile = UserProfile(name="Ada", experience_level="junior", skills=["Python", "SQL", "ML"])
+
+    built = []
+    generate_learning_path = career_ai.generate_learning_path
+    career_ai.generate_learning_path = lambda *args: built.append(args) or generate_learning_path(*args)
+
+    result = career_ai.analyze(profile, sections=["recommendations"])
+    assert "recommendations" in vars(result) and "text" not in vars(result)
+    assert [rec.career_track for rec in result.recommendations] == [
+        rec.career_track for rec in career_ai.generate_career_recommendations(profile)]
+    assert result.scores == career_ai.score_tracks(career_ai.normalize_skills(profile.skills))
+    assert not built
+
+    assert result.json["learning_path"][0]["career_track"] == result.top_career
+    assert len(built) == 1
+    assert result.text == career_ai.generate_guidance(profile)[0]
+    assert len(built) == 1  # the second analysis reuses the memoized learning path
+
+    batch = career_ai.analyze_batch([profile, UserProfile(skills=["figma", "user research"])], sections=["json"])
+    assert batch[0].json == result.json
+    assert batch[1].scores == career_ai.score_tracks(career_ai.normalize_skills(["figma", "user research"]))
+
+    try:
+        career_ai.analyze(profile, sections=["report"])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError")
+
+
+def plain(value):
+    """asdict for JSON: dataclasses and mappings become dicts, tuples become lists."""
+    if is_dataclass(value):
+        return {field.name: plain(getattr(value, field.name)) for field in fields(value)}
+    if isinstance(value, Mapping):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    return value
+
+
+def test_result_serializers_match_asdict():
+    """Slotted result types serialize to the structure of their fields, as plain JSON data"""
+    career_ai = CareerGuideAI()
+    result = career_ai.analyze(GOLDEN_PROFILES["junior"])
+    results = result.recommendations + result.skill_gaps + result.learning_paths + result.resume_boosters
+
+    for item in results:
+        assert not hasattr(item, "__dict__")
+        serialized = serializer_for(type(item))(item)
+        assert serialized == plain(item)
+        assert list(serialized) == [field.name for field in fields(item)]
+        assert json.loads(json.dumps(serialized)) == serialized
+    assert serializer_for(type(results[0])) is serializer_for(type(results[0]))
+
+    output = result.json
+    assert output["learning_path"] == [plain(path) for path in result.learning_paths]
+    assert type(output["learning_path"][0]["phases"][0]["practice_resources"][0]) is dict
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_fixtures")
+
+GOLDEN_PROFILES = {
+    "junior": UserProfile.from_request({
+        "name": "John Smith",
+        "education": "Bachelor's degree in Computer Science",
+        "experience": "Junior level",
+        "skills": ["Python", "JavaScript", "SQL", "basic machine learning", "ML"],
+        "interests": ["AI", "data science", "web development"],
+    }),
+    "empty": UserProfile(),
+    "senior": UserProfile(name="Dr. {Ada} 100%", education_level="PhD", experience_level="senior",
+                          skills=["AWS", "Docker", "Kubernetes", "Terraform", "Linux", "Python", "security"],
+                          interests=["cloud"]),
+}
+
+
+def test_guidance_text_matches_golden_files():
+    """The markdown report, whole or streamed, is byte-identical to the golden files"""
+    career_ai = CareerGuideAI()
+    for name, profile in GOLDEN_PROFILES.items():
+        with open(os.path.join(FIXTURES_DIR, f"guidance_{name}.md"), encoding="utf-8") as f:
+            expected = f.read()
+        assert career_ai.generate_guidance(profile)[0] == expected, name
+
+        sections = list(career_ai.stream_guidance(profile))
+        assert len(sections) > 2
+        assert "".join(sections) == expected, name
+
+
+def test_learning_path_personalization():
+    """Learning paths come from tables shared per catalog and personalize by level"""
+    career_ai = CareerGuideAI()
+    assert career_ai.personalization is CareerGuideAI().personalization
+
+    senior = career_ai.generate_learning_path(
+        "Data Scientist", UserProfile(skills=["python"], experience_level="senior", education_level="PhD"))
+    assert senior.timeline_months == 5
+    assert [phase.phase_name for phase in senior.phases] == ["Foundation", "Advanced", "Specialization"]
+    assert senior.phases[0].focus_skills == ("statistics", "machine learning")
+    assert "Architect and lead development of complex systems" in senior.phases[0].recommended_projects
+    assert len(senior.phases[0].recommended_projects) <= 4
+    assert senior.phases[0].practice_resources[-1]["provider"] == "arXiv"
+
+    # Unknown levels personalize nothing; tracks without base content still get resources
+    unknown = career_ai.generate_learning_path("Product Manager", UserProfile(experience_level="other"))
+    assert unknown.timeline_months == 12
+    assert unknown.phases[0].recommended_projects == ()
+    assert unknown.phases[0].practice_resources
+
+    # The tables are shared by every path, so what a path hands out cannot be changed.
+    try:
+        senior.phases[0].practice_resources[-1]["provider"] = "mutated"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("Expected TypeError")
+    assert isinstance(senior.phases[0].recommended_projects, tuple)
+
+
+def write_catalog(directory, version="test-1", resources_version=None):
+    """Write a one-track catalog plus resources file and return the catalog path."""
+    path = os.path.join(directory, "catalog.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": version,
+            "resources": "resources.json",
+            "career_tracks": {
+                "Data Engineer": {
+                    "core_skills": ["python", "sql", "spark"],
+                    "emerging_skills": ["lakehouse"],
+                    "market_demand": 90,
+                    "future_demand": 93,
+                    "growth_rate": 30
+                }
+            },
+            "skill_normalization": {"python": ["python", "py"], "sql": ["sql", "postgres"]}
+        }, f)
+    with open(os.path.join(directory, "resources.json"), "w", encoding="utf-8") as f:
+        json.dump({
+            "version": resources_version or version,
+            "learning_resources": {"courses": [], "books": [], "practice": []}
+        }, f)
+    return path
+
+
+def test_catalog_loaded_from_disk_and_snapshotted():
+    """Catalogs load from JSON, are shared per process and reload from a snapshot in a private directory"""
+    previous = os.environ.get("CAREER_CATALOG_CACHE_DIR")
+    with tempfile.TemporaryDirectory() as directory, tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["CAREER_CATALOG_CACHE_DIR"] = cache_dir
+        try:
+            _check_catalog_snapshot(directory, cache_dir)
+        finally:
+            if previous is None:
+                os.environ.pop("CAREER_CATALOG_CACHE_DIR", None)
+            else:
+                os.environ["CAREER_CATALOG_CACHE_DIR"] = previous
+
+
+def _check_catalog_snapshot(directory, cache_dir):
+    path = write_catalog(directory)
+    sources = sorted(os.listdir(directory))
+    catalog = load_catalog(path)
+    assert load_catalog(path) is catalog
+
+    career_ai = CareerGuideAI(catalog)
+    assert catalog._resources is None
+    recommendations = career_ai.generate_career_recommendations(UserProfile(skills=["Py", "Postgres"]))
+    assert recommendations[0].career_track == "Data Engineer"
+    assert career_ai.learning_resources == {"courses": [], "books": [], "practice": []}
+    # The snapshot goes to the cache directory; nothing is written beside the source.
+    assert os.path.dirname(catalog_module._snapshot_path(path)) == cache_dir
+    assert os.path.exists(catalog_module._snapshot_path(path))
+    assert sorted(os.listdir(directory)) == sources
+
+    catalog_module._LOADED.clear()
+    reloaded = load_catalog(path)
+    assert reloaded is not catalog and reloaded._compiled is not None
+    assert CareerGuideAI(reloaded).skill_index == career_ai.skill_index
+
+    # Anyone could have planted a snapshot in a group or world-writable directory: it is ignored.
+    os.chmod(cache_dir, 0o777)
+    catalog_module._LOADED.clear()
+    assert load_catalog(path)._compiled is None
+    os.chmod(cache_dir, 0o700)
+
+
+def test_catalog_resources_version_mismatch():
+    """Resources from a different catalog version are rejected"""
+    with tempfile.TemporaryDirectory() as directory:
+        career_ai = CareerGuideAI(load_catalog(write_catalog(directory, resources_version="other")))
+        try:
+            career_ai.learning_resources
+        except CatalogError:
+            pass
+        else:
+            raise AssertionError("Expected CatalogError")
+
+
+def test_guidance_json_is_owned_by_the_caller():
+    """Mutating one user's JSON output never leaks into the next equivalent profile's result"""
+    career_ai = CareerGuideAI()
+    ada = UserProfile(name="Ada", experience_level="junior", skills=["Python", "SQL"])
+    bo = UserProfile(name="Bo", experience_level="junior", skills=["sql", "python"])
+    expected_text, expected_json = career_ai.generate_guidance(bo)
+
+    _, mutated = career_ai.generate_guidance(ada)
+    mutated["skill_gap_analysis"][0]["need_skills"].append("Injected Skill")
+    mutated["career_recommendations"][0]["top_recommended_skills"].clear()
+    mutated["learning_path"][0]["phases"][0]["practice_resources"][0]["name"] = "Injected"
+    mutated["resume_boosters"][0]["project_ideas"].append("Injected project")
+
+    text, output = career_ai.generate_guidance(bo)
+    assert output == expected_json and text == expected_text
+
+    # The memoized sections behind both results cannot be changed in place at all.
+    shared = career_ai.analyze(bo)
+    assert isinstance(shared.recommendations, tuple) and isinstance(shared.scores, MappingProxyType)
+    assert isinstance(shared.skill_gaps[0].need_skills, tuple)
+    assert isinstance(shared.learning_paths[0].phases[0].practice_resources[0], MappingProxyType)
+    assert "Injected" not in text
+
+
+def test_run_bulk_sharded_output():
+    """Bulk mode writes every profile once, in input order per shard, with bad lines reported in place"""
+    career_ai = CareerGuideAI()
+    records = [
+        {"id": "a", "name": "Ada", "experience": "senior", "skills": ["Python", "SQL", "statistics"]},
+        {"text": "Name: Bo\nExperience: junior\nSkills: React, JavaScript, HTML"},
+        None,
+        {"name": "Cy", "education": "PhD", "skills": "Docker, Kubernetes, AWS"},
+        {"name": "Di", "skills": ["Linux", "networking", "security"]},
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "profiles.jsonl")
+        with open(input_path, "w") as f:
+            for record in records:
+                f.write("{not json\n" if record is None else json.dumps(record) + "\n")
+
+        for workers, ordered in ((1, True), (2, True), (2, False)):
+            output_dir = os.path.join(directory, f"out-{workers}-{ordered}")
+            stats = career_guide_ai.run_bulk(input_path, output_dir, workers=workers, shards=2,
+                                             chunk_size=2, ordered=ordered)
+            assert stats["profiles"] == 5 and stats["errors"] == 1
+
+            lines = {}
+            for shard in range(2):
+                with open(os.path.join(output_dir, f"guidance-{shard:05d}-of-00002.jsonl")) as f:
+                    shard_lines = [json.loads(line) for line in f]
+                indexes = [line["index"] for line in shard_lines]
+                lines.update((line["index"], line) for line in shard_lines)
+                assert all(index % 2 == shard for index in indexes)
+                if ordered:
+                    assert indexes == sorted(indexes)
+            assert sorted(lines) == [0, 1, 2, 3, 4]
+            assert "error" in lines[2] and lines[0]["id"] == "a"
+
+            expected = career_ai.analyze(UserProfile.from_request(records[3]), ["text", "json"])
+            assert lines[3]["guidance_text"] == expected.text
+            assert lines[3]["json_output"]["career_recommendations"] == expected.json["career_recommendations"]
+
+
+def test_run_bulk_skips_mistyped_records():
+    """A record that parses but has the wrong types becomes an error line; every other record is written"""
+    records = [
+        {"name": "Ada", "skills": ["python", "sql"]},
+        {"name": "Bo", "skills": ["react"]},
+        {"name": 5, "skills": ["python"]},
+        {"name": "Cy", "skills": 5},
+        {"name": "Di", "skills": ["docker", "aws"]},
+        {"name": "Ed", "skills": ["figma"]},
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "profiles.jsonl")
+        with open(input_path, "w") as f:
+            f.write("\n".join(json.dumps(record) for record in records) + "\n")
+
+        for workers in (1, 2):
+            output_dir = os.path.join(directory, f"out-{workers}")
+            stats = career_guide_ai.run_bulk(input_path, output_dir, workers=workers, chunk_size=4)
+            assert stats["profiles"] == 6 and stats["errors"] == 2
+            with open(os.path.join(output_dir, "guidance-00000-of-00001.jsonl")) as f:
+                lines = [json.loads(line) for line in f]
+            assert [line["index"] for line in lines] == [0, 1, 2, 3, 4, 5]
+            assert [line["line"] for line in lines if "error" in line] == [3, 4]
+            assert "name" in lines[2]["error"] and "skills" in lines[3]["error"]
+            assert all("guidance_text" in lines[index] for index in (0, 1, 4, 5))
+
+
+def test_guidance_memo_shared_by_equivalent_profiles():
+    """Profiles with the same catalog skills, capped skill count and levels share memoized sections"""
+    career_ai = CareerGuideAI()
+    first = career_ai.analyze(UserProfile(name="Ada", experience_level="junior", skills=["Python", "SQL", "Rust"]),
+                              sections=["json"])
+    second = career_ai.analyze(UserProfile(name="Bo", experience_level="junior", skills=["sql", "py", "Go"]))
+    assert second.recommendations is first.recommendations and "learning_paths" in second.memo
+    assert second.json["user_summary"]["name"] == "Bo" and second.json["learning_path"] == first.json["learning_path"]
+    assert career_ai.memo_stats()["hits"] == 1 and career_ai.memo_stats()["size"] == 1
+
+    # A different count of unknown skills changes the match bonus, so it is a different entry.
+    third = career_ai.analyze(UserProfile(experience_level="junior", skills=["Python", "SQL"]))
+    assert third.recommendations is not first.recommendations
+    assert third.scores == career_ai.score_tracks(["python", "sql"])
+
+    # Past the point where the bonus saturates, more unknown skills share one entry.
+    many = [f"skill {i}" for i in range(30)]
+    assert career_ai.memo_key(career_ai.normalize_profile(UserProfile(skills=many))) == \
+        career_ai.memo_key(career_ai.normalize_profile(UserProfile(skills=many[:20])))
+
+    uncached = CareerGuideAI(memo_size=0)
+    assert uncached.analyze(UserProfile(skills=["Python"])).recommendations is not \
+        uncached.analyze(UserProfile(skills=["Python"])).recommendations
+
+
+if __name__ == "__main__":
+    test_normalize_skills_matches_linear_scan()
+    test_alias_collisions_reported()
+    test_rebuild_skill_index()
+    test_parse_user_input_fields()
+    test_parse_user_input_word_boundaries()
+    test_parse_user_input_keyword_priority()
+    test_parse_user_input_scans_labelled_values_once()
+    test_profile_from_request()
+    test_score_batch_matches_calculate_match_score()
+    test_recommendations_top_k_and_tie_break()
+    test_guidance_normalizes_skills_once()
+    test_analyze_builds_only_requested_sections()
+    test_guidance_text_matches_golden_files()
+    test_result_serializers_match_asdict()
+    test_learning_path_personalization()
+    test_catalog_loaded_from_disk_and_snapshotted()
+    test_catalog_resources_version_mismatch()
+    test_guidance_json_is_owned_by_the_caller()
+    test_run_bulk_sharded_output()
+    test_run_bulk_skips_mistyped_records()
+    test_guidance_memo_shared_by_equivalent_profiles()
+    print("✅ All engine tests passed!")
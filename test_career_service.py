@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Tests for the career service helpers and the per-track endpoints
+"""
+
+import json
+import os
+import tempfile
+from concurrent.futures import Future
+
+from cachelib import FileSystemCache, SimpleCache
+from celery import Celery
+
+import routes.api as api_routes
+from app import app
+from tasks import celery as tasks_celery, generate_guidance_batch_task, generate_guidance_task
+from services import analysis_pool, result_store as result_store_module
+from services.cache_warmer import rank_profiles, read_request_log, warm_cache
+from services.result_store import ResultStore, result_store
+from services.career_service import (
+    analysis_reference,
+    analysis_task_id,
+    analyze_profile,
+    build_cache_key,
+    build_track_artifact,
+    build_track_artifact_cache_key,
+    cached_analyses,
+    career_ai,
+    profile_fingerprint,
+    encode_analysis,
+    guidance_cache,
+    inflight_key,
+    issue_task_handle,
+    personalize_analysis,
+    profile_from_summary,
+    request_profile,
+)
+from utils.encoding import dumps
+from utils.tiered_cache import TieredCache
+from utils.validation import AnalyzeRequest
+
+# Redis is not running under test: the results pages read analyses from files.
+result_store.backend = FileSystemCache(tempfile.mkdtemp())
+
+SUMMARY = {
+    "name": "Zoë",
+    "education": "PhD",
+    "experience": "senior",
+    "skills": ["Python", "SQL", "Figma"],
+    "interests": ["design"],
+}
+
+
+def test_profile_fingerprint_ignores_spelling_and_order():
+    """Profiles with the same canonical skills and levels share a fingerprint"""
+    profile = profile_from_summary(SUMMARY)
+    same = profile_from_summary({**SUMMARY, "name": "Other", "skills": ["sql", "py", "figma", "python"]})
+    assert profile_fingerprint(profile) == profile_fingerprint(same)
+    assert profile_fingerprint(profile) != profile_fingerprint(profile_from_summary({**SUMMARY, "experience": "junior"}))
+
+    track = "UX/UI Designer"
+    assert build_track_artifact_cache_key(profile, track, "learning-path") != \
+        build_track_artifact_cache_key(profile, track, "skill-gaps")
+    assert build_track_artifact_cache_key(profile, track, "resume-boosters") == \
+        build_track_artifact_cache_key(profile_from_summary({"skills": []}), track, "resume-boosters")
+
+
+def test_track_artifact_matches_full_analysis():
+    """An on-demand artifact equals the one a full analysis builds for its top track"""
+    profile = profile_from_summary(SUMMARY)
+    result = career_ai.analyze(profile)
+    track = result.top_career
+    assert json.loads(build_track_artifact(profile, track, "learning-path")) == result.json["learning_path"][0]
+    assert json.loads(build_track_artifact(profile, track, "skill-gaps")) == result.json["skill_gap_analysis"][0]
+
+
+def test_track_endpoints():
+    """Per-track endpoints need a stored analysis and a known track"""
+    with app.test_client() as client:
+        assert client.get("/api/tracks/Data Scientist/skill-gaps").status_code == 404
+
+        client.post("/analyze", json=SUMMARY)
+        response = client.get("/api/tracks/UX/UI Designer/learning-path")
+        assert response.status_code == 200
+        body = response.get_json()
+        assert body["success"] and body["learning_path"]["career_track"] == "UX/UI Designer"
+        assert client.get("/api/tracks/Astronaut/learning-path").status_code == 404
+
+
+def test_batch_endpoint_streams_ndjson():
+    """The batch endpoint answers every record in order, from NDJSON or a JSON array"""
+    records = [
+        {"name": "Ada", "skills": ["python", "sql", "statistics"], "education": "PhD"},
+        {"name": "", "skills": []},
+        {"name": "Lin", "skills": "figma, user research", "experience": "junior"},
+        {"name": "Sam", "skills": ["aws", "docker"]},
+    ]
+    chunk_size, max_records = api_routes.BATCH_CHUNK_SIZE, api_routes.BATCH_MAX_RECORDS
+    api_routes.BATCH_CHUNK_SIZE = 3
+    try:
+        with app.test_client() as client:
+            for body in ("\n".join(json.dumps(record) for record in records), json.dumps(records)):
+                response = client.post("/api/analyze/batch", data=body)
+                assert response.mimetype == "application/x-ndjson"
+                lines = [json.loads(line) for line in response.get_data().splitlines()]
+                assert [line.get("index") for line in lines] == [0, 1, 2, 3]
+                assert [line["success"] for line in lines] == [True, False, True, True]
+                assert lines[1]["error"] == "Validation failed"
+
+                expected = analyze_profile(AnalyzeRequest.model_validate(records[2]))
+                assert lines[2]["guidance"] == json.loads(json.dumps(expected[1]))
+                assert lines[2]["user_profile"] == expected[2]
+
+            response = client.post("/api/analyze/batch", data=json.dumps(records[0]) + "\n{not json")
+            lines = [json.loads(line) for line in response.get_data().splitlines()]
+            assert lines[0]["success"] and not lines[1]["success"]
+
+            api_routes.BATCH_MAX_RECORDS = 3
+            response = client.post("/api/analyze/batch", data=json.dumps(records))
+            assert response.status_code == 413 and not response.get_json()["success"]
+            assert client.post("/api/analyze/batch", data=json.dumps(records[:3])).status_code == 200
+    finally:
+        api_routes.BATCH_CHUNK_SIZE = chunk_size
+        api_routes.BATCH_MAX_RECORDS = max_records
+
+
+class IdleExecutor:
+    """An executor whose jobs never start."""
+
+    def submit(self, fn, *args, **kwargs):
+        return Future()
+
+
+def test_analysis_pool_matches_inline():
+    """Pooled analyses equal inline ones, are counted, and time out with AnalysisTimeout"""
+    payload = AnalyzeRequest.model_validate(
+        {"name": "Ada", "skills": ["python", "sql", "statistics"], "education": "PhD", "experience": "senior"}
+    )
+    pool_size, get_executor = analysis_pool.POOL_SIZE, analysis_pool._get_executor
+    analysis_pool.POOL_SIZE = 2
+    try:
+        # A job no worker ever picks up times out however fast the machine is.
+        analysis_pool._get_executor = lambda: IdleExecutor()
+        try:
+            analysis_pool.analyze_profile(payload, timeout=0.01)
+        except analysis_pool.AnalysisTimeout:
+            pass
+        else:
+            raise AssertionError("Expected AnalysisTimeout")
+        analysis_pool._get_executor = get_executor
+
+        pooled = analysis_pool.analyze_profile(payload)
+        inline = analyze_profile(payload)
+        assert pooled[:3] == inline[:3]
+
+        with app.test_client() as client:
+            stats = client.get("/api/metrics/analysis-pool").get_json()
+        assert stats["enabled"] and stats["started"] and stats["workers"] == 2
+        assert stats["submitted"] == 2 and stats["timed_out"] == 1
+    finally:
+        analysis_pool._get_executor = get_executor
+        analysis_pool.shutdown()
+        analysis_pool.POOL_SIZE = pool_size
+
+
+def test_task_wait_and_events():
+    """Long-poll and SSE endpoints return as soon as the task result is stored"""
+    payload = {"name": "Zoë", "education": "PhD", "experience": "senior", "skills": ["Python", "SQL", "Figma"],
+               "interests": ["design"]}
+    reference = generate_guidance_task(payload)
+    # Equivalent submissions share the task, so its result names none of them.
+    assert set(reference) == {"cached", "cache_key", "timestamp"}
+
+    backend_app = Celery("career_ai_test", backend="cache+memory://")
+    backend_app.backend.store_result("done-task", reference, "SUCCESS")
+    backend_app.backend.store_result("failed-task", ValueError("boom"), "FAILURE")
+    backend_app.backend.store_result("expired-task", {**reference, "cache_key": "ai:guidance:v3:gone"}, "SUCCESS")
+    expected_text = analyze_profile(AnalyzeRequest.model_validate(payload))[0]
+    profile = request_profile(AnalyzeRequest.model_validate(payload))
+    done, failed, expired, pending = (issue_task_handle(task_id, profile)
+                                      for task_id in ("done-task", "failed-task", "expired-task", "unknown-task"))
+
+    celery_app = api_routes.celery
+    api_routes.celery = backend_app
+    try:
+        with app.test_client() as client:
+            # Task ids are only reachable through the handles issued to their submitters.
+            for path in ("/api/tasks/done-task", "/api/tasks/done-task/wait", "/api/tasks/done-task/events"):
+                assert client.get(path).status_code == 404
+
+            response = client.get(f"/api/tasks/{done}/wait")
+            assert response.status_code == 200 and response.get_json()["result"]["guidance_text"] == expected_text
+            with client.session_transaction() as session:
+                stored = result_store.load(session["result_id"])
+            assert stored["user_profile"] == SUMMARY and stored["json_output"]["user_summary"]["name"] == "Zoë"
+
+            assert client.get(f"/api/tasks/{failed}/wait").status_code == 500
+            assert client.get(f"/api/tasks/{expired}/wait").status_code == 410
+            response = client.get(f"/api/tasks/{pending}/wait?timeout=0.1")
+            assert response.status_code == 202 and response.get_json()["state"] == "PENDING"
+
+            response = client.get(f"/api/tasks/{done}/events")
+            assert response.mimetype == "text/event-stream"
+            events = response.get_data(as_text=True).split("\n\n")
+            assert events[1].startswith("event: result\ndata: ")
+            assert json.loads(events[1].split("data: ", 1)[1])["result"]["user_profile"] == SUMMARY
+            assert client.get(f"/api/tasks/{failed}/events").get_data().startswith(b"retry: 1000\n\nevent: failure")
+            assert b"event: failure" in client.get(f"/api/tasks/{expired}/events").get_data()
+    finally:
+        api_routes.celery = celery_app
+
+
+def test_semantic_cache_key_shares_analyses():
+    """Equivalent payloads share a key, and a shared analysis personalizes to the exact direct result"""
+    first = AnalyzeRequest.model_validate(
+        {"name": "Ada", "education": "PhD", "experience": "Senior", "skills": ["JS", "Python", "sql"],
+         "interests": ["AI"]}
+    )
+    second = AnalyzeRequest.model_validate(
+        {"name": "Lin ☃", "education": "phd", "experience": "senior level", "skills": ["SQL", "javascript", "py"]}
+    )
+    other = AnalyzeRequest.model_validate({**first.model_dump(), "experience": "junior"})
+    assert build_cache_key(request_profile(first)) == build_cache_key(request_profile(second))
+    assert build_cache_key(request_profile(first)) != build_cache_key(request_profile(other))
+
+    shared = encode_analysis(*analyze_profile(first))
+    for payload in (first, second):
+        guidance_text, json_output, user_profile, _ = analyze_profile(payload)
+        personalized = personalize_analysis(shared, request_profile(payload))
+        assert personalized["guidance_text"] == guidance_text
+        assert personalized["json_output"] == dumps(json_output, sort_keys=True)
+        assert json.loads(personalized["user_profile"]) == user_profile
+
+    with app.test_client() as client:
+        client.post("/analyze", json=first.model_dump())
+        body = client.post("/analyze", json=second.model_dump()).get_json()
+        assert body["cached"] and body["user_profile"]["name"] == "Lin ☃"
+        assert body["guidance"]["user_summary"]["skills_normalized"] == ["sql", "javascript", "python"]
+        with client.session_transaction() as session:
+            assert "**Name:** Lin ☃" in result_store.load(session["result_id"])["guidance_text"]
+
+
+def test_cache_warmer_ranks_and_fills_cache():
+    """The warmer caches the most requested canonical profiles once and skips them on the next run"""
+    records = [
+        {"name": "Ada", "skills": ["Python", "SQL"], "experience": "junior"},
+        {"name": "Bo", "skills": ["sql", "py"], "experience": "Junior"},
+        {"name": "Cy", "skills": ["figma"]},
+        {"name": "", "skills": ["java"]},
+        {"name": "Di", "skills": ["python", "sql"], "experience": "junior"},
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "requests.jsonl")
+        with open(path, "w") as f:
+            f.write("\n".join(json.dumps(record) for record in records))
+
+        log_stats = {}
+        ranked = rank_profiles(read_request_log(path, log_stats))
+        assert [count for _, _, count in ranked] == [3, 1] and log_stats == {"invalid": 1}
+        assert ranked[0][1].name == "Ada"
+
+        cache = TieredCache(SimpleCache(), namespace=lambda: "test", maxsize=0)
+        progress = []
+        stats = warm_cache(read_request_log(path), limit=1, cache=cache, progress=progress.append)
+        assert stats["warmed"] == 1 and stats["requests_covered"] == 3 and len(progress) == 1
+
+        shared = cache.get(ranked[0][0])
+        expected = analyze_profile(AnalyzeRequest.model_validate(records[1]))
+        assert personalize_analysis(shared, request_profile(AnalyzeRequest.model_validate(records[1])))[
+            "guidance_text"] == expected[0]
+
+        stats = warm_cache(read_request_log(path), batch_size=1, rate=1000, cache=cache)
+        assert stats["already_cached"] == 1 and stats["warmed"] == 1
+
+
+def test_batch_task_statuses():
+    """The chunked task reports invalid, computed and cached payloads and leaves analyses in the cache"""
+    payloads = [
+        {"name": "Ada", "skills": ["rust", "elixir"], "education": "High School"},
+        {"name": ""},
+        {"name": "Bo", "skills": ["Elixir", "Rust"], "education": "high school"},
+    ]
+    items = generate_guidance_batch_task(payloads)
+    assert [item["status"] for item in items] == ["computed", "invalid", "computed"]
+    assert items[0]["cache_key"] == items[2]["cache_key"]
+
+    items = generate_guidance_batch_task(payloads[:1])
+    assert items == [{"status": "cached", "cache_key": items[0]["cache_key"]}]
+    shared = guidance_cache.get(items[0]["cache_key"])
+    profile = request_profile(AnalyzeRequest.model_validate(payloads[0]))
+    assert personalize_analysis(shared, profile)["guidance_text"] == \
+        analyze_profile(AnalyzeRequest.model_validate(payloads[0]))[0]
+
+
+def test_async_submissions_are_deduplicated():
+    """Cached analyses are answered at once; equivalent misses share one computation, each behind its own handle"""
+    first = {"name": "Ada", "skills": ["Kotlin", "Swift"], "experience": "mid"}
+    second = {"name": "Bo", "skills": ["swift", "kotlin"], "experience": "Mid"}
+    third = {"name": "Cy", "skills": ["Kotlin", "Go"], "experience": "mid"}
+    first_key, third_key = (build_cache_key(request_profile(AnalyzeRequest.model_validate(payload)))
+                            for payload in (first, third))
+
+    backend, eager = guidance_cache.backend, tasks_celery.conf.task_always_eager
+    guidance_cache.backend = SimpleCache()
+    guidance_cache.local.clear()
+    tasks_celery.conf.task_always_eager = True
+    # An earlier run of the first profile's task failed, and its state is still stored.
+    backend_app = Celery("career_ai_test", backend="cache+memory://")
+    backend_app.backend.store_result(analysis_task_id(first_key), ValueError("boom"), "FAILURE")
+    celery_app = api_routes.celery
+    api_routes.celery = backend_app
+    try:
+        with app.test_client() as client:
+            # A miss queues the task (run inline here), which caches the analysis and releases its marker.
+            body = client.post("/api/analyze/async", json=first).get_json()
+            assert body["coalesced"] is False and body["task_id"] != analysis_task_id(first_key)
+            # The retry dropped the stale FAILURE instead of reporting it for the new run.
+            assert client.get(f"/api/tasks/{body['task_id']}").get_json()["state"] == "PENDING"
+            assert guidance_cache.get(first_key) is not None
+            assert guidance_cache.add(inflight_key(first_key), "next", timeout=60)
+
+            response = client.post("/api/analyze/async", json=second)
+            assert response.status_code == 200
+            assert response.get_json()["cached"] and response.get_json()["user_profile"]["name"] == "Bo"
+
+            # While a task for the profile is in flight, submissions join it instead of queueing another.
+            assert guidance_cache.add(inflight_key(third_key), analysis_task_id(third_key), timeout=60)
+            response = client.post("/api/analyze/async", json=third)
+            assert response.status_code == 202 and response.get_json()["coalesced"] is True
+            assert guidance_cache.get(third_key) is None
+            handle = response.get_json()["task_id"]
+
+            # The joined task finishes; each submitter's handle resolves to its own profile.
+            (_, _, shared, _), = cached_analyses([AnalyzeRequest.model_validate(third)])
+            backend_app.backend.store_result(analysis_task_id(third_key),
+                                             analysis_reference(third_key, shared, False), "SUCCESS")
+            other = issue_task_handle(analysis_task_id(third_key), request_profile(AnalyzeRequest.model_validate(
+                {"name": "Alice", "skills": ["go", "kotlin"], "experience": "mid", "interests": ["privacy"]})))
+            assert client.get(f"/api/tasks/{handle}").get_json()["result"]["user_profile"]["name"] == "Cy"
+            assert client.get(f"/api/tasks/{other}").get_json()["result"]["user_profile"]["name"] == "Alice"
+            # Guessing the shared task id from the profile reveals nothing.
+            with app.test_client() as stranger:
+                assert stranger.get(f"/api/tasks/{analysis_task_id(third_key)}").status_code == 404
+    finally:
+        guidance_cache.backend = backend
+        guidance_cache.local.clear()
+        tasks_celery.conf.task_always_eager = eager
+        api_routes.celery = celery_app
+
+
+def test_results_pages_read_the_result_store():
+    """The session keeps only a result id; every results page reads the stored analysis"""
+    payload = {"name": "Ada", "education": "PhD", "experience": "senior", "skills": ["python", "sql", "statistics"]}
+    with app.test_client() as client:
+        assert client.get("/api/results").status_code == 404
+        assert client.get("/results").status_code == 302
+
+        guidance = client.post("/analyze", json=payload).get_json()["guidance"]
+        with client.session_transaction() as session:
+            assert list(session.keys()) == ["result_id"]
+            first_id = session["result_id"]
+
+        body = client.get("/api/results").get_json()
+        assert body["results"] == guidance and body["user_profile"]["name"] == "Ada"
+        assert "**Name:** Ada" in body["guidance_text"]
+        top = guidance["career_recommendations"][0]["career_track"]
+        assert client.get("/api/career-stats").get_json()["top_career"] == top
+        assert client.get("/api/progress").get_json()["top_career_match"] == top
+        assert client.get("/api/analysis-history").get_json()["history"][0]["top_career"] == top
+        assert client.get("/results").status_code == 200
+        assert json.loads(client.get("/download/json").get_data()) == guidance
+
+        # A new analysis replaces the stored one; an expired one reads as no analysis.
+        client.post("/analyze", json={**payload, "name": "Bo"})
+        with client.session_transaction() as session:
+            assert result_store.load(first_id) is None
+            result_store.delete(session["result_id"])
+        assert client.get("/api/progress").status_code == 404
+
+    # Backend errors read as "no analysis" rather than failing the request.
+    unreachable = ResultStore(backend=None)
+    assert unreachable.save({"guidance_text": "", "json_output": b"{}", "user_profile": b"{}", "timestamp": ""}) is None
+    assert unreachable.load("any") is None
+
+
+def test_file_result_store_needs_a_private_directory():
+    """The file backend unpickles what it reads, so it refuses a missing or shared directory"""
+    settings = result_store_module.RESULT_STORE_BACKEND, result_store_module.RESULT_STORE_DIR
+    result_store_module.RESULT_STORE_BACKEND = "file"
+    try:
+        result_store_module.RESULT_STORE_DIR = None
+        try:
+            result_store_module._default_backend()
+            assert False, "a file store without RESULT_STORE_DIR was created"
+        except ValueError:
+            pass
+
+        with tempfile.TemporaryDirectory() as directory:
+            result_store_module.RESULT_STORE_DIR = os.path.join(directory, "results")
+            assert isinstance(result_store_module._default_backend(), FileSystemCache)
+            os.chmod(result_store_module.RESULT_STORE_DIR, 0o777)
+            try:
+                result_store_module._default_backend()
+                assert False, "a world-writable RESULT_STORE_DIR was accepted"
+            except ValueError:
+                pass
+    finally:
+        result_store_module.RESULT_STORE_BACKEND, result_store_module.RESULT_STORE_DIR = settings
+
+
+if __name__ == "__main__":
+    test_profile_fingerprint_ignores_spelling_and_order()
+    test_track_artifact_matches_full_analysis()
+    test_track_endpoints()
+    test_batch_endpoint_streams_ndjson()
+    test_analysis_pool_matches_inline()
+    test_task_wait_and_events()
+    test_semantic_cache_key_shares_analyses()
+    test_cache_warmer_ranks_and_fills_cache()
+    test_batch_task_statuses()
+    test_async_submissions_are_deduplicated()
+    test_results_pages_read_the_result_store()
+    test_file_result_store_needs_a_private_directory()
+    print("✅ All career service tests passed!")
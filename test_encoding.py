@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared JSON encoding layer
+"""
+
+import json
+
+from flask import Flask, jsonify
+
+import utils.encoding as encoding
+from career_guide_ai import CareerGuideAI, UserProfile
+from utils.encoding import FastJSONProvider, dumps, encode_object, json_response, loads
+
+
+def sample_output():
+    career_ai = CareerGuideAI()
+    return career_ai.generate_guidance(UserProfile(name="Zoë ☃", skills=["Python", "SQL"], interests=["AI"]))[1]
+
+
+def test_fast_and_stdlib_encoders_agree():
+    """orjson and the stdlib fallback produce identical bytes"""
+    payload = sample_output()
+    fast = [dumps(payload, sort_keys=sort_keys, indent=indent) for sort_keys in (False, True) for indent in (False, True)]
+
+    orjson_module = encoding.orjson
+    encoding.orjson = None
+    try:
+        stdlib = [dumps(payload, sort_keys=sort_keys, indent=indent)
+                  for sort_keys in (False, True) for indent in (False, True)]
+        assert loads(fast[0]) == payload
+    finally:
+        encoding.orjson = orjson_module
+
+    assert fast == stdlib
+    assert fast[1] == json.dumps(payload, indent=2, ensure_ascii=False).encode()
+    assert loads(fast[0]) == payload
+
+
+def test_encode_object_reuses_encoded_values():
+    """Pre-encoded parts are spliced into the object unchanged"""
+    guidance = dumps({"b": 1, "a": [1, 2]})
+    body = encode_object({"guidance": guidance, "success": b"true", "name": dumps("Zoë")})
+    assert body == '{"guidance":{"b":1,"a":[1,2]},"success":true,"name":"Zoë"}'.encode()
+
+
+def test_json_provider_responses():
+    """jsonify and json_response go through the fast provider with Flask's defaults"""
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    with app.app_context():
+        response = jsonify({"b": 1, "a": "é"})
+        assert response.mimetype == "application/json"
+        assert response.get_data() == '{"a":"é","b":1}\n'.encode()
+
+        response = json_response(encoded=b'{"x":1}', status=202)
+        assert response.status_code == 202 and response.get_data() == b'{"x":1}\n'
+
+        assert app.json.dumps({"b": 1, "a": 2}, separators=(", ", ": ")) == '{"a": 2, "b": 1}'
+        assert app.json.loads('{"a":1}') == {"a": 1}
+
+
+if __name__ == "__main__":
+    test_fast_and_stdlib_encoders_agree()
+    test_encode_object_reuses_encoded_values()
+    test_json_provider_responses()
+    print("✅ All encoding tests passed!")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the in-process LRU and the two-tier guidance cache
+"""
+
+import time
+
+from cachelib import SimpleCache
+
+from utils.lru import LRUCache
+from utils.tiered_cache import CompressedValue, TieredCache
+
+
+class BrokenBackend:
+    """A backend whose every call fails, like Redis being unreachable."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("redis down")
+        return fail
+
+
+def test_lru_evicts_least_recently_used_and_expires():
+    """Entries leave in LRU order once full, and after their ttl"""
+    lru = LRUCache(maxsize=2, ttl=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+    assert lru.get("b") is None and lru.get("a") == 1 and lru.get("c") == 3
+    assert lru.stats()["evictions"] == 1
+
+    lru.set("short", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert lru.get("short", "gone") == "gone"
+    assert lru.stats()["hits"] == 3 and lru.stats()["misses"] == 2
+
+
+def test_tiered_cache_counts_each_tier():
+    """L1 answers repeated lookups; L2 fills L1 and is shared between processes"""
+    backend = SimpleCache()
+    web = TieredCache(backend, namespace=lambda: "catalog:1", maxsize=8, ttl=60)
+    worker = TieredCache(backend, namespace=lambda: "catalog:1", maxsize=8, ttl=60)
+
+    web.set("k", {"v": 1}, timeout=3600)
+    assert backend.get("catalog:1:k") == {"v": 1}
+    assert web.get("k") == {"v": 1}
+    assert worker.get("k") == {"v": 1} and worker.get("k") == {"v": 1}
+    assert worker.get_many("k", "missing") == [{"v": 1}, None]
+
+    stats = worker.stats()
+    assert stats["l1"]["hits"] == 2 and stats["l2"] == {"hits": 1, "misses": 1, "errors": 0}
+    assert web.stats()["l1"]["hits"] == 1 and web.stats()["l2"]["hits"] == 0
+
+
+def test_tiered_cache_namespace_change_invalidates():
+    """A new catalog version never reads values cached for the old one"""
+    version = ["1"]
+    tiered = TieredCache(SimpleCache(), namespace=lambda: f"catalog:{version[0]}", maxsize=8, ttl=60)
+    tiered.set_many({"a": 1, "b": 2}, timeout=3600)
+    assert tiered.get_many("a", "b") == [1, 2]
+
+    version[0] = "2"
+    assert tiered.get("a") is None
+    assert len(tiered.local) == 0 and tiered.stats()["namespace"] == "catalog:2"
+
+
+def test_tiered_cache_survives_backend_errors():
+    """With L2 down, lookups miss, writes still reach L1 and errors are counted"""
+    tiered = TieredCache(BrokenBackend(), namespace=lambda: "catalog:1", maxsize=8, ttl=60)
+    assert tiered.get("k") is None
+    tiered.set("k", "v", timeout=3600)
+    assert tiered.get("k") == "v"
+    assert tiered.get_many("k", "other") == ["v", None]
+    assert tiered.stats()["l2"]["errors"] == 3
+
+
+def test_tiered_cache_compresses_large_values():
+    """Values over compress_min_size are stored compressed in L2 and read back unchanged"""
+    backend = SimpleCache()
+    tiered = TieredCache(backend, namespace=lambda: "catalog:1", maxsize=0, compress_min_size=256)
+    large = {"report": "Learn Python. " * 200, "results": b"[]"}
+    tiered.set_many({"large": large, "small": "tiny"}, timeout=3600)
+    assert isinstance(backend.get("catalog:1:large"), CompressedValue)
+    assert backend.get("catalog:1:small") == "tiny"
+    assert tiered.get("large") == large and tiered.get_many("large", "small") == [large, "tiny"]
+
+
+if __name__ == "__main__":
+    test_lru_evicts_least_recently_used_and_expires()
+    test_tiered_cache_counts_each_tier()
+    test_tiered_cache_namespace_change_invalidates()
+    test_tiered_cache_survives_backend_errors()
+    test_tiered_cache_compresses_large_values()
+    print("✅ All cache tests passed!")
@@ -0,0 +1,168 @@
+"""
+JSON encoding for API responses, cache values and downloads.
+
+Uses orjson when it is installed and the standard library otherwise. Both
+paths produce the same UTF-8 bytes (compact separators, no ASCII escaping;
+only floats written in exponent notation differ), so cache keys and cached
+payloads do not depend on which encoder a process has. Encode once with
+dumps() and pass the bytes along: json_response() and encode_object() accept
+already-encoded values and never encode them again.
+"""
+
+import codecs
+import json
+from typing import IO, Any, Callable, Iterator, Mapping, Optional
+
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder produces the same bytes
+    orjson = None
+
+
+def dumps(obj: Any, sort_keys: bool = False, indent: bool = False,
+          default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes, or with 2-space indentation if indent is set."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj,
+        sort_keys=sort_keys,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        ensure_ascii=False,
+        default=default,
+    ).encode()
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_json_records(stream: IO[bytes], chunk_size: int = 64 * 1024) -> Iterator[Any]:
+    """Yield the records of an NDJSON body or a top-level JSON array, reading it in chunks.
+
+    Only the current chunk and the record being parsed are held in memory.
+    Raises ValueError on malformed input, after yielding the records before it.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, eof
+        if eof:
+            return False
+        data = stream.read(chunk_size)
+        eof = not data
+        buffer += decoder.decode(data or b"", final=eof)
+        return bool(data)
+
+    def skip_space(pos: int) -> int:
+        nonlocal buffer
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer):
+                return pos
+            buffer, pos = "", 0
+            if not fill():
+                return pos
+
+    pos = skip_space(0)
+    if not buffer:
+        return
+
+    if buffer[pos] != "[":
+        # NDJSON: one record per non-blank line.
+        while True:
+            end = buffer.find("\n", pos)
+            if end < 0:
+                buffer = buffer[pos:]
+                pos = 0
+                if fill():
+                    continue
+                end = len(buffer)
+            line = buffer[pos:end].strip()
+            if line:
+                yield loads(line)
+            pos = end + 1
+            if pos >= len(buffer) and eof:
+                return
+
+    raw_decode = json.JSONDecoder().raw_decode
+    pos = skip_space(pos + 1)
+    if buffer[pos:pos + 1] == "]":
+        return
+    while True:
+        try:
+            record, end = raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Usually a record cut by the chunk boundary; read on until it parses or the body ends.
+            buffer = buffer[pos:]
+            pos = 0
+            if fill():
+                continue
+            raise ValueError("Malformed JSON array") from None
+        yield record
+        pos = skip_space(end)
+        separator = buffer[pos:pos + 1]
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError("Expected ',' or ']' in JSON array")
+        pos = skip_space(pos + 1)
+
+
+def encode_object(fields: Mapping[str, bytes]) -> bytes:
+    """Assemble a JSON object from values that are already encoded, in the given key order."""
+    return b"{" + b",".join(dumps(key) + b":" + value for key, value in fields.items()) + b"}"
+
+
+def json_response(payload: Any = None, status: int = 200, encoded: Optional[bytes] = None):
+    """A JSON response like jsonify's; pass encoded to send bytes produced earlier as-is."""
+    if encoded is None:
+        encoded = current_app.json.dumps_bytes(payload)
+    return current_app.response_class(encoded + b"\n", status=status, mimetype="application/json")
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by dumps(), so jsonify and the session use the fast encoder.
+
+    Output keeps Flask's defaults (sorted keys, compact unless in debug mode)
+    except that non-ASCII text is written as UTF-8 instead of \\u escapes.
+    """
+
+    ensure_ascii = False
+
+    def dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        return dumps(obj, sort_keys=self.sort_keys, indent=indent, default=self.default)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        indent = kwargs.get("indent")
+        separators = kwargs.get("separators", (",", ": ") if indent else (",", ":"))
+        fast = (indent is None and separators == (",", ":")) or (indent == 2 and separators == (",", ": "))
+        if not fast or set(kwargs) - {"indent", "separators"}:
+            # Options dumps() does not cover go through the stdlib encoder.
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj, indent=bool(indent)).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.dumps_bytes(obj, indent=indent) + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,21 @@
+import os
+import stat
+
+
+def is_private_dir(path: str) -> bool:
+    """Whether path is a directory only the current user can have put files in.
+
+    Pickle and marshal are unsafe on crafted input, so caches that use them
+    only read from directories that pass this check.
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(info.st_mode):
+        return False
+    getuid = getattr(os, "getuid", None)
+    if getuid is None:
+        # Windows has no uid or mode bits to check; its profile directories are per-user.
+        return True
+    return info.st_uid == getuid() and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
@@ -0,0 +1,160 @@
+import pickle
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from utils.lru import LRUCache
+
+
+class CompressedValue:
+    """An L2 value stored as zlib-compressed pickle bytes."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __getstate__(self):
+        return self.data
+
+    def __setstate__(self, data: bytes) -> None:
+        self.data = data
+
+
+class TieredCache:
+    """An in-process LRUCache (L1) in front of a Flask-Caching backend such as Redis (L2).
+
+    Every key is prefixed with namespace(), e.g. the catalog version, so values
+    written for another catalog are never read, and L1 is emptied when the
+    namespace changes. L2 errors (Redis down, no app context) count as misses,
+    so callers need no error handling of their own. Used from both the web app
+    and Celery workers.
+
+    With compress_min_size set, values whose pickle is at least that many
+    bytes are zlib-compressed in L2; L1 keeps them as they are.
+    """
+
+    def __init__(self, backend: Any, namespace: Callable[[], str], maxsize: int = 1024, ttl: float = 300.0,
+                 compress_min_size: Optional[int] = None):
+        self.backend = backend
+        self.namespace = namespace
+        self.compress_min_size = compress_min_size
+        self.local = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._namespace: Optional[str] = None
+        self._lock = threading.Lock()
+        self._l2 = {"hits": 0, "misses": 0, "errors": 0}
+
+    def _key(self, key: str) -> str:
+        namespace = self.namespace()
+        if namespace != self._namespace:
+            self.local.clear()
+            self._namespace = namespace
+        return f"{namespace}:{key}"
+
+    def _count(self, field: str, amount: int = 1) -> None:
+        with self._lock:
+            self._l2[field] += amount
+
+    def _local_ttl(self, timeout: Optional[float]) -> Optional[float]:
+        """An L1 entry never outlives the L2 entry it copies."""
+        if not timeout:  # None or 0: the backend keeps the value indefinitely
+            return self.local.ttl
+        if self.local.ttl is None:
+            return timeout
+        return min(timeout, self.local.ttl)
+
+    def _pack(self, value: Any) -> Any:
+        if self.compress_min_size is None:
+            return value
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(data) < self.compress_min_size:
+            return value
+        return CompressedValue(zlib.compress(data))
+
+    @staticmethod
+    def _unpack(value: Any) -> Any:
+        if isinstance(value, CompressedValue):
+            return pickle.loads(zlib.decompress(value.data))
+        return value
+
+    def get(self, key: str) -> Any:
+        full_key = self._key(key)
+        value = self.local.get(full_key)
+        if value is not None:
+            return value
+        try:
+            value = self.backend.get(full_key)
+        except Exception:
+            self._count("errors")
+            return None
+        if value is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        value = self._unpack(value)
+        self.local.set(full_key, value)
+        return value
+
+    def get_many(self, *keys: str) -> List[Any]:
+        full_keys = [self._key(key) for key in keys]
+        values = [self.local.get(full_key) for full_key in full_keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+        try:
+            remote = self.backend.get_many(*(full_keys[i] for i in missing))
+        except Exception:
+            self._count("errors", len(missing))
+            return values
+        hits = 0
+        for i, value in zip(missing, remote):
+            if value is not None:
+                values[i] = value = self._unpack(value)
+                self.local.set(full_keys[i], value)
+                hits += 1
+        self._count("hits", hits)
+        self._count("misses", len(missing) - hits)
+        return values
+
+    def set(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        full_key = self._key(key)
+        self.local.set(full_key, value, ttl=self._local_ttl(timeout))
+        try:
+            self.backend.set(full_key, self._pack(value), timeout=timeout)
+        except Exception:
+            self._count("errors")
+
+    def set_many(self, mapping: Mapping[str, Any], timeout: Optional[float] = None) -> None:
+        full = {self._key(key): value for key, value in mapping.items()}
+        ttl = self._local_ttl(timeout)
+        for full_key, value in full.items():
+            self.local.set(full_key, value, ttl=ttl)
+        try:
+            self.backend.set_many({full_key: self._pack(value) for full_key, value in full.items()}, timeout=timeout)
+        except Exception:
+            self._count("errors")
+
+    def add(self, key: str, value: Any, timeout: Optional[float] = None) -> bool:
+        """Store value in L2 only if key is absent there (SET NX on Redis); True if it was stored.
+
+        For markers shared between processes, so L1 is not involved. With L2
+        unreachable it returns True: callers go ahead uncoordinated.
+        """
+        try:
+            return bool(self.backend.add(self._key(key), value, timeout=timeout))
+        except Exception:
+            self._count("errors")
+            return True
+
+    def delete(self, key: str) -> None:
+        full_key = self._key(key)
+        self.local.delete(full_key)
+        try:
+            self.backend.delete(full_key)
+        except Exception:
+            self._count("errors")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            l2 = dict(self._l2)
+        return {"namespace": self._namespace, "l1": self.local.stats(), "l2": l2}